@@ -6,8 +6,8 @@ from sqlalchemy import pool
 from alembic import context
 
 # Import your Base from your SQLAlchemy models
-from api.app.models.__init__ import Base
-from api.app.core.config import settings
+from app.models import Base
+from app.core.config import settings
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,61 @@
+"""Add numeric goal target/current amounts
+
+Revision ID: 34996a04ff7a
+Revises: f00aca785241
+Create Date: 2026-10-18 13:05:12.418305
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '34996a04ff7a'
+down_revision: Union[str, None] = 'f00aca785241'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Rows converted per batch, as in 919d55e592f0
+BATCH_SIZE = 5000
+
+_AMOUNT = re.compile(r"([-+]?\d[\d,]*(?:\.\d+)?)\s*(k|thousand|m|mn|million|b|bn|billion)?\b", re.IGNORECASE)
+_SCALES = {"k": 1e3, "thousand": 1e3, "m": 1e6, "mn": 1e6, "million": 1e6, "b": 1e9, "bn": 1e9, "billion": 1e9}
+
+
+def _amount(value):
+    # Mirrors app.crud.goal.parse_amount at the time of this migration
+    if value is None:
+        return None
+    match = _AMOUNT.search(str(value))
+    if match is None:
+        return None
+    number, scale = match.groups()
+    return float(number.replace(",", "")) * (_SCALES[scale.lower()] if scale else 1)
+
+
+def upgrade() -> None:
+    op.add_column('goals', sa.Column('target_amount', sa.Float(), nullable=True))
+    op.add_column('goals', sa.Column('current_amount', sa.Float(), nullable=True))
+
+    bind = op.get_bind()
+    select = sa.text("SELECT id, target, current FROM goals WHERE id > :last_id ORDER BY id LIMIT :batch")
+    update = sa.text("UPDATE goals SET target_amount = :target, current_amount = :current WHERE id = :id")
+    last_id = 0
+    while True:
+        rows = bind.execute(select, {"last_id": last_id, "batch": BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        bind.execute(update, [
+            {"id": goal_id, "target": _amount(target), "current": _amount(current)}
+            for goal_id, target, current in rows
+        ])
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    op.drop_column('goals', 'current_amount')
+    op.drop_column('goals', 'target_amount')
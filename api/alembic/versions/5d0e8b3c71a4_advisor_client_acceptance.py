@@ -0,0 +1,28 @@
+"""Require clients to accept advisor links
+
+Revision ID: 5d0e8b3c71a4
+Revises: 34996a04ff7a
+Create Date: 2026-10-18 15:02:37.114820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d0e8b3c71a4'
+down_revision: Union[str, None] = '34996a04ff7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing links were made without the client's consent, so they start
+    # out as pending invitations.
+    op.add_column('advisor_clients', sa.Column('accepted_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('advisor_clients', 'accepted_at')
@@ -0,0 +1,45 @@
+"""Add daily net worth snapshots and index accounts by user
+
+Revision ID: 847223e60afd
+Revises: b202630fa15e
+Create Date: 2026-10-18 11:40:05.318272
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '847223e60afd'
+down_revision: Union[str, None] = 'b202630fa15e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'net_worth_snapshots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('as_of', sa.Date(), nullable=False),
+        sa.Column('total_assets', sa.Float(), nullable=False),
+        sa.Column('total_liabilities', sa.Float(), nullable=False),
+        sa.Column('net_worth', sa.Float(), nullable=False),
+        sa.Column('breakdown', sa.JSON(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'as_of', name='uq_net_worth_snapshots_user_as_of'),
+    )
+    op.create_index(op.f('ix_net_worth_snapshots_id'), 'net_worth_snapshots', ['id'], unique=False)
+    op.create_index(op.f('ix_accounts_user_id'), 'accounts', ['user_id'], unique=False)
+    # No backfill: a user's first balance-sheet read or account write creates
+    # their snapshot (app.crud.balance_sheet).
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_accounts_user_id'), table_name='accounts')
+    op.drop_index(op.f('ix_net_worth_snapshots_id'), table_name='net_worth_snapshots')
+    op.drop_table('net_worth_snapshots')
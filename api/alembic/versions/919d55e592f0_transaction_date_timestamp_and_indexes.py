@@ -0,0 +1,81 @@
+"""Store transaction dates as timestamps and index per-user date ranges
+
+Revision ID: 919d55e592f0
+Revises: 315225642fc4
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from datetime import datetime, timezone
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '919d55e592f0'
+down_revision: Union[str, None] = '315225642fc4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows converted per batch; bounds memory and keeps each statement short.
+BATCH_SIZE = 5000
+
+
+def _parse(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    # Offset-aware strings are normalised to naive UTC, like the app stores
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _backfill(bind, source: str, target: str, convert) -> None:
+    """Copy ``source`` into ``target`` for every row, BATCH_SIZE rows at a time."""
+    select = sa.text(
+        f"SELECT id, {source} FROM transactions WHERE id > :last_id ORDER BY id LIMIT :batch"
+    )
+    update = sa.text(f"UPDATE transactions SET {target} = :value WHERE id = :id")
+    last_id = 0
+    while True:
+        rows = bind.execute(select, {"last_id": last_id, "batch": BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        bind.execute(update, [{"id": row[0], "value": convert(row[1])} for row in rows])
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    op.add_column('transactions', sa.Column('date_ts', sa.DateTime(), nullable=True))
+    _backfill(op.get_bind(), 'date', 'date_ts', _parse)
+
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.drop_column('date')
+        batch_op.alter_column('date_ts', new_column_name='date')
+
+    op.create_index(
+        'ix_transactions_user_id_date', 'transactions', ['user_id', 'date'],
+        postgresql_include=['amount'],
+    )
+    op.create_index(
+        'ix_transactions_user_id_category_date', 'transactions', ['user_id', 'category', 'date'],
+    )
+    op.create_index(op.f('ix_transactions_account_id'), 'transactions', ['account_id'])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_transactions_account_id'), table_name='transactions')
+    op.drop_index('ix_transactions_user_id_category_date', table_name='transactions')
+    op.drop_index('ix_transactions_user_id_date', table_name='transactions')
+
+    op.add_column('transactions', sa.Column('date_str', sa.String(), nullable=True))
+    _backfill(op.get_bind(), 'date', 'date_str', lambda value: str(value) if value else None)
+
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.drop_column('date')
+        batch_op.alter_column('date_str', new_column_name='date')
@@ -0,0 +1,57 @@
+"""Add monthly per-category spending rollup
+
+Revision ID: b202630fa15e
+Revises: 919d55e592f0
+Create Date: 2026-10-18 10:02:17.554019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b202630fa15e'
+down_revision: Union[str, None] = '919d55e592f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.crud.category_spending.UNCATEGORIZED
+UNCATEGORIZED = 'uncategorized'
+
+
+def upgrade() -> None:
+    op.create_table(
+        'category_spending',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('total', sa.Float(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'month', 'category', name='uq_category_spending_user_month_category'),
+    )
+    op.create_index(op.f('ix_category_spending_id'), 'category_spending', ['id'], unique=False)
+
+    # Seed the rollup from existing history in one set-based statement
+    if op.get_bind().dialect.name == 'postgresql':
+        month = "CAST(date_trunc('month', date) AS DATE)"
+    else:
+        month = "date(date, 'start of month')"
+    op.execute(
+        f"""
+        INSERT INTO category_spending (user_id, month, category, total, count)
+        SELECT user_id, {month}, COALESCE(category, '{UNCATEGORIZED}'), SUM(COALESCE(amount, 0)), COUNT(*)
+        FROM transactions
+        WHERE date IS NOT NULL AND user_id IS NOT NULL
+        GROUP BY user_id, {month}, COALESCE(category, '{UNCATEGORIZED}')
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_category_spending_id'), table_name='category_spending')
+    op.drop_table('category_spending')
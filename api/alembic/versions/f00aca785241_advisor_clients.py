@@ -0,0 +1,44 @@
+"""Add advisor-client links and per-user indexes for book-of-business reads
+
+Revision ID: f00aca785241
+Revises: 847223e60afd
+Create Date: 2026-10-18 12:21:47.902614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f00aca785241'
+down_revision: Union[str, None] = '847223e60afd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'advisor_clients',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('advisor_id', sa.Integer(), nullable=False),
+        sa.Column('client_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['advisor_id'], ['users.id'], ),
+        sa.ForeignKeyConstraint(['client_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('advisor_id', 'client_id', name='uq_advisor_clients_advisor_client'),
+    )
+    op.create_index(op.f('ix_advisor_clients_id'), 'advisor_clients', ['id'], unique=False)
+    op.create_index(op.f('ix_advisor_clients_client_id'), 'advisor_clients', ['client_id'], unique=False)
+    # Client summaries batch-load goals by user_id (profiles.user_id is
+    # indexed since 315225642fc4)
+    op.create_index(op.f('ix_goals_user_id'), 'goals', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_goals_user_id'), table_name='goals')
+    op.drop_index(op.f('ix_advisor_clients_client_id'), table_name='advisor_clients')
+    op.drop_index(op.f('ix_advisor_clients_id'), table_name='advisor_clients')
+    op.drop_table('advisor_clients')
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import User
+from app.schemas import RoleUpdate
+from app.schemas.user import User as UserOut
+from app.security import get_current_user
+from app.crud import advisor as crud_advisor
+from app.core.exceptions import ForbiddenException
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def require_superuser(current_user: User = Depends(get_current_user)) -> User:
+    if not current_user.is_superuser:
+        raise ForbiddenException(detail="Administrator access required")
+    return current_user
+
+
+@router.put("/users/{user_id}/role", response_model=UserOut)
+def set_role(
+    user_id: int,
+    update: RoleUpdate,
+    db: Session = Depends(get_db),
+    _: User = Depends(require_superuser),
+):
+    """Grant or revoke the advisor role, e.g. after verifying a licence.
+
+    Revoking it drops the advisor's client links.
+    """
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    if user.role == "advisor" and update.role != "advisor":
+        crud_advisor.unlink_all(db, user.id)
+    user.role = update.role
+    db.commit()
+    db.refresh(user)
+    return user
@@ -0,0 +1,150 @@
+from typing import List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import User
+from app.schemas.advisor import AdvisorInvitation, ClientLink, ClientLinkRequest, ClientSummary
+from app.security import TokenClaims, get_current_user, get_token_claims
+from app.crud import advisor as crud_advisor
+from app.core.exceptions import ForbiddenException
+from app.api.v1.endpoints.timeline_clean import (
+    TimelineProjection,
+    profile_version,
+    projection_cache,
+    projection_cache_key,
+)
+
+router = APIRouter(prefix="/advisor", tags=["advisor"])
+
+MAX_PAGE_SIZE = 500
+
+
+def require_advisor(current_user: User = Depends(get_current_user)) -> User:
+    # The stored role, not the token's claim, so revoking the role takes effect
+    if current_user.role != "advisor" or not current_user.is_active:
+        raise ForbiddenException(detail="Advisor access required")
+    return current_user
+
+
+def _persona_and_alignment(profile, onboarding) -> Tuple[str, float]:
+    """From the client's cached Timeline projection, else computed without Monte Carlo bands."""
+    cached = projection_cache.get(projection_cache_key(profile.user_id))
+    if cached is not None and cached["version"] == profile_version(profile, onboarding):
+        return cached["projection"]["persona"], cached["projection"]["alignment_score"]
+    projection = TimelineProjection(profile, onboarding)
+    return projection.persona, projection.alignment_score
+
+
+@router.get("/clients", response_model=List[ClientSummary])
+def list_clients(
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[int] = None,
+    db: Session = Depends(get_db),
+    advisor: User = Depends(require_advisor),
+):
+    """Summaries of the clients who accepted the advisor, ordered by client id.
+
+    Three queries per page whatever its size: clients with profile and
+    onboarding state, their newest net worth snapshots, and goal aggregates.
+    When more clients may follow, X-Next-Cursor holds the ``cursor`` for the
+    next page.
+    """
+    rows = crud_advisor.get_client_page(db, advisor.id, limit=limit, after=cursor)
+    ids = [user.id for user, _, _ in rows]
+    snapshots = crud_advisor.latest_snapshots(db, ids)
+    goals = crud_advisor.goal_stats(db, ids)
+
+    summaries = []
+    for user, profile, onboarding in rows:
+        summary = {
+            "client_id": user.id,
+            "email": user.email,
+            "onboarding_complete": bool(onboarding and onboarding.is_complete),
+        }
+        if profile is not None:
+            persona, alignment = _persona_and_alignment(profile, onboarding)
+            summary.update(
+                first_name=profile.first_name,
+                last_name=profile.last_name,
+                risk_score=profile.risk_score,
+                risk_level=profile.risk_level,
+                persona=persona,
+                alignment_score=alignment,
+            )
+        snapshot = snapshots.get(user.id)
+        if snapshot is not None:
+            summary.update(
+                net_worth=snapshot.net_worth,
+                total_assets=snapshot.total_assets,
+                total_liabilities=snapshot.total_liabilities,
+                net_worth_as_of=snapshot.as_of,
+            )
+        goal_count, goal_progress = goals.get(user.id, (0, None))
+        summary.update(goal_count=goal_count, goal_progress=goal_progress)
+        summaries.append(summary)
+
+    if len(rows) == limit:
+        response.headers["X-Next-Cursor"] = str(ids[-1])
+    return summaries
+
+
+@router.post("/clients", response_model=ClientLink, status_code=status.HTTP_201_CREATED)
+def add_client(
+    link: ClientLinkRequest,
+    db: Session = Depends(get_db),
+    advisor: User = Depends(require_advisor),
+):
+    """Invite a client; their data stays hidden until they accept."""
+    created = crud_advisor.link_client(db, advisor.id, link.client_email)
+    if created is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+    return {"client_id": created.client_id, "email": link.client_email, "accepted": created.accepted_at is not None}
+
+
+@router.delete("/clients/{client_id}", status_code=status.HTTP_204_NO_CONTENT)
+def remove_client(
+    client_id: int,
+    db: Session = Depends(get_db),
+    advisor: User = Depends(require_advisor),
+):
+    if not crud_advisor.unlink_client(db, advisor.id, client_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+
+
+@router.get("/invitations", response_model=List[AdvisorInvitation])
+def list_invitations(
+    db: Session = Depends(get_db),
+    claims: TokenClaims = Depends(get_token_claims),
+):
+    """Advisors waiting for the current user to accept them."""
+    return [
+        {"advisor_id": advisor.id, "email": advisor.email, "invited_at": link.created_at}
+        for link, advisor in crud_advisor.get_invitations(db, claims.user_id)
+    ]
+
+
+@router.post("/invitations/{advisor_id}/accept", response_model=ClientLink)
+def accept_invitation(
+    advisor_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Let the advisor see the current user's profile, balances and goals."""
+    link = crud_advisor.accept_invitation(db, current_user.id, advisor_id)
+    if link is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Invitation not found")
+    return {"client_id": current_user.id, "email": current_user.email, "accepted": True}
+
+
+@router.delete("/invitations/{advisor_id}", status_code=status.HTTP_204_NO_CONTENT)
+def decline_invitation(
+    advisor_id: int,
+    db: Session = Depends(get_db),
+    claims: TokenClaims = Depends(get_token_claims),
+):
+    """Decline a pending invitation or revoke an accepted advisor's access."""
+    if not crud_advisor.unlink_client(db, advisor_id, claims.user_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Invitation not found")
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from api.app.api.v1.endpoints import profile, onboarding_clean, profile_clean, timeline_clean
+from app.api.v1.endpoints import profile, onboarding_clean, profile_clean, timeline_clean
 
 api_router = APIRouter()
 api_router.include_router(profile.router, tags=["profile"])
@@ -6,19 +6,22 @@ from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
+import logging
 
-from api.app.database import get_db
-from api.app.models import User, OnboardingState, Profile
-from api.app.auth import get_current_user
-from api.app.utils.risk_calculation import calculate_risk_score, get_risk_level_string, get_risk_level_numeric
-from api.app.utils.onboarding_debug import OnboardingDebugger, log_onboarding_save_attempt
-from api.app.schemas.onboarding import (
+from app.database import get_db
+from app.models import User, OnboardingState, Profile
+from app.auth import get_current_user
+from app.utils.risk_calculation import calculate_risk_score, get_risk_level_string, get_risk_level_numeric
+from app.utils.onboarding_debug import OnboardingDebugger, log_onboarding_save_attempt
+from app.schemas.onboarding import (
     OnboardingStepRequest,
     OnboardingStateResponse,
     OnboardingCompleteRequest,
     OnboardingCompleteResponse
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/onboarding", tags=["onboarding"])
 
 
@@ -28,7 +31,7 @@ def debug_onboarding_state(
     db: Session = Depends(get_db)
 ):
     """Enhanced debug endpoint with comprehensive onboarding analysis AND EMERGENCY FIX"""
-    print("🔍 DEBUG ENDPOINT CALLED - NEW VERSION ACTIVE")
+    logger.debug("onboarding debug requested")
     
     # EMERGENCY FIX: Apply completed_steps fix directly in debug endpoint
     try:
@@ -53,17 +56,19 @@ def debug_onboarding_state(
             
             # Apply emergency fix using raw SQL
             if completed_steps != onboarding.completed_steps:
-                print(f"🚨 APPLYING EMERGENCY FIX: {onboarding.completed_steps} -> {completed_steps}")
                 raw_sql = text("UPDATE onboarding_states SET completed_steps = :completed_steps WHERE user_id = :user_id")
                 db.execute(raw_sql, {
                     "completed_steps": json.dumps(completed_steps),
                     "user_id": current_user.id
                 })
                 db.commit()
-                print(f"🛠️ EMERGENCY FIX APPLIED: completed_steps updated to {completed_steps}")
+                logger.info(
+                    "onboarding completed_steps repaired",
+                    extra={"user_id": current_user.id, "before": onboarding.completed_steps, "after": completed_steps},
+                )
     
     except Exception as fix_error:
-        print(f"❌ EMERGENCY FIX FAILED: {fix_error}")
+        logger.exception("onboarding completed_steps repair failed", extra={"user_id": current_user.id})
     
     debugger = OnboardingDebugger(db)
     return debugger.get_detailed_state(current_user.id)
@@ -71,7 +76,7 @@ def debug_onboarding_state(
 @router.get("/test-nuclear")
 def test_nuclear_version():
     """Test endpoint to verify nuclear version is active"""
-    print("🚨 NUCLEAR VERSION TEST ENDPOINT CALLED 🚨")
+    logger.debug("onboarding test endpoint called")
     return {"message": "NUCLEAR VERSION ACTIVE", "version": "nuclear-v1.0"}
 
 @router.post("/emergency-fix-completed-steps")
@@ -80,7 +85,7 @@ def emergency_fix_completed_steps(
     db: Session = Depends(get_db)
 ):
     """Emergency endpoint to fix completed_steps array using direct SQL"""
-    print("🚨 EMERGENCY FIX CALLED 🚨")
+    logger.debug("onboarding completed_steps repair requested")
     
     from sqlalchemy import text
     import json
@@ -114,7 +119,10 @@ def emergency_fix_completed_steps(
         })
         db.commit()
         
-        print(f"🛠️ EMERGENCY FIX: Updated completed_steps to {completed_steps} for user {current_user.id}")
+        logger.info(
+            "onboarding completed_steps repaired",
+            extra={"user_id": current_user.id, "before": onboarding.completed_steps, "after": completed_steps},
+        )
         
         return {
             "success": True,
@@ -132,7 +140,7 @@ def emergency_fix_completed_steps(
         
     except Exception as e:
         db.rollback()
-        print(f"❌ EMERGENCY FIX FAILED: {str(e)}")
+        logger.exception("onboarding completed_steps repair failed", extra={"user_id": current_user.id})
         return {"error": f"Emergency fix failed: {str(e)}"}
 
 
@@ -216,11 +224,6 @@ def save_onboarding_step(
     db: Session = Depends(get_db)
 ):
     """Save data for a specific onboarding step with auto-save functionality - NUCLEAR VERSION ACTIVE"""
-    print("🚨🚨🚨 NUCLEAR VERSION RUNNING - SAVE STEP CALLED 🚨🚨🚨")
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.critical("🚨🚨🚨 NUCLEAR VERSION RUNNING - SAVE STEP CALLED 🚨🚨🚨")
-    
     # Get or create onboarding state
     onboarding = db.query(OnboardingState).filter_by(user_id=current_user.id).first()
     if not onboarding:
@@ -289,24 +292,9 @@ def save_onboarding_step(
         completed_steps_before = []
     
     current_completed = list(completed_steps_before)  # Force new list creation
-        
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    print(f"🔧 Before update - Step {request.step_number}")
-    logger.info(f"🔧 Before update - Step {request.step_number}")
-    print(f"   Current completed_steps: {current_completed}")
-    logger.info(f"   Current completed_steps: {current_completed}")
-    print(f"   Adding step {request.step_number}? {request.step_number not in current_completed}")
-    logger.info(f"   Adding step {request.step_number}? {request.step_number not in current_completed}")
     
     if request.step_number not in current_completed:
         current_completed.append(request.step_number)
-        print(f"🔧 Added step {request.step_number}, new completed_steps: {current_completed}")
-        logger.info(f"🔧 Added step {request.step_number}, new completed_steps: {current_completed}")
-    else:
-        print(f"🔧 Step {request.step_number} already in completed_steps")
-        logger.info(f"🔧 Step {request.step_number} already in completed_steps")
     
     # ULTIMATE FIX: Update database directly with raw SQL to bypass SQLAlchemy issues
     from sqlalchemy import text
@@ -323,11 +311,8 @@ def save_onboarding_step(
             "completed_steps": json.dumps(current_completed),
             "user_id": current_user.id
         })
-        print(f"🛠️ RAW SQL UPDATE executed for user {current_user.id}, steps: {current_completed}")
-        logger.info(f"🛠️ RAW SQL UPDATE executed for user {current_user.id}, steps: {current_completed}")
-    except Exception as sql_error:
-        print(f"❌ RAW SQL UPDATE failed: {sql_error}")
-        logger.error(f"❌ RAW SQL UPDATE failed: {sql_error}")
+    except Exception:
+        logger.exception("onboarding completed_steps update failed", extra={"user_id": current_user.id})
     
     # Update timestamp
     onboarding.updated_at = datetime.utcnow()
@@ -343,16 +328,6 @@ def save_onboarding_step(
         db.commit()
         db.refresh(onboarding)
         
-        # Verify the data was actually saved
-        print(f"🔍 After commit verification:")
-        logger.info(f"🔍 After commit verification:")
-        print(f"   Database completed_steps: {onboarding.completed_steps}")
-        logger.info(f"   Database completed_steps: {onboarding.completed_steps}")
-        print(f"   Database current_step: {onboarding.current_step}")
-        logger.info(f"   Database current_step: {onboarding.current_step}")
-        print(f"   Database is_complete: {onboarding.is_complete}")
-        logger.info(f"   Database is_complete: {onboarding.is_complete}")
-        
         # Log the save attempt for debugging
         log_onboarding_save_attempt(
             user_id=current_user.id,
@@ -373,8 +348,6 @@ def save_onboarding_step(
         
     except Exception as e:
         db.rollback()
-        print(f"❌ Database save failed for step {request.step_number}: {str(e)}")
-        
         # Log the failed save attempt
         log_onboarding_save_attempt(
             user_id=current_user.id,
@@ -413,15 +386,10 @@ def complete_onboarding(
     completed_steps = onboarding.completed_steps or []
     missing_steps = [step for step in required_steps if step not in completed_steps]
     
-    # Debug logging
-    print(f"🔍 Completion check for user {current_user.id}:")
-    print(f"   Required steps: {required_steps}")
-    print(f"   Completed steps: {completed_steps}")
-    print(f"   Missing steps: {missing_steps}")
-    print(f"   Onboarding data check:")
-    print(f"     - Personal data: {'✅' if onboarding.personal_data else '❌'}")
-    print(f"     - Risk data: {'✅' if onboarding.risk_data else '❌'}")
-    print(f"     - Financial data: {'✅' if onboarding.financial_data else '❌'}")
+    logger.info(
+        "onboarding completion check",
+        extra={"user_id": current_user.id, "completed_steps": completed_steps, "missing_steps": missing_steps},
+    )
     
     if missing_steps:
         raise HTTPException(
@@ -500,7 +468,7 @@ def complete_onboarding(
 
 def create_expense_categories_from_data(db: Session, user_id: int, financial_data: Dict[str, Any]):
     """Create expense categories from onboarding financial data"""
-    from api.app.models import ExpenseCategory
+    from app.models import ExpenseCategory
     
     expense_mapping = {
         'rent': 'Rent/Mortgage',
@@ -10,9 +10,11 @@ import json
 import logging
 
 # Import with absolute paths to avoid conflicts
-from api.app.database import get_db
-from api.app.models import User, OnboardingState, Profile
-from api.app.auth import get_current_user
+from app.database import get_db
+from app.models import User, OnboardingState, Profile
+from app.auth import get_current_user
+from app.crud import onboarding as crud_onboarding
+from app.core.autosave import autosave
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -28,13 +30,16 @@ def get_onboarding_status(
     """Get simple onboarding completion status"""
     onboarding = db.query(OnboardingState).filter_by(user_id=current_user.id).first()
     
+    # Include autosaves that are still buffered
     if not onboarding:
-        return {"is_complete": False, "current_step": 1}
+        state = autosave.overlay(current_user.id, {"is_complete": False, "current_step": 1})
+        return {key: state[key] for key in ("is_complete", "current_step", "completed_steps") if key in state}
     
+    state = autosave.overlay(current_user.id, _state_values(onboarding))
     return {
-        "is_complete": onboarding.is_complete,
-        "current_step": onboarding.current_step,
-        "completed_steps": onboarding.completed_steps
+        "is_complete": state["is_complete"],
+        "current_step": state["current_step"],
+        "completed_steps": state["completed_steps"]
     }
 
 
@@ -58,6 +63,23 @@ def get_onboarding_state(
         db.commit()
         db.refresh(onboarding)
     
+    # Include autosaves that are still buffered
+    return autosave.overlay(current_user.id, _state_values(onboarding))
+
+
+def _flush_autosaves(user_id: int) -> None:
+    """Write the user's buffered saves; they stay queued for retry if that fails."""
+    try:
+        autosave.flush_user(user_id)
+    except Exception:
+        # Already logged by the buffer
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not save your onboarding progress; please try again"
+        )
+
+
+def _state_values(onboarding: OnboardingState) -> Dict[str, Any]:
     return {
         "current_step": onboarding.current_step,
         "completed_steps": onboarding.completed_steps,
@@ -78,8 +100,8 @@ def debug_onboarding_state(
     db: Session = Depends(get_db)
 ):
     """Debug endpoint with automatic completed_steps fix"""
-    print("🚀 CLEAN DEBUG ENDPOINT CALLED")
-    logger.info("🚀 CLEAN DEBUG ENDPOINT CALLED")
+    logger.debug("onboarding debug requested")
+    _flush_autosaves(current_user.id)
     
     # Get onboarding state
     onboarding = db.query(OnboardingState).filter_by(user_id=current_user.id).first()
@@ -102,8 +124,7 @@ def debug_onboarding_state(
         
         # Apply fix if needed
         if completed_steps != onboarding.completed_steps:
-            print(f"🔧 AUTO-FIXING completed_steps: {onboarding.completed_steps} -> {completed_steps}")
-            logger.info(f"🔧 AUTO-FIXING completed_steps: {onboarding.completed_steps} -> {completed_steps}")
+            logger.info("onboarding completed_steps auto-fix", extra={"stored": onboarding.completed_steps, "computed": completed_steps})
             
             # Direct SQL update to bypass SQLAlchemy JSON issues
             raw_sql = text("UPDATE onboarding_states SET completed_steps = :completed_steps WHERE user_id = :user_id")
@@ -115,12 +136,10 @@ def debug_onboarding_state(
             
             # Refresh the object
             db.refresh(onboarding)
-            print(f"✅ AUTO-FIX APPLIED: completed_steps now {onboarding.completed_steps}")
-            logger.info(f"✅ AUTO-FIX APPLIED: completed_steps now {onboarding.completed_steps}")
+            logger.info("onboarding completed_steps auto-fix applied", extra={"completed_steps": onboarding.completed_steps})
     
     except Exception as fix_error:
-        print(f"❌ AUTO-FIX FAILED: {fix_error}")
-        logger.error(f"❌ AUTO-FIX FAILED: {fix_error}")
+        logger.exception("onboarding completed_steps auto-fix failed")
     
     return {
         "user_id": current_user.id,
@@ -143,98 +162,69 @@ def save_onboarding_step(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Clean save step implementation with guaranteed completed_steps persistence"""
-    print("🚀 CLEAN SAVE-STEP ENDPOINT CALLED")
-    logger.info("🚀 CLEAN SAVE-STEP ENDPOINT CALLED")
-    
+    """Save a step's data; pass "patch": true to merge fields into the stored step"""
     step_number = request.get("step_number")
-    step_data = request.get("step_data")
-    
-    print(f"📝 Saving step {step_number} for user {current_user.id}")
-    logger.info(f"📝 Saving step {step_number} for user {current_user.id}")
+    return _save_step(db, current_user.id, step_number, request.get("step_data"), bool(request.get("patch")))
+
+
+@router.patch("/steps/{step_number}")
+def patch_onboarding_step(
+    step_number: int,
+    fields: Dict[str, Any],
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Autosave individual fields of a step: set each given field, null removes it"""
+    return _save_step(db, current_user.id, step_number, fields, patch=True)
+
+
+def _save_step(db: Session, user_id: int, step_number, step_data, patch: bool):
+    logger.debug("onboarding save step requested", extra={"step": step_number, "user_id": user_id, "patch": patch})
     
-    if not step_number or step_number < 1 or step_number > 5:
+    if not isinstance(step_number, int) or step_number < 1 or step_number > 5:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid step number. Must be between 1 and 5."
         )
-    
-    # Get or create onboarding state
-    onboarding = db.query(OnboardingState).filter_by(user_id=current_user.id).first()
-    if not onboarding:
-        onboarding = OnboardingState(
-            user_id=current_user.id,
-            current_step=1,
-            completed_steps=[],
-            is_complete=False
+    if patch and not isinstance(step_data, dict):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Patch step_data must be an object of fields."
         )
-        db.add(onboarding)
-        db.flush()  # Get the ID
-    
-    # Save step data
-    if step_number == 1:
-        onboarding.personal_data = step_data
-    elif step_number == 2:
-        onboarding.risk_data = step_data
-    elif step_number == 3:
-        onboarding.financial_data = step_data
-    elif step_number == 4:
-        onboarding.goals_data = step_data
-    elif step_number == 5:
-        onboarding.preferences_data = step_data
     
-    # Update current step
-    onboarding.current_step = max(onboarding.current_step, step_number)
-    onboarding.updated_at = datetime.utcnow()
-    
-    # Calculate completed steps based on data presence
-    completed_steps = [1]  # Step 1 always completed
-    if onboarding.risk_data:
-        completed_steps.append(2)
-    if onboarding.financial_data:
-        completed_steps.append(3)
-    if onboarding.goals_data:
-        completed_steps.append(4)
-    if onboarding.preferences_data:
-        completed_steps.append(5)
-    
-    completed_steps = sorted(list(set(completed_steps)))
-    
-    print(f"🔧 Calculated completed_steps: {completed_steps}")
-    logger.info(f"🔧 Calculated completed_steps: {completed_steps}")
-    
-    try:
-        # NUCLEAR FIX: Direct SQL update to guarantee persistence
-        raw_sql = text("UPDATE onboarding_states SET completed_steps = :completed_steps, current_step = :current_step WHERE user_id = :user_id")
-        db.execute(raw_sql, {
-            "completed_steps": json.dumps(completed_steps),
-            "current_step": onboarding.current_step,
-            "user_id": current_user.id
-        })
-        
-        # Commit all changes
-        db.commit()
-        db.refresh(onboarding)
-        
-        print(f"✅ SAVE SUCCESS: Step {step_number} saved, completed_steps: {onboarding.completed_steps}")
-        logger.info(f"✅ SAVE SUCCESS: Step {step_number} saved, completed_steps: {onboarding.completed_steps}")
-        
+    if autosave.enabled:
+        # Coalesced with other saves of this step and written shortly; reads overlay it
+        autosave.submit(user_id, step_number, step_data, patch=patch)
+        onboarding = db.query(OnboardingState).filter_by(user_id=user_id).first()
+        state = {"current_step": 1, "is_complete": False} if onboarding is None else _state_values(onboarding)
+        state = autosave.overlay(user_id, state)
         return {
             "success": True,
             "message": f"Step {step_number} saved successfully",
-            "current_step": onboarding.current_step,
-            "completed_steps": onboarding.completed_steps,
-            "is_complete": onboarding.is_complete
+            "current_step": state["current_step"],
+            "completed_steps": state["completed_steps"],
+            "is_complete": state["is_complete"],
         }
-        
+    
+    try:
+        # One upsert writes the payload and the derived completed_steps/current_step
+        progress = crud_onboarding.save_step(db, user_id, step_number, step_data, patch=patch)
+        db.commit()
     except Exception as e:
         db.rollback()
-        print(f"❌ SAVE FAILED: {str(e)}")
-        logger.error(f"❌ SAVE FAILED: {str(e)}")
+        logger.exception("onboarding step save failed", extra={"step": step_number})
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save onboarding data: {str(e)}"
         )
+    
+    logger.info("onboarding step saved", extra={"step": step_number, "completed_steps": progress["completed_steps"]})
+    
+    return {
+        "success": True,
+        "message": f"Step {step_number} saved successfully",
+        **progress,
+    }
 
 
 @router.post("/complete")
@@ -244,8 +234,7 @@ def complete_onboarding(
     db: Session = Depends(get_db)
 ):
     """Clean onboarding completion with proper validation"""
-    print("🚀 CLEAN COMPLETE ENDPOINT CALLED")
-    logger.info("🚀 CLEAN COMPLETE ENDPOINT CALLED")
+    _flush_autosaves(current_user.id)
     
     # Get onboarding state
     onboarding = db.query(OnboardingState).filter_by(user_id=current_user.id).first()
@@ -260,11 +249,10 @@ def complete_onboarding(
     completed_steps = onboarding.completed_steps or []
     missing_steps = [step for step in required_steps if step not in completed_steps]
     
-    print(f"🔍 Completion check for user {current_user.id}:")
-    print(f"   Required steps: {required_steps}")
-    print(f"   Completed steps: {completed_steps}")
-    print(f"   Missing steps: {missing_steps}")
-    logger.info(f"🔍 Completion check - Required: {required_steps}, Completed: {completed_steps}, Missing: {missing_steps}")
+    logger.info(
+        "onboarding completion check",
+        extra={"user_id": current_user.id, "completed_steps": completed_steps, "missing_steps": missing_steps},
+    )
     
     if missing_steps:
         raise HTTPException(
@@ -292,8 +280,7 @@ def complete_onboarding(
         db.commit()
         db.refresh(profile)
         
-        print(f"✅ COMPLETION SUCCESS for user {current_user.id}")
-        logger.info(f"✅ COMPLETION SUCCESS for user {current_user.id}")
+        logger.info("onboarding completed", extra={"user_id": current_user.id})
         
         return {
             "success": True,
@@ -305,8 +292,7 @@ def complete_onboarding(
         
     except Exception as e:
         db.rollback()
-        print(f"❌ COMPLETION FAILED: {str(e)}")
-        logger.error(f"❌ COMPLETION FAILED: {str(e)}")
+        logger.exception("onboarding completion failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to complete onboarding: {str(e)}"
@@ -316,8 +302,7 @@ def complete_onboarding(
 @router.get("/test")
 def test_clean_endpoints():
     """Test endpoint to verify clean implementation is active"""
-    print("🧪 CLEAN TEST ENDPOINT CALLED")
-    logger.info("🧪 CLEAN TEST ENDPOINT CALLED")
+    logger.debug("onboarding test endpoint called")
     return {
         "message": "CLEAN ONBOARDING ENDPOINTS ACTIVE",
         "version": "clean-v1.0",
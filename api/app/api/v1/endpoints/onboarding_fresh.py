@@ -6,9 +6,9 @@ from sqlalchemy.orm import Session
 from typing import Dict, Any
 from datetime import datetime
 
-from api.app.database import get_db
-from api.app.models import User, OnboardingState
-from api.app.auth import get_current_user
+from app.database import get_db
+from app.models import User, OnboardingState
+from app.auth import get_current_user
 
 router = APIRouter(prefix="/onboarding", tags=["onboarding"])
 
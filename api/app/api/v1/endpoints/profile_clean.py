@@ -9,9 +9,10 @@ from datetime import datetime, date
 import logging
 
 # Import with absolute paths to avoid conflicts
-from api.app.database import get_db
-from api.app.models import User, Profile, OnboardingState
-from api.app.auth import get_current_user
+from app.database import get_db
+from app.models import Profile, OnboardingState
+from app.core.cache import invalidate_projection
+from app.core.user_context import UserContext, get_user_context
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -45,24 +46,19 @@ def detect_persona(profile: Profile) -> str:
 
 @router.get("/timeline-data")
 def get_profile_for_timeline(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    context: UserContext = Depends(get_user_context),
 ):
     """Get profile data formatted for Timeline visualization"""
-    print("🚀 CLEAN PROFILE: Timeline data requested")
-    logger.info("🚀 CLEAN PROFILE: Timeline data requested")
+    logger.debug("profile timeline requested")
     
-    # Get profile data
-    profile = db.query(Profile).filter_by(user_id=current_user.id).first()
+    # Profile and onboarding data arrive with the user in one query
+    current_user, profile, onboarding = context.user, context.profile, context.onboarding
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found"
         )
     
-    # Get onboarding data for additional context
-    onboarding = db.query(OnboardingState).filter_by(user_id=current_user.id).first()
-    
     # Calculate persona and age
     persona = detect_persona(profile)
     age = calculate_age(profile.date_of_birth) if profile.date_of_birth else None
@@ -95,22 +91,19 @@ def get_profile_for_timeline(
         }
     }
     
-    print(f"✅ CLEAN PROFILE: Timeline data returned for {persona} persona")
-    logger.info(f"✅ CLEAN PROFILE: Timeline data returned for {persona} persona")
+    logger.info("profile timeline returned", extra={"persona": persona})
     
     return timeline_data
 
 
 @router.get("/persona-insights")
 def get_persona_specific_insights(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    context: UserContext = Depends(get_user_context),
 ):
     """Get persona-specific insights and recommendations"""
-    print("🚀 CLEAN PROFILE: Persona insights requested")
-    logger.info("🚀 CLEAN PROFILE: Persona insights requested")
+    logger.debug("profile persona insights requested")
     
-    profile = db.query(Profile).filter_by(user_id=current_user.id).first()
+    profile = context.profile
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -128,8 +121,7 @@ def get_persona_specific_insights(
         "timeline_focus": get_timeline_focus(persona)
     }
     
-    print(f"✅ CLEAN PROFILE: Persona insights returned for {persona}")
-    logger.info(f"✅ CLEAN PROFILE: Persona insights returned for {persona}")
+    logger.info("profile persona insights returned", extra={"persona": persona})
     
     return insights
 
@@ -137,14 +129,13 @@ def get_persona_specific_insights(
 @router.put("/timeline-impact")
 def update_profile_with_timeline_impact(
     update_data: dict,
-    current_user: User = Depends(get_current_user),
+    context: UserContext = Depends(get_user_context),
     db: Session = Depends(get_db)
 ):
     """Update profile and calculate Timeline impact"""
-    print("🚀 CLEAN PROFILE: Timeline impact update requested")
-    logger.info("🚀 CLEAN PROFILE: Timeline impact update requested")
+    logger.debug("profile timeline impact update requested")
     
-    profile = db.query(Profile).filter_by(user_id=current_user.id).first()
+    profile = context.profile
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -174,9 +165,9 @@ def update_profile_with_timeline_impact(
         
         db.commit()
         db.refresh(profile)
+        invalidate_projection(profile.user_id)
         
-        print(f"✅ CLEAN PROFILE: Profile updated with impact analysis")
-        logger.info(f"✅ CLEAN PROFILE: Profile updated with impact analysis")
+        logger.info("profile updated with impact analysis")
         
         return {
             "success": True,
@@ -191,8 +182,7 @@ def update_profile_with_timeline_impact(
         
     except Exception as e:
         db.rollback()
-        print(f"❌ CLEAN PROFILE: Update failed - {str(e)}")
-        logger.error(f"❌ CLEAN PROFILE: Update failed - {str(e)}")
+        logger.exception("profile update failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update profile: {str(e)}"
@@ -201,15 +191,12 @@ def update_profile_with_timeline_impact(
 
 @router.get("/dashboard-summary")
 def get_profile_dashboard_summary(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    context: UserContext = Depends(get_user_context),
 ):
     """Get profile summary for dashboard display"""
-    print("🚀 CLEAN PROFILE: Dashboard summary requested")
-    logger.info("🚀 CLEAN PROFILE: Dashboard summary requested")
+    logger.debug("profile dashboard summary requested")
     
-    profile = db.query(Profile).filter_by(user_id=current_user.id).first()
-    onboarding = db.query(OnboardingState).filter_by(user_id=current_user.id).first()
+    profile, onboarding = context.profile, context.onboarding
     
     if not profile:
         return {
@@ -241,8 +228,7 @@ def get_profile_dashboard_summary(
         "persona_welcome": get_persona_welcome(persona, profile.first_name)
     }
     
-    print(f"✅ CLEAN PROFILE: Dashboard summary returned for {persona}")
-    logger.info(f"✅ CLEAN PROFILE: Dashboard summary returned for {persona}")
+    logger.info("profile dashboard summary returned", extra={"persona": persona})
     
     return summary
 
@@ -250,8 +236,7 @@ def get_profile_dashboard_summary(
 @router.get("/test")
 def test_clean_profile():
     """Test endpoint to verify clean profile implementation"""
-    print("🧪 CLEAN PROFILE TEST ENDPOINT CALLED")
-    logger.info("🧪 CLEAN PROFILE TEST ENDPOINT CALLED")
+    logger.debug("profile test endpoint called")
     return {
         "message": "CLEAN PROFILE ENDPOINTS ACTIVE",
         "version": "profile-clean-v1.0",
@@ -2,23 +2,57 @@
 CLEAN TIMELINE ENDPOINTS - Timeline-first dashboard system
 Following the proven clean architecture pattern
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional
 from datetime import datetime, date
+from types import SimpleNamespace
+import hashlib
+import math
 import logging
 import json
 
+import numpy as np
+
 # Import with absolute paths to avoid conflicts
-from api.app.database import get_db
-from api.app.models import User, Profile, OnboardingState
-from api.app.auth import get_current_user
+from app.database import get_db
+from app.models import Profile, OnboardingState
+from app.core.cache import invalidate_projection, projection_cache, projection_cache_key
+from app.core.user_context import UserContext, get_user_context, get_user_context_async
+from app.crud import projection as crud_projection
+from app.schemas.projection import ProfileDelta, WhatIf
+from compute.goals import evaluate_goals
+from compute.monte_carlo import DEFAULT_PATHS, assumptions_for_risk_level, simulate_growth, simulate_milestones
+from compute.projection import project_net_worth
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/timeline", tags=["timeline-clean"])
 
+# Share of annual income assumed to be invested towards milestones
+DEFAULT_SAVINGS_RATE = 0.15
+# Paths behind each goal milestone's confidence estimate
+MILESTONE_CONFIDENCE_PATHS = 1_000
+# Milestones are simulated up to this age at most
+MILESTONE_HORIZON_AGE = 100
+
+# Parts of the projection each what-if field feeds; the rest is reused from
+# the cached baseline. "persona" covers age and life phase, "milestones"
+# the alignment score.
+WHAT_IF_EFFECTS = {
+    "annual_income": {"milestones", "net_worth"},
+    "annual_expenses": {"net_worth"},
+    "assets": {"net_worth"},
+    "liabilities": {"net_worth"},
+    "risk_level": {"milestones", "net_worth"},
+    "dependents": {"persona", "milestones"},
+    "date_of_birth": {"persona", "milestones"},
+    "goals": {"milestones"},
+}
+# What-if fields that are Profile columns, as opposed to projection inputs
+WHAT_IF_PROFILE_FIELDS = ("annual_income", "risk_level", "dependents", "date_of_birth", "goals")
+
 
 def calculate_age(birth_date: date) -> int:
     """Calculate age from date of birth"""
@@ -26,18 +60,92 @@ def calculate_age(birth_date: date) -> int:
     return today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
 
 
+class TimelineProjection:
+    """Timeline values derived from a profile, each computed once per request."""
+
+    # Derived fields persisted by snapshot() / restored by from_snapshot()
+    SNAPSHOT_FIELDS = ("current_age", "persona", "life_phase", "milestones", "alignment_score")
+
+    def __init__(self, profile: Profile, onboarding: Optional[OnboardingState]):
+        self.profile = profile
+        self.onboarding = onboarding
+        self.current_age = calculate_age(profile.date_of_birth) if profile.date_of_birth else 25
+        self.persona = detect_persona(profile)
+        self.life_phase = get_life_phase(self.current_age, profile.dependents or 0)
+        self.milestones = generate_timeline_milestones(profile, self.current_age, self.persona)
+        self.alignment_score = calculate_alignment_score(profile, onboarding, self.milestones)
+        self._confidence_bands: Dict[int, Dict[str, Any]] = {}
+
+    def confidence_bands(self, n_paths: int = DEFAULT_PATHS) -> Dict[str, Any]:
+        """Monte Carlo bands, simulated only when an endpoint asks for them."""
+        if n_paths not in self._confidence_bands:
+            self._confidence_bands[n_paths] = calculate_confidence_bands(
+                self.profile, self.milestones, n_paths=n_paths
+            )
+        return self._confidence_bands[n_paths]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serialisable copy of the derived values, including default bands."""
+        data = {field: getattr(self, field) for field in self.SNAPSHOT_FIELDS}
+        data["confidence_bands"] = self.confidence_bands()
+        return data
+
+    @classmethod
+    def from_snapshot(
+        cls, data: Dict[str, Any], profile: Profile, onboarding: Optional[OnboardingState]
+    ) -> "TimelineProjection":
+        projection = cls.__new__(cls)
+        projection.profile = profile
+        projection.onboarding = onboarding
+        for field in cls.SNAPSHOT_FIELDS:
+            setattr(projection, field, data[field])
+        projection._confidence_bands = {DEFAULT_PATHS: data["confidence_bands"]}
+        return projection
+
+
+def profile_version(profile: Profile, onboarding: Optional[OnboardingState]) -> str:
+    """Hash of every input the projection reads; changes whenever the output can."""
+    inputs = {
+        "today": date.today(),  # age, and therefore milestones, roll over daily
+        "first_name": profile.first_name,
+        "last_name": profile.last_name,
+        "date_of_birth": profile.date_of_birth,
+        "dependents": profile.dependents,
+        "annual_income": profile.annual_income,
+        "goals": profile.goals,
+        "risk_score": profile.risk_score,
+        "risk_level": profile.risk_level,
+        "onboarding_complete": bool(onboarding and onboarding.is_complete),
+    }
+    encoded = json.dumps(inputs, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def get_timeline_projection(profile: Profile, onboarding: Optional[OnboardingState]) -> TimelineProjection:
+    """Return the user's projection from projection_cache, rebuilding on a version change."""
+    key = projection_cache_key(profile.user_id)
+    version = profile_version(profile, onboarding)
+    cached = projection_cache.get(key)
+    if cached is not None and cached["version"] == version:
+        return TimelineProjection.from_snapshot(cached["projection"], profile, onboarding)
+
+    projection = TimelineProjection(profile, onboarding)
+    projection_cache.set(key, {"version": version, "projection": projection.snapshot()})
+    return projection
+
+
+# Read routes await the user lookup on the event loop (async dependency); the
+# projection itself is CPU-bound, so the handlers stay sync and run in the
+# threadpool rather than stalling the loop on a cache miss.
 @router.get("/journey")
 def get_timeline_journey(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    paths: int = Query(DEFAULT_PATHS, ge=100, le=100_000),
+    context: UserContext = Depends(get_user_context_async),
 ):
     """Get main Timeline data with milestones - core Timeline visualization"""
-    print("🚀 CLEAN TIMELINE: Journey data requested")
-    logger.info("🚀 CLEAN TIMELINE: Journey data requested")
+    logger.debug("timeline journey requested")
     
-    # Get profile and onboarding data
-    profile = db.query(Profile).filter_by(user_id=current_user.id).first()
-    onboarding = db.query(OnboardingState).filter_by(user_id=current_user.id).first()
+    profile, onboarding = context.profile, context.onboarding
     
     if not profile:
         raise HTTPException(
@@ -45,23 +153,13 @@ def get_timeline_journey(
             detail="Profile not found - complete onboarding first"
         )
     
-    # Calculate current age and persona
-    current_age = calculate_age(profile.date_of_birth) if profile.date_of_birth else 25
-    persona = detect_persona(profile)
-    
-    # Generate Timeline milestones
-    milestones = generate_timeline_milestones(profile, current_age, persona)
-    
-    # Calculate confidence bands (Monte Carlo simulation placeholder)
-    confidence_bands = calculate_confidence_bands(profile, milestones)
-    
-    # Calculate alignment score
-    alignment_score = calculate_alignment_score(profile, onboarding, milestones)
+    projection = get_timeline_projection(profile, onboarding)
+    current_age, persona, milestones = projection.current_age, projection.persona, projection.milestones
     
     timeline_journey = {
-        "user_id": current_user.id,
+        "user_id": context.user.id,
         "current_age": current_age,
-        "current_phase": get_life_phase(current_age, profile.dependents or 0),
+        "current_phase": projection.life_phase,
         "persona": persona,
         "timeline_span": {
             "start_age": current_age,
@@ -69,8 +167,8 @@ def get_timeline_journey(
             "focus_years": get_persona_focus_years(persona)
         },
         "milestones": milestones,
-        "confidence_bands": confidence_bands,
-        "alignment_score": alignment_score,
+        "confidence_bands": projection.confidence_bands(paths),
+        "alignment_score": projection.alignment_score,
         "next_milestone": get_next_milestone(milestones, current_age),
         "timeline_metadata": {
             "last_updated": datetime.utcnow().isoformat(),
@@ -79,23 +177,19 @@ def get_timeline_journey(
         }
     }
     
-    print(f"✅ CLEAN TIMELINE: Journey returned for {persona} persona, age {current_age}")
-    logger.info(f"✅ CLEAN TIMELINE: Journey returned for {persona} persona, age {current_age}")
+    logger.info("timeline journey returned", extra={"persona": persona, "age": current_age})
     
     return timeline_journey
 
 
 @router.get("/alignment")
 def get_alignment_score_details(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    context: UserContext = Depends(get_user_context_async),
 ):
     """Get detailed alignment score and insights"""
-    print("🚀 CLEAN TIMELINE: Alignment details requested")
-    logger.info("🚀 CLEAN TIMELINE: Alignment details requested")
+    logger.debug("timeline alignment requested")
     
-    profile = db.query(Profile).filter_by(user_id=current_user.id).first()
-    onboarding = db.query(OnboardingState).filter_by(user_id=current_user.id).first()
+    profile = context.profile
     
     if not profile:
         raise HTTPException(
@@ -103,24 +197,23 @@ def get_alignment_score_details(
             detail="Profile not found"
         )
     
-    current_age = calculate_age(profile.date_of_birth) if profile.date_of_birth else 25
-    milestones = generate_timeline_milestones(profile, current_age, detect_persona(profile))
+    projection = get_timeline_projection(profile, context.onboarding)
+    milestones = projection.milestones
     
     alignment_details = {
-        "daily_score": calculate_alignment_score(profile, onboarding, milestones),
+        "daily_score": projection.alignment_score,
         "score_trend": "improving",  # TODO: Calculate from historical data
-        "status": get_alignment_status(calculate_alignment_score(profile, onboarding, milestones)),
+        "status": get_alignment_status(projection.alignment_score),
         "contributing_factors": get_alignment_factors(profile, milestones),
         "recommendations": get_alignment_recommendations(profile, milestones),
         "impact_preview": {
-            "next_goal_distance": calculate_next_goal_distance(milestones, current_age),
-            "confidence_level": confidence_bands.get("realistic", 75) if 'confidence_bands' in locals() else 75
+            "next_goal_distance": calculate_next_goal_distance(milestones, projection.current_age),
+            "confidence_level": projection.confidence_bands()["realistic"]
         },
-        "persona_specific_insights": get_persona_alignment_insights(detect_persona(profile))
+        "persona_specific_insights": get_persona_alignment_insights(projection.persona)
     }
     
-    print(f"✅ CLEAN TIMELINE: Alignment details returned - score: {alignment_details['daily_score']}")
-    logger.info(f"✅ CLEAN TIMELINE: Alignment details returned - score: {alignment_details['daily_score']}")
+    logger.info("timeline alignment returned", extra={"daily_score": alignment_details["daily_score"]})
     
     return alignment_details
 
@@ -128,14 +221,13 @@ def get_alignment_score_details(
 @router.post("/milestone")
 def create_timeline_milestone(
     milestone_data: dict,
-    current_user: User = Depends(get_current_user),
+    context: UserContext = Depends(get_user_context),
     db: Session = Depends(get_db)
 ):
     """Create new milestone on Timeline"""
-    print("🚀 CLEAN TIMELINE: New milestone creation requested")
-    logger.info("🚀 CLEAN TIMELINE: New milestone creation requested")
+    logger.debug("timeline milestone creation requested")
     
-    profile = db.query(Profile).filter_by(user_id=current_user.id).first()
+    profile = context.profile
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -166,42 +258,118 @@ def create_timeline_milestone(
         
         db.commit()
         db.refresh(profile)
+        invalidate_projection(profile.user_id)
         
-        print(f"✅ CLEAN TIMELINE: New milestone created - {new_milestone['title']}")
-        logger.info(f"✅ CLEAN TIMELINE: New milestone created - {new_milestone['title']}")
+        logger.info("timeline milestone created", extra={"milestone": new_milestone["title"]})
         
         return {
             "success": True,
             "milestone": new_milestone,
             "timeline_impact": timeline_impact,
-            "updated_alignment_score": calculate_alignment_score(
-                profile, 
-                db.query(OnboardingState).filter_by(user_id=current_user.id).first(),
-                generate_timeline_milestones(profile, calculate_age(profile.date_of_birth), detect_persona(profile))
-            )
+            "updated_alignment_score": TimelineProjection(profile, context.onboarding).alignment_score
         }
         
     except Exception as e:
         db.rollback()
-        print(f"❌ CLEAN TIMELINE: Milestone creation failed - {str(e)}")
-        logger.error(f"❌ CLEAN TIMELINE: Milestone creation failed - {str(e)}")
+        logger.exception("timeline milestone creation failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create milestone: {str(e)}"
         )
 
 
+@router.post("/what-if", response_model=WhatIf)
+def evaluate_what_if(
+    delta: ProfileDelta,
+    context: UserContext = Depends(get_user_context),
+    db: Session = Depends(get_db),
+):
+    """Timeline and net worth under hypothetical profile changes; nothing is saved.
+
+    Starts from the cached baseline timeline and the current net worth curve
+    and recomputes only the parts the changed fields feed (WHAT_IF_EFFECTS).
+    The net worth baseline is projected on every call: it reads accounts,
+    income and expenses, which other workers can change at any time.
+    """
+    profile, onboarding = context.profile, context.onboarding
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+
+    changes = delta.dict(exclude_unset=True, exclude_none=True)
+    parts = set().union(*(WHAT_IF_EFFECTS[field] for field in changes))
+    baseline = get_timeline_projection(profile, onboarding)
+    try:
+        baseline_curve = crud_projection.project_users(db, [profile.user_id])[profile.user_id]
+    except ValueError as e:
+        # e.g. an income source with an unknown frequency, as /projection/net-worth
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    # Detached copy of the profile columns, so the session never sees the changes
+    hypothetical = SimpleNamespace(**{column.key: getattr(profile, column.key) for column in Profile.__table__.columns})
+    for field in WHAT_IF_PROFILE_FIELDS:
+        if field in changes:
+            setattr(hypothetical, field, changes[field])
+
+    current_age, persona, life_phase = baseline.current_age, baseline.persona, baseline.life_phase
+    if "persona" in parts:
+        current_age = calculate_age(hypothetical.date_of_birth) if hypothetical.date_of_birth else 25
+        persona = detect_persona(hypothetical)
+        life_phase = get_life_phase(current_age, hypothetical.dependents or 0)
+    milestones, alignment_score = baseline.milestones, baseline.alignment_score
+    if "milestones" in parts:
+        milestones = generate_timeline_milestones(hypothetical, current_age, persona)
+        alignment_score = calculate_alignment_score(hypothetical, onboarding, milestones)
+    net_worth = baseline_curve["net_worth"]
+    if "net_worth" in parts:
+        assumptions = baseline_curve["assumptions"]
+        net_worth = project_net_worth(
+            *(changes.get(name, baseline_curve[name]) for name in ("annual_income", "annual_expenses", "assets", "liabilities")),
+            years=len(net_worth) - 1,
+            income_growth=assumptions["income_growth"],
+            inflation=assumptions["inflation"],
+            expected_return=(
+                assumptions_for_risk_level(changes["risk_level"])[0]
+                if "risk_level" in changes else assumptions["expected_return"]
+            ),
+        ).tolist()
+
+    logger.info("timeline what-if evaluated", extra={"fields": sorted(changes), "recomputed": sorted(parts)})
+
+    return {
+        "changes": changes,
+        "recomputed": sorted(parts),
+        "before": {
+            "current_age": baseline.current_age,
+            "persona": baseline.persona,
+            "life_phase": baseline.life_phase,
+            "alignment_score": baseline.alignment_score,
+            "net_worth": baseline_curve["net_worth"],
+        },
+        "after": {
+            "current_age": current_age,
+            "persona": persona,
+            "life_phase": life_phase,
+            "alignment_score": alignment_score,
+            "net_worth": net_worth,
+        },
+        "milestone_shifts": get_milestone_shifts(
+            baseline.milestones, milestones,
+            (baseline.current_age, baseline_curve["net_worth"]), (current_age, net_worth),
+        ),
+    }
+
+
 @router.get("/dashboard-overview")
 def get_dashboard_overview(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    context: UserContext = Depends(get_user_context_async),
 ):
     """Get Timeline-focused dashboard overview"""
-    print("🚀 CLEAN TIMELINE: Dashboard overview requested")
-    logger.info("🚀 CLEAN TIMELINE: Dashboard overview requested")
+    logger.debug("timeline dashboard overview requested")
     
-    profile = db.query(Profile).filter_by(user_id=current_user.id).first()
-    onboarding = db.query(OnboardingState).filter_by(user_id=current_user.id).first()
+    profile = context.profile
     
     if not profile:
         return {
@@ -210,9 +378,9 @@ def get_dashboard_overview(
             "message": "Complete onboarding to unlock your Timeline"
         }
     
-    current_age = calculate_age(profile.date_of_birth) if profile.date_of_birth else 25
-    persona = detect_persona(profile)
-    milestones = generate_timeline_milestones(profile, current_age, persona)
+    projection = get_timeline_projection(profile, context.onboarding)
+    current_age, persona, milestones = projection.current_age, projection.persona, projection.milestones
+    focus_years = get_persona_focus_years(persona)
     
     dashboard_overview = {
         "timeline_ready": True,
@@ -220,16 +388,16 @@ def get_dashboard_overview(
             "name": f"{profile.first_name} {profile.last_name}",
             "age": current_age,
             "persona": persona,
-            "life_phase": get_life_phase(current_age, profile.dependents or 0)
+            "life_phase": projection.life_phase
         },
         "timeline_summary": {
             "total_milestones": len(milestones),
             "next_milestone": get_next_milestone(milestones, current_age),
-            "timeline_span_years": get_persona_focus_years(persona),
-            "confidence_level": 78  # Placeholder for Monte Carlo
+            "timeline_span_years": focus_years,
+            "confidence_level": projection.confidence_bands()["realistic"]
         },
         "alignment_overview": {
-            "current_score": calculate_alignment_score(profile, onboarding, milestones),
+            "current_score": projection.alignment_score,
             "trend": "stable",
             "last_updated": datetime.utcnow().isoformat()
         },
@@ -238,12 +406,11 @@ def get_dashboard_overview(
         "timeline_visualization_data": {
             "milestones": milestones[:5],  # First 5 milestones for preview
             "current_position": current_age,
-            "focus_range": [current_age, current_age + get_persona_focus_years(persona)]
+            "focus_range": [current_age, current_age + focus_years]
         }
     }
     
-    print(f"✅ CLEAN TIMELINE: Dashboard overview returned for {persona}")
-    logger.info(f"✅ CLEAN TIMELINE: Dashboard overview returned for {persona}")
+    logger.info("timeline dashboard overview returned", extra={"persona": persona})
     
     return dashboard_overview
 
@@ -251,8 +418,7 @@ def get_dashboard_overview(
 @router.get("/test")
 def test_clean_timeline():
     """Test endpoint to verify clean timeline implementation"""
-    print("🧪 CLEAN TIMELINE TEST ENDPOINT CALLED")
-    logger.info("🧪 CLEAN TIMELINE TEST ENDPOINT CALLED")
+    logger.debug("timeline test endpoint called")
     return {
         "message": "CLEAN TIMELINE ENDPOINTS ACTIVE",
         "version": "timeline-clean-v1.0", 
@@ -295,19 +461,64 @@ def generate_timeline_milestones(profile: Profile, current_age: int, persona: st
                     "category": goal_data.get("category", "general"),
                     "progress": calculate_goal_progress(goal_data, profile),
                     "timeline_impact": "On track",  # TODO: Calculate actual impact
-                    "confidence": 75  # TODO: Calculate from risk and other factors
                 })
+        if milestones:
+            for milestone, confidence in zip(milestones, estimate_milestone_confidence(profile, milestones, current_age)):
+                milestone["confidence"] = confidence
     
     # Add persona-specific default milestones if none exist
     if not milestones:
         milestones = get_default_milestones(persona, current_age, profile.annual_income or 50000)
     
     # Sort by age
-    milestones.sort(key=lambda x: x.get("age", current_age))
+    milestones.sort(key=lambda x: as_age(x.get("age")) or current_age)
     
     return milestones
 
 
+def funded_age(start_age: int, net_worth: List[float], target: Any) -> Optional[int]:
+    """Age at which a yearly net worth curve starting at start_age first covers target"""
+    target = as_amount(target, default=None)
+    if target is None:
+        return None
+    reached = np.asarray(net_worth) >= target
+    return start_age + int(reached.argmax()) if reached.any() else None
+
+
+def get_milestone_shifts(
+    before: List[Dict[str, Any]],
+    after: List[Dict[str, Any]],
+    curve_before: tuple,
+    curve_after: tuple,
+) -> List[Dict[str, Any]]:
+    """Per milestone id, how its age, confidence and funded age move between two timelines.
+
+    ``curve_before``/``curve_after`` are (start age, yearly net worth) pairs.
+    """
+    before_by_id = {m["id"]: m for m in before}
+    after_by_id = {m["id"]: m for m in after}
+    shifts = []
+    for milestone_id in dict.fromkeys([*before_by_id, *after_by_id]):
+        old, new = before_by_id.get(milestone_id), after_by_id.get(milestone_id)
+        funded_before = funded_age(*curve_before, old.get("target_amount")) if old else None
+        funded_after = funded_age(*curve_after, new.get("target_amount")) if new else None
+        shifts.append({
+            "id": milestone_id,
+            "title": (new or old).get("title"),
+            "target_amount": as_amount((new or old).get("target_amount"), default=None),
+            "age_before": old.get("age") if old else None,
+            "age_after": new.get("age") if new else None,
+            "confidence_before": old.get("confidence") if old else None,
+            "confidence_after": new.get("confidence") if new else None,
+            "funded_age_before": funded_before,
+            "funded_age_after": funded_after,
+            "shift_years": (
+                funded_after - funded_before if funded_before is not None and funded_after is not None else None
+            ),
+        })
+    return shifts
+
+
 def get_default_milestones(persona: str, current_age: int, annual_income: float) -> List[Dict[str, Any]]:
     """Get default milestones based on persona"""
     income = annual_income
@@ -378,22 +589,52 @@ def get_default_milestones(persona: str, current_age: int, annual_income: float)
     return defaults.get(persona, defaults["Jamal"])
 
 
-def calculate_confidence_bands(profile: Profile, milestones: List[Dict[str, Any]]) -> Dict[str, float]:
-    """Calculate Monte Carlo confidence bands (simplified)"""
-    # TODO: Implement actual Monte Carlo simulation
-    base_confidence = 75
-    
-    # Adjust based on risk score
-    if profile.risk_score:
-        if profile.risk_score > 70:
-            base_confidence -= 10  # Higher risk, lower confidence
-        elif profile.risk_score < 30:
-            base_confidence += 5   # Conservative, higher confidence
-    
+def calculate_confidence_bands(
+    profile: Profile,
+    milestones: List[Dict[str, Any]],
+    n_paths: int = DEFAULT_PATHS,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Monte Carlo confidence bands for reaching the Timeline milestones.
+
+    optimistic/realistic/pessimistic are the 90th/50th/10th percentile of the
+    per-path funded share of milestone targets (0-100). The seed defaults to
+    the user id so a user's bands are stable between page loads.
+    """
+    current_age = calculate_age(profile.date_of_birth) if profile.date_of_birth else 25
+    milestones = [m for m in milestones if milestone_horizon(m, current_age) is not None]
+    mean_return, volatility = assumptions_for_risk_level(profile.risk_level)
+    result = simulate_milestones(
+        initial_wealth=0.0,
+        annual_contribution=(profile.annual_income or 0) * DEFAULT_SAVINGS_RATE,
+        milestone_years=[milestone_horizon(m, current_age) for m in milestones],
+        milestone_targets=[as_amount(m.get("target_amount")) for m in milestones],
+        mean_return=mean_return,
+        volatility=volatility,
+        n_paths=n_paths,
+        seed=profile.user_id if seed is None else seed,
+    )
+    funding = result["funding_percentiles"]
+
     return {
-        "optimistic": min(base_confidence + 15, 95),
-        "realistic": base_confidence,
-        "pessimistic": max(base_confidence - 20, 40)
+        "optimistic": round(funding[90] * 100, 1),
+        "realistic": round(funding[50] * 100, 1),
+        "pessimistic": round(funding[10] * 100, 1),
+        "simulation": {
+            "paths": n_paths,
+            "expected_return": mean_return,
+            "volatility": volatility,
+            "milestones": [
+                {
+                    "id": m.get("id"),
+                    "success_probability": round(result["success_probability"][i] * 100, 1),
+                    "wealth_p10": round(result["wealth_percentiles"][10][i], 2),
+                    "wealth_p50": round(result["wealth_percentiles"][50][i], 2),
+                    "wealth_p90": round(result["wealth_percentiles"][90][i], 2),
+                }
+                for i, m in enumerate(milestones)
+            ],
+        },
     }
 
 
@@ -455,8 +696,8 @@ def get_persona_focus_years(persona: str) -> int:
 
 def get_next_milestone(milestones: List[Dict[str, Any]], current_age: int) -> Optional[Dict[str, Any]]:
     """Get the next milestone from current age"""
-    future_milestones = [m for m in milestones if m.get("age", 0) > current_age]
-    return min(future_milestones, key=lambda x: x.get("age", 999)) if future_milestones else None
+    future_milestones = [m for m in milestones if (as_age(m.get("age")) or 0) > current_age]
+    return min(future_milestones, key=lambda x: as_age(x["age"])) if future_milestones else None
 
 
 def calculate_data_completeness(profile: Profile, onboarding: Optional[OnboardingState]) -> float:
@@ -487,12 +728,73 @@ def get_persona_timeline_insights(persona: str) -> Dict[str, str]:
     }.get(persona, "Build your financial timeline step by step")
 
 
+def as_amount(value: Any, default: Optional[float] = 0.0) -> Optional[float]:
+    """A milestone amount as a float, or ``default`` when missing or not a number"""
+    try:
+        return default if value is None else float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def as_age(value: Any) -> Optional[int]:
+    """A milestone age as a whole number, or None when missing or not a number"""
+    age = as_amount(value, default=None)
+    return int(age) if age is not None and math.isfinite(age) else None
+
+
+def milestone_horizon(milestone: Dict[str, Any], current_age: int) -> Optional[int]:
+    """Years from current_age to the milestone, capped at MILESTONE_HORIZON_AGE.
+
+    None when the milestone's age is not a number.
+    """
+    age = as_age(milestone.get("age") or current_age)
+    if age is None:
+        return None
+    return min(max(age, current_age), max(MILESTONE_HORIZON_AGE, current_age)) - current_age
+
+
 def calculate_goal_progress(goal_data: Dict[str, Any], profile: Profile) -> float:
-    """Calculate progress toward a specific goal (placeholder)"""
-    # TODO: Implement actual progress calculation based on savings/investments
+    """Percent of the goal's target already saved, else its stored progress"""
+    target, current = goal_data.get("target_amount"), goal_data.get("current_amount")
+    if isinstance(target, (int, float)) and isinstance(current, (int, float)) and target > 0:
+        return round(min(max(current / target, 0.0), 1.0) * 100, 1)
     return goal_data.get("progress", 0)
 
 
+def estimate_milestone_confidence(
+    profile: Profile,
+    milestones: List[Dict[str, Any]],
+    current_age: int,
+    n_paths: int = MILESTONE_CONFIDENCE_PATHS,
+) -> List[Optional[int]]:
+    """Chance (0-100) of funding each milestone by its age.
+
+    All milestones share one simulated return matrix at the profile's risk
+    level; the assumed savings (DEFAULT_SAVINGS_RATE of income) are split
+    evenly between them. Milestones whose age is not a number get None.
+    """
+    horizons = {i: milestone_horizon(m, current_age) for i, m in enumerate(milestones)}
+    horizons = {i: years for i, years in horizons.items() if years is not None}
+    confidence: List[Optional[int]] = [None] * len(milestones)
+    if not horizons:
+        return confidence
+    dated = [milestones[i] for i in horizons]
+    mean_return, volatility = assumptions_for_risk_level(profile.risk_level)
+    growth, deposits = simulate_growth(max(horizons.values()), mean_return, volatility, n_paths=n_paths, seed=profile.user_id)
+    contribution = (profile.annual_income or 0) * DEFAULT_SAVINGS_RATE / len(dated)
+    result = evaluate_goals(
+        [as_amount((profile.goals or {}).get(m["id"], {}).get("current_amount")) for m in dated],
+        [as_amount(m.get("target_amount")) for m in dated],
+        list(horizons.values()),
+        [contribution] * len(dated),
+        growth,
+        deposits,
+    )
+    for i, p in zip(horizons, result["success_probability"].tolist()):
+        confidence[i] = round(p * 100)
+    return confidence
+
+
 def get_alignment_factors(profile: Profile, milestones: List[Dict[str, Any]]) -> List[Dict[str, str]]:
     """Get factors contributing to alignment score"""
     factors = []
@@ -535,7 +837,7 @@ def calculate_next_goal_distance(milestones: List[Dict[str, Any]], current_age:
     """Calculate distance to next goal"""
     next_milestone = get_next_milestone(milestones, current_age)
     if next_milestone:
-        years_away = next_milestone.get("age", current_age) - current_age
+        years_away = next_milestone["age"] - current_age
         if years_away <= 1:
             return f"{years_away * 12:.0f} months away"
         else:
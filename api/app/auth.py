@@ -2,13 +2,15 @@
 
 from datetime import date
 from fastapi import APIRouter, HTTPException, status, Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models import User, Profile
 from app.schemas import RegisterRequest, Token, RegisterResponse, ProfileUpdate, ProfileResponse, DeleteAccountRequest, DeleteAccountResponse, CreateAccountRequest, CreateAccountResponse, CompleteProfileRequest, CompleteProfileResponse
-from app.security import hash_password, verify_password, create_access_token, get_current_user
+from app.security import hash_password, verify_password, create_access_token, get_current_user, hash_password_async, verify_password_async, needs_rehash
 from compute.risk_engine import compute_risk_score, compute_risk_level
 from app.utils import normalize_questionnaire
 import json
@@ -39,7 +41,6 @@ def create_account(
         email=data.email,
         hashed_password=hash_password(data.password),
         is_active=True,
-        role=data.user_type
     )
     db.add(user)
     db.commit()
@@ -129,7 +130,7 @@ def register(
     hashed_pw = hash_password(data.password)
 
     # 3. Create User
-    user = User(email=data.email, hashed_password=hashed_pw, role=data.user_type)
+    user = User(email=data.email, hashed_password=hashed_pw)
     db.add(user)
     db.commit()
     db.refresh(user)
@@ -177,17 +178,24 @@ def register(
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db:        Session                = Depends(get_db),
+    db:        AsyncSession           = Depends(get_async_db),
 ):
-    user = db.query(User).filter_by(email=form_data.username).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # DB work is awaited and the KDF runs on the bounded hashing pool, so the
+    # event loop is never blocked.
+    user = (await db.execute(select(User).filter_by(email=form_data.username))).scalar_one_or_none()
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
         )
 
+    # Transparently upgrade legacy / below-cost hashes now that we know the password
+    if needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password_async(form_data.password)
+        await db.commit()
+
     access_token = create_access_token(user)
     return {
         "access_token": access_token,
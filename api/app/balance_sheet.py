@@ -0,0 +1,38 @@
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.balance_sheet import BalanceSheet, NetWorthPoint
+from app.security import TokenClaims, get_token_claims
+from app.crud import balance_sheet as crud_balance_sheet
+
+router = APIRouter(prefix="/balance-sheet", tags=["balance-sheet"])
+
+
+@router.get("/", response_model=BalanceSheet)
+def get_balance_sheet(
+    db: Session = Depends(get_db),
+    claims: TokenClaims = Depends(get_token_claims),
+):
+    """Assets vs liabilities with a per-account-type breakdown.
+
+    Served from the cached snapshot the account CRUD maintains, so the cost
+    does not grow with the number of accounts.
+    """
+    sheet = crud_balance_sheet.get_balance_sheet(db, claims.user_id)
+    db.commit()  # first read for a user stores its snapshot
+    return sheet
+
+
+@router.get("/history", response_model=List[NetWorthPoint])
+def get_net_worth_history(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: Session = Depends(get_db),
+    claims: TokenClaims = Depends(get_token_claims),
+):
+    """Net worth per day on which the user's accounts changed, oldest first."""
+    return crud_balance_sheet.get_net_worth_history(db, claims.user_id, start=start, end=end)
@@ -0,0 +1,67 @@
+from datetime import date, datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import ExpenseCategory
+from app.schemas.budget import BudgetVsActual
+from app.security import TokenClaims, get_token_claims
+from app.crud import category_spending as crud_spending
+
+router = APIRouter(prefix="/budget", tags=["budget"])
+
+
+@router.get("/vs-actual", response_model=BudgetVsActual)
+def get_budget_vs_actual(
+    month: Optional[str] = None,
+    db: Session = Depends(get_db),
+    claims: TokenClaims = Depends(get_token_claims),
+):
+    """Compare each expense category's monthly budget with that month's spending.
+
+    ``month`` is ``YYYY-MM`` (default: current month). Actuals come from the
+    category_spending rollup, so cost does not grow with transaction history.
+    Actual spending is the absolute net total of the category's transactions;
+    categories with spending but no budget are listed with ``budgeted`` unset.
+    """
+    try:
+        period = datetime.strptime(month, "%Y-%m").date() if month else date.today().replace(day=1)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="month must be YYYY-MM")
+
+    # Budget names match transaction categories case-insensitively
+    spending = {}
+    for row in crud_spending.get_monthly_spending(db, claims.user_id, period):
+        bucket = spending.setdefault(row.category.lower(), {"category": row.category, "total": 0.0, "count": 0})
+        bucket["total"] += row.total
+        bucket["count"] += row.count
+    budgets = db.query(ExpenseCategory).filter(ExpenseCategory.user_id == claims.user_id).all()
+
+    lines = []
+    for budget in budgets:
+        row = spending.pop(budget.name.lower(), None)
+        actual = abs(row["total"]) if row else 0.0
+        budgeted = budget.budgeted_amount or 0.0
+        lines.append({
+            "category": budget.name,
+            "budgeted": budgeted,
+            "actual": actual,
+            "variance": budgeted - actual,
+            "percent_used": round(actual / budgeted * 100, 1) if budgeted else None,
+            "transaction_count": row["count"] if row else 0,
+        })
+    for row in spending.values():
+        lines.append({
+            "category": row["category"],
+            "actual": abs(row["total"]),
+            "transaction_count": row["count"],
+        })
+
+    return {
+        "month": period,
+        "total_budgeted": sum(line.get("budgeted") or 0.0 for line in lines),
+        "total_actual": sum(line["actual"] for line in lines),
+        "lines": lines,
+    }
@@ -0,0 +1,160 @@
+"""
+Write-coalescing buffer for onboarding autosaves.
+
+Rapid saves of the same (user, step) are merged in memory and written once,
+AUTOSAVE_DEBOUNCE_SECONDS after the last save (but no later than
+AUTOSAVE_MAX_DELAY_SECONDS after the first). A single background thread does
+the writes, committing everything that is due in one transaction. Flushes
+run one at a time, so saves are committed in the order they were taken and
+flush_user returns only once everything the user saved before it is written.
+
+Off by default: with AUTOSAVE_DEBOUNCE_SECONDS=0 every save writes through
+synchronously. The buffer is per process, so reads and /complete handled by
+another worker would miss pending saves, and a late flush could overwrite a
+newer write made through another worker. Only enable it for a single worker
+or with sticky sessions.
+"""
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from app.database import SessionLocal
+from app.crud import onboarding as crud_onboarding
+
+logger = logging.getLogger(__name__)
+
+AUTOSAVE_DEBOUNCE_SECONDS = float(os.getenv("AUTOSAVE_DEBOUNCE_SECONDS", "0"))
+AUTOSAVE_MAX_DELAY_SECONDS = float(os.getenv("AUTOSAVE_MAX_DELAY_SECONDS", "5.0"))
+
+Key = Tuple[int, int]  # (user_id, step_number)
+
+
+@dataclass
+class PendingSave:
+    data: Any
+    patch: bool
+    first_at: float
+    due_at: float
+
+    def merged_with(self, newer: "PendingSave") -> "PendingSave":
+        """One save equivalent to applying self then ``newer``."""
+        if not newer.patch:
+            data, patch = newer.data, False
+        elif not self.patch:
+            data, patch = crud_onboarding.apply_patch(self.data, newer.data), False
+        else:
+            data, patch = {**self.data, **newer.data}, True
+        return PendingSave(data, patch, self.first_at, min(newer.due_at, self.first_at + AUTOSAVE_MAX_DELAY_SECONDS))
+
+
+class AutosaveBuffer:
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending: Dict[Key, PendingSave] = {}
+        # Taken from _pending but not yet committed; still visible to overlay()
+        self._inflight: Dict[Key, PendingSave] = {}
+        # Held for a whole flush; a failed flush re-queues its saves before releasing it
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return AUTOSAVE_DEBOUNCE_SECONDS > 0
+
+    def submit(self, user_id: int, step_number: int, data: Any, patch: bool = False) -> None:
+        """Queue a save, merging it into any pending save for the same step."""
+        now = time.monotonic()
+        save = PendingSave(data, patch, now, now + AUTOSAVE_DEBOUNCE_SECONDS)
+        with self._cond:
+            key = (user_id, step_number)
+            previous = self._pending.get(key)
+            self._pending[key] = previous.merged_with(save) if previous else save
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="onboarding-autosave", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def overlay(self, user_id: int, state: Dict[str, Any]) -> Dict[str, Any]:
+        """``state`` (OnboardingState column values) with this user's unwritten saves applied."""
+        with self._cond:
+            saves = [
+                (step, save)
+                for source in (self._inflight, self._pending)
+                for (owner, step), save in source.items()
+                if owner == user_id
+            ]
+        if not saves:
+            return state
+        state = dict(state)
+        for step, save in saves:
+            column = crud_onboarding.STEP_COLUMNS[step]
+            state[column] = crud_onboarding.apply_patch(state.get(column), save.data) if save.patch else save.data
+            state["current_step"] = max(state.get("current_step") or 1, step)
+        state["completed_steps"] = crud_onboarding.completed_steps_for(state)
+        return state
+
+    def flush_user(self, user_id: int) -> None:
+        """Write this user's pending saves now (e.g. before completing onboarding)."""
+        self._flush(lambda key, save: key[0] == user_id)
+
+    def flush_all(self) -> None:
+        self._flush(lambda key, save: True)
+
+    def _take(self, select) -> Dict[Key, PendingSave]:
+        with self._cond:
+            taken = {key: save for key, save in self._pending.items() if select(key, save)}
+            for key in taken:
+                del self._pending[key]
+            self._inflight.update(taken)
+        return taken
+
+    def _flush(self, select) -> None:
+        with self._flush_lock:
+            self._flush_locked(select)
+
+    def _flush_locked(self, select) -> None:
+        taken = self._take(select)
+        if not taken:
+            return
+        db = SessionLocal()
+        try:
+            for (user_id, step_number), save in taken.items():
+                crud_onboarding.save_step(db, user_id, step_number, save.data, patch=save.patch)
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("onboarding autosave flush failed", extra={"saves": len(taken)})
+            with self._cond:
+                # Retry later, keeping anything saved since as the newer write
+                for key, save in taken.items():
+                    newer = self._pending.get(key)
+                    self._pending[key] = save.merged_with(newer) if newer else save
+            raise
+        finally:
+            db.close()
+            with self._cond:
+                for key in taken:
+                    self._inflight.pop(key, None)
+        logger.debug("onboarding autosave flushed", extra={"saves": len(taken)})
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                next_due = min(save.due_at for save in self._pending.values())
+                delay = next_due - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+            now = time.monotonic()
+            try:
+                self._flush(lambda key, save: save.due_at <= now)
+            except Exception:
+                time.sleep(AUTOSAVE_DEBOUNCE_SECONDS)  # already logged; back off before retrying
+
+
+autosave = AutosaveBuffer()
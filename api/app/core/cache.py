@@ -0,0 +1,121 @@
+"""
+Pluggable key/value caches for derived, per-user data.
+
+Values stored through a CacheBackend must be JSON-serialisable so an external
+store (e.g. a local Redis stand-in) can implement the same interface.
+"""
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class CacheBackend(ABC):
+    """Minimal cache interface: get/set with optional TTL, and delete."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, expiring after ``ttl`` seconds if given."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Drop a key if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every key."""
+
+
+class InMemoryCache(CacheBackend):
+    """Thread-safe in-process LRU cache with per-entry TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Timeline projections (milestones, persona, alignment, confidence bands)
+projection_cache: CacheBackend = InMemoryCache(
+    maxsize=int(os.getenv("TIMELINE_CACHE_SIZE", "4096")),
+    ttl=float(os.getenv("TIMELINE_CACHE_TTL", "900")),
+)
+
+
+def projection_cache_key(user_id: int) -> str:
+    return f"timeline-projection:{user_id}"
+
+
+def invalidate_projection(user_id: int) -> None:
+    """Forget a user's cached Timeline projection after a profile write."""
+    projection_cache.delete(projection_cache_key(user_id))
+
+
+# Authenticated user snapshots (column values only), keyed by user id. User
+# writes invalidate this process only: a deactivation or role change made on
+# another worker is seen here within USER_CACHE_TTL seconds. 0 turns it off.
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "10"))
+user_cache: CacheBackend = InMemoryCache(
+    maxsize=int(os.getenv("USER_CACHE_SIZE", "10000")),
+    ttl=USER_CACHE_TTL,
+)
+
+
+def user_cache_key(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def invalidate_user(user_id) -> None:
+    """Forget a cached user snapshot after the user row changes or is deleted."""
+    user_cache.delete(user_cache_key(user_id))
+
+
+# FIRE grid results, keyed by a hash of the fully resolved scenario inputs
+fire_cache: CacheBackend = InMemoryCache(
+    maxsize=int(os.getenv("FIRE_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("FIRE_CACHE_TTL", "3600")),
+)
+
+
+def fire_cache_key(inputs_hash: str) -> str:
+    return f"fire-grid:{inputs_hash}"
+
@@ -0,0 +1,152 @@
+"""
+Structured, sampled, non-blocking application logging.
+
+Records are tagged with the request's trace id (the X-Trace-ID header set by
+the add_trace_id middleware) and route, pushed onto an in-memory queue by a
+QueueHandler, and written out as JSON lines by a background QueueListener,
+so request threads never block on stdout.
+
+Per-route sampling keeps or drops all INFO/DEBUG records of a request
+together; WARNING and above are always kept. Configure with:
+
+    LOG_LEVEL=INFO
+    LOG_FORMAT=json            # or "text"
+    LOG_SAMPLE_DEFAULT=1.0     # fraction of requests logged
+    LOG_SAMPLE_RATES=/api/v1/timeline/*=0.1,/api/v1/profile/*=0.5
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import zlib
+from contextvars import ContextVar
+from fnmatch import fnmatchcase
+from typing import Dict, Optional
+
+trace_id_var: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
+route_var: ContextVar[Optional[str]] = ContextVar("route", default=None)
+sampled_var: ContextVar[bool] = ContextVar("log_sampled", default=True)
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RESERVED = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "trace_id", "route"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _parse_rates(spec: str) -> Dict[str, float]:
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        pattern, _, rate = item.rpartition("=")
+        rates[pattern] = float(rate)
+    return rates
+
+
+SAMPLE_DEFAULT = float(os.getenv("LOG_SAMPLE_DEFAULT", "1.0"))
+SAMPLE_RATES = _parse_rates(os.getenv("LOG_SAMPLE_RATES", ""))
+
+
+def sample_rate(path: str) -> float:
+    """Sampling rate for ``path``: the first matching LOG_SAMPLE_RATES pattern, else the default."""
+    for pattern, rate in SAMPLE_RATES.items():
+        if fnmatchcase(path, pattern):
+            return rate
+    return SAMPLE_DEFAULT
+
+
+def should_sample(trace_id: str, path: str) -> bool:
+    """Deterministic per-request decision, so a trace id is either fully logged or not."""
+    rate = sample_rate(path)
+    if rate >= 1.0:
+        return True
+    if rate <= 0.0:
+        return False
+    return zlib.crc32(trace_id.encode()) / 0xFFFFFFFF < rate
+
+
+def bind_request(trace_id: str, path: str):
+    """Set the logging context for a request; returns tokens for reset_request."""
+    return (
+        trace_id_var.set(trace_id),
+        route_var.set(path),
+        sampled_var.set(should_sample(trace_id, path)),
+    )
+
+
+def reset_request(tokens) -> None:
+    for var, token in zip((trace_id_var, route_var, sampled_var), tokens):
+        var.reset(token)
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamps trace id and route on each record and applies request sampling.
+
+    Attached to the QueueHandler, so it runs in the thread that emitted the
+    record, where the request's context variables are visible, before the
+    record is queued for the background writer.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.trace_id = trace_id_var.get()
+        record.route = route_var.get()
+        return record.levelno >= logging.WARNING or sampled_var.get()
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("trace_id", "route"):
+            if getattr(record, key, None):
+                entry[key] = getattr(record, key)
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(stream=None) -> None:
+    """Route the root logger through a queue to a single background writer.
+
+    Safe to call more than once; later calls replace the previous setup.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
+    output = logging.StreamHandler(stream)
+    if os.getenv("LOG_FORMAT", "json").lower() == "text":
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s [%(trace_id)s] %(message)s"))
+    else:
+        output.setFormatter(JsonFormatter())
+
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(records)
+    handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    for existing in [h for h in root.handlers if isinstance(h, logging.handlers.QueueHandler)]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+    _listener = logging.handlers.QueueListener(records, output, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,210 @@
+"""
+Request latency and database query instrumentation.
+
+Per-route latency histograms, per-request query count and time (collected
+from SQLAlchemy engine events), and an N+1 detector, all rendered in the
+Prometheus text format for the /metrics endpoint. Dependency-free: metrics
+live in process memory, one set per worker.
+
+    QUERY_BUDGET=25              # queries per request before it is flagged
+    N_PLUS_ONE_THRESHOLD=5       # repeats of one statement before it is flagged
+"""
+import bisect
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+QUERY_BUDGET = int(os.getenv("QUERY_BUDGET", "25"))
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "5"))
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by label set."""
+
+    def __init__(self, name: str, help_text: str, buckets: Iterable[float]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # labels -> [per-bucket counts..., +Inf count], sum
+        self._series: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = [(key, list(counts), total[0]) for key, (counts, total) in self._series.items()]
+        for key, counts, total in sorted(series):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                lines.append(f"{self.name}_bucket{_labels(key + (('le', le),))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(key)} {cumulative}")
+        return lines
+
+
+class CounterMetric:
+    """Monotonic counter keyed by label set."""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._lock = threading.Lock()
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(tuple(sorted(labels.items())), 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        lines.extend(f"{self.name}{_labels(key)} {_number(value)}" for key, value in values)
+        return lines
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+def _labels(key: Labels) -> str:
+    if not key:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in key)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(key, escaped)) + "}"
+
+
+request_latency = Histogram(
+    "http_request_duration_seconds", "Request latency by route template.", LATENCY_BUCKETS
+)
+requests_total = CounterMetric("http_requests_total", "Requests by route template and status code.")
+request_queries = Histogram(
+    "db_queries_per_request", "Database statements executed per request.", QUERY_COUNT_BUCKETS
+)
+request_query_time = Histogram(
+    "db_query_seconds_per_request", "Time spent in database statements per request.", LATENCY_BUCKETS
+)
+query_budget_exceeded = CounterMetric(
+    "db_query_budget_exceeded_total", "Requests over QUERY_BUDGET or repeating one statement N_PLUS_ONE_THRESHOLD times."
+)
+
+
+@dataclass
+class QueryStats:
+    """Statements run on behalf of one request."""
+
+    count: int = 0
+    seconds: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        # Mutated from the request's worker thread; counts are advisory
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def most_repeated(self) -> Tuple[Optional[str], int]:
+        if not self.statements:
+            return None, 0
+        return self.statements.most_common(1)[0]
+
+
+current_queries: ContextVar[Optional[QueryStats]] = ContextVar("current_queries", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the execution context, which is dropped with the statement even
+    # when it raises and after_cursor_execute never fires
+    if context is not None:
+        context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_start", None)
+    stats = current_queries.get()
+    if stats is not None and started is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attribute ``engine``'s statements to the current request (idempotent)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def start_request():
+    """Begin collecting query stats for the current request; returns (stats, token)."""
+    stats = QueryStats()
+    return stats, current_queries.set(stats)
+
+
+def finish_request(token, stats: QueryStats, method: str, route: str, status: int, seconds: float) -> None:
+    """Record a finished request and flag it if it blew the query budget."""
+    current_queries.reset(token)
+    request_latency.observe(seconds, method=method, route=route)
+    requests_total.inc(method=method, route=route, status=str(status))
+    request_queries.observe(stats.count, route=route)
+    request_query_time.observe(stats.seconds, route=route)
+
+    statement, repeats = stats.most_repeated()
+    if stats.count > QUERY_BUDGET or repeats >= N_PLUS_ONE_THRESHOLD:
+        query_budget_exceeded.inc(route=route)
+        logger.warning(
+            "query budget exceeded",
+            extra={
+                "method": method,
+                "queries": stats.count,
+                "query_seconds": round(stats.seconds, 6),
+                "repeats": repeats,
+                "statement": statement,
+            },
+        )
+
+
+_POOL_COUNTERS = {"connects", "checkouts", "checkins", "timeouts", "wait_seconds_total"}
+
+
+def render(pool: Optional[dict] = None) -> str:
+    """All metrics in Prometheus text exposition format.
+
+    ``pool`` is an optional app.database.pool_metrics() snapshot, exported as
+    db_pool_* series.
+    """
+    lines: List[str] = []
+    for metric in (request_latency, requests_total, request_queries, request_query_time, query_budget_exceeded):
+        lines.extend(metric.render())
+    for name, value in sorted((pool or {}).items()):
+        kind = "counter" if name in _POOL_COUNTERS else "gauge"
+        lines.append(f"# TYPE db_pool_{name} {kind}")
+        lines.append(f"db_pool_{name} {_number(value)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,76 @@
+"""
+Per-request user context: the authenticated user together with their profile
+and onboarding state, loaded in a single joined query.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.exceptions import UnauthorizedException
+from app.database import get_async_db, get_db
+from app.models import User, Profile, OnboardingState
+# Tokens are signed by app.security (mounted via app.auth), so decode with it.
+from app.security import decode_access_token, oauth2_scheme
+
+
+@dataclass
+class UserContext:
+    user: User
+    profile: Optional[Profile]
+    onboarding: Optional[OnboardingState]
+
+
+def load_user_context(db: Session, user_id) -> Optional[UserContext]:
+    """Fetch user, profile and onboarding state in one SELECT with outer joins."""
+    user = (
+        db.query(User)
+        .options(joinedload(User.profile), joinedload(User.onboarding_state))
+        .filter(User.id == user_id)
+        .first()
+    )
+    if user is None:
+        return None
+    return UserContext(user=user, profile=user.profile, onboarding=user.onboarding_state)
+
+
+def get_user_context(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> UserContext:
+    """Dependency replacing get_current_user + separate Profile/OnboardingState queries."""
+    context = load_user_context(db, decode_access_token(token)["sub"])
+    if context is None:
+        raise UnauthorizedException(detail="Could not validate credentials")
+    return context
+
+
+async def load_user_context_async(db: AsyncSession, user_id) -> Optional[UserContext]:
+    """Async load_user_context: the same single joined SELECT on an AsyncSession."""
+    result = await db.execute(
+        select(User)
+        .options(joinedload(User.profile), joinedload(User.onboarding_state))
+        .where(User.id == int(user_id))
+    )
+    user = result.unique().scalar_one_or_none()
+    if user is None:
+        return None
+    return UserContext(user=user, profile=user.profile, onboarding=user.onboarding_state)
+
+
+async def get_user_context_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> UserContext:
+    """get_user_context with the lookup awaited on the event loop.
+
+    Everything on the returned context is already loaded, so sync handlers can
+    use it from the threadpool without further IO.
+    """
+    context = await load_user_context_async(db, decode_access_token(token)["sub"])
+    if context is None:
+        raise UnauthorizedException(detail="Could not validate credentials")
+    return context
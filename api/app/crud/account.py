@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
+from app.crud import balance_sheet as crud_balance_sheet
 from app.models import Account, User
 from app.schemas.account import AccountCreate, AccountUpdate
 
@@ -13,6 +14,7 @@ def create_account(db: Session, account: AccountCreate, user_id: int) -> Account
         user_id=user_id
     )
     db.add(db_account)
+    crud_balance_sheet.refresh_snapshot(db, user_id)
     db.commit()
     db.refresh(db_account)
     return db_account
@@ -41,6 +43,7 @@ def update_account(db: Session, account_id: int, account_in: AccountUpdate, user
     if db_account:
         for field, value in account_in.dict(exclude_unset=True).items():
             setattr(db_account, field, value)
+        crud_balance_sheet.refresh_snapshot(db, user_id)
         db.commit()
         db.refresh(db_account)
     return db_account
@@ -49,5 +52,6 @@ def delete_account(db: Session, account_id: int, user_id: int) -> Optional[Accou
     db_account = db.query(Account).filter(Account.id == account_id, Account.user_id == user_id).first()
     if db_account:
         db.delete(db_account)
+        crud_balance_sheet.refresh_snapshot(db, user_id)
         db.commit()
     return db_account
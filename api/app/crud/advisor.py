@@ -0,0 +1,120 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+
+from app.models import AdvisorClient, Goal, NetWorthSnapshot, OnboardingState, Profile, User
+
+ClientRow = Tuple[User, Optional[Profile], Optional[OnboardingState]]
+
+
+def link_client(db: Session, advisor_id: int, client_email: str) -> Optional[AdvisorClient]:
+    """Invite the user with ``client_email`` into the advisor's book; idempotent.
+
+    The link stays pending, and grants no access, until the client accepts it.
+    """
+    client = db.query(User).filter(User.email == client_email).first()
+    if client is None or client.id == advisor_id:
+        return None
+    link = db.query(AdvisorClient).filter_by(advisor_id=advisor_id, client_id=client.id).first()
+    if link is None:
+        link = AdvisorClient(advisor_id=advisor_id, client_id=client.id)
+        db.add(link)
+        db.commit()
+        db.refresh(link)
+    return link
+
+
+def unlink_client(db: Session, advisor_id: int, client_id: int) -> bool:
+    deleted = db.query(AdvisorClient).filter_by(advisor_id=advisor_id, client_id=client_id).delete()
+    db.commit()
+    return bool(deleted)
+
+
+def unlink_all(db: Session, advisor_id: int) -> None:
+    """Drop every link of an advisor, e.g. when they lose the advisor role. Does not commit."""
+    db.query(AdvisorClient).filter_by(advisor_id=advisor_id).delete()
+
+
+def get_invitations(db: Session, client_id: int) -> List[Tuple[AdvisorClient, User]]:
+    """Links to the client not yet accepted, with the inviting advisor."""
+    return [
+        tuple(row)
+        for row in db.execute(
+            select(AdvisorClient, User)
+            .join(User, User.id == AdvisorClient.advisor_id)
+            .where(AdvisorClient.client_id == client_id, AdvisorClient.accepted_at.is_(None))
+            .order_by(AdvisorClient.id)
+        ).all()
+    ]
+
+
+def accept_invitation(db: Session, client_id: int, advisor_id: int) -> Optional[AdvisorClient]:
+    """Grant the advisor access to the client's data; idempotent."""
+    link = db.query(AdvisorClient).filter_by(advisor_id=advisor_id, client_id=client_id).first()
+    if link is not None and link.accepted_at is None:
+        link.accepted_at = datetime.utcnow()
+        db.commit()
+    return link
+
+
+def has_client(db: Session, advisor_id: int, client_id: int) -> bool:
+    """True only for a link the client has accepted."""
+    return (
+        db.query(AdvisorClient.id)
+        .filter_by(advisor_id=advisor_id, client_id=client_id)
+        .filter(AdvisorClient.accepted_at.isnot(None))
+        .first()
+        is not None
+    )
+
+
+def get_client_page(db: Session, advisor_id: int, limit: int = 50, after: Optional[int] = None) -> List[ClientRow]:
+    """One page of the advisor's accepted clients with profile and onboarding state.
+
+    A single SELECT with outer joins, keyset-paginated on client id: pass the
+    last client id of the previous page as ``after``.
+    """
+    query = (
+        select(User, Profile, OnboardingState)
+        .join(AdvisorClient, AdvisorClient.client_id == User.id)
+        .outerjoin(Profile, Profile.user_id == User.id)
+        .outerjoin(OnboardingState, OnboardingState.user_id == User.id)
+        .where(AdvisorClient.advisor_id == advisor_id, AdvisorClient.accepted_at.isnot(None))
+        .order_by(User.id)
+        .limit(limit)
+    )
+    if after is not None:
+        query = query.where(User.id > after)
+    return [tuple(row) for row in db.execute(query).all()]
+
+
+def latest_snapshots(db: Session, user_ids: Sequence[int]) -> Dict[int, NetWorthSnapshot]:
+    """Newest net worth snapshot per user, for all ``user_ids`` in one query."""
+    if not user_ids:
+        return {}
+    newest = (
+        select(NetWorthSnapshot.user_id, func.max(NetWorthSnapshot.as_of).label("as_of"))
+        .where(NetWorthSnapshot.user_id.in_(user_ids))
+        .group_by(NetWorthSnapshot.user_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(NetWorthSnapshot).join(
+            newest, and_(NetWorthSnapshot.user_id == newest.c.user_id, NetWorthSnapshot.as_of == newest.c.as_of)
+        )
+    ).scalars()
+    return {row.user_id: row for row in rows}
+
+
+def goal_stats(db: Session, user_ids: Sequence[int]) -> Dict[int, Tuple[int, Optional[float]]]:
+    """(goal count, mean progress) per user, for all ``user_ids`` in one query."""
+    if not user_ids:
+        return {}
+    rows = db.execute(
+        select(Goal.user_id, func.count(Goal.id), func.avg(Goal.progress))
+        .where(Goal.user_id.in_(user_ids))
+        .group_by(Goal.user_id)
+    )
+    return {user_id: (count, progress) for user_id, count, progress in rows}
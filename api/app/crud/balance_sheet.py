@@ -0,0 +1,138 @@
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import case, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import Account, NetWorthSnapshot
+
+# Account types (case-insensitive) counted as liabilities; any account with a
+# negative balance is a liability too. Amounts are reported as positive totals.
+LIABILITY_TYPES = (
+    "credit card",
+    "loan",
+    "mortgage",
+    "student loan",
+    "auto loan",
+    "line of credit",
+    "liability",
+)
+# Label for accounts without a type
+UNTYPED = "other"
+
+
+def account_kind():
+    """SQL expression classifying each account row as "asset" or "liability"."""
+    balance = func.coalesce(Account.balance, 0.0)
+    return case(
+        (func.lower(Account.type).in_(LIABILITY_TYPES) | (balance < 0), "liability"),
+        else_="asset",
+    )
+
+
+def compute_balance_sheet(db: Session, user_id: int) -> Dict[str, Any]:
+    """Assets, liabilities and a per-type breakdown from one grouped aggregate."""
+    balance = func.coalesce(Account.balance, 0.0)
+    account_type = func.coalesce(Account.type, UNTYPED)
+    kind = account_kind().label("kind")
+    rows = (
+        db.query(kind, account_type.label("type"), func.sum(func.abs(balance)), func.count(Account.id))
+        .filter(Account.user_id == user_id)
+        .group_by(kind, account_type)
+        .order_by(kind, account_type)
+        .all()
+    )
+    breakdown = [
+        {"type": type_, "kind": kind_, "total": float(total or 0.0), "accounts": count}
+        for kind_, type_, total, count in rows
+    ]
+    assets = sum(line["total"] for line in breakdown if line["kind"] == "asset")
+    liabilities = sum(line["total"] for line in breakdown if line["kind"] == "liability")
+    return {
+        "as_of": datetime.utcnow().date().isoformat(),
+        "total_assets": assets,
+        "total_liabilities": liabilities,
+        "net_worth": assets - liabilities,
+        "breakdown": breakdown,
+    }
+
+
+def refresh_snapshot(db: Session, user_id: int) -> Dict[str, Any]:
+    """Recompute the user's balance sheet and upsert today's snapshot row.
+
+    Call after account writes, before commit (pending changes are flushed
+    first).
+    """
+    db.flush()
+    sheet = compute_balance_sheet(db, user_id)
+    values = {
+        "user_id": user_id,
+        "as_of": date.fromisoformat(sheet["as_of"]),
+        "total_assets": sheet["total_assets"],
+        "total_liabilities": sheet["total_liabilities"],
+        "net_worth": sheet["net_worth"],
+        "breakdown": sheet["breakdown"],
+        "updated_at": datetime.utcnow(),
+    }
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        stmt = (pg_insert if dialect == "postgresql" else sqlite_insert)(NetWorthSnapshot.__table__).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "as_of"],
+            set_={name: stmt.excluded[name] for name in values if name not in ("user_id", "as_of")},
+        )
+        db.execute(stmt)
+        return sheet
+    row = (
+        db.query(NetWorthSnapshot)
+        .filter_by(user_id=user_id, as_of=values["as_of"])
+        .with_for_update()
+        .first()
+    )
+    if row is None:
+        db.add(NetWorthSnapshot(**values))
+    else:
+        for name, value in values.items():
+            setattr(row, name, value)
+    return sheet
+
+
+def _from_row(row: NetWorthSnapshot) -> Dict[str, Any]:
+    return {
+        "as_of": row.as_of.isoformat(),
+        "total_assets": row.total_assets,
+        "total_liabilities": row.total_liabilities,
+        "net_worth": row.net_worth,
+        "breakdown": row.breakdown or [],
+    }
+
+
+def get_balance_sheet(db: Session, user_id: int) -> Dict[str, Any]:
+    """Latest balance sheet: the newest snapshot row, else computed.
+
+    The snapshot row is the cache: account writes keep it current in the same
+    transaction, so every worker reads the latest totals with one indexed
+    lookup. Only the computed path (a user with no snapshot yet) writes; it
+    leaves the commit to the caller.
+    """
+    row = (
+        db.query(NetWorthSnapshot)
+        .filter(NetWorthSnapshot.user_id == user_id)
+        .order_by(NetWorthSnapshot.as_of.desc())
+        .first()
+    )
+    return _from_row(row) if row is not None else refresh_snapshot(db, user_id)
+
+
+def get_net_worth_history(
+    db: Session, user_id: int, start: Optional[date] = None, end: Optional[date] = None
+) -> List[NetWorthSnapshot]:
+    """Daily snapshots in date order; days without account changes are absent."""
+    query = db.query(NetWorthSnapshot).filter(NetWorthSnapshot.user_id == user_id)
+    if start is not None:
+        query = query.filter(NetWorthSnapshot.as_of >= start)
+    if end is not None:
+        query = query.filter(NetWorthSnapshot.as_of <= end)
+    return query.order_by(NetWorthSnapshot.as_of).all()
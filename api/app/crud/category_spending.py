@@ -0,0 +1,90 @@
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import CategorySpending, Transaction
+
+# Rollup bucket for transactions without a category (NULLs would never conflict)
+UNCATEGORIZED = "uncategorized"
+
+Key = Tuple[date, str]
+
+
+def month_start(when: datetime) -> date:
+    return date(when.year, when.month, 1)
+
+
+def rollup_key(tx: Transaction) -> Optional[Key]:
+    if tx.date is None:
+        return None
+    return month_start(tx.date), tx.category or UNCATEGORIZED
+
+
+def apply_deltas(db: Session, user_id: int, deltas: Dict[Key, Tuple[float, int]]) -> None:
+    """Add (amount, count) deltas to the user's monthly category totals.
+
+    Uses a single-statement upsert on Postgres/SQLite so concurrent writers
+    can't lose updates. Does not commit; callers commit with their own write.
+    """
+    if not deltas:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        # One statement for all keys, executed as a single executemany
+        table = CategorySpending.__table__
+        stmt = (pg_insert if dialect == "postgresql" else sqlite_insert)(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "month", "category"],
+            set_={
+                "total": table.c.total + stmt.excluded.total,
+                "count": table.c["count"] + stmt.excluded["count"],
+            },
+        )
+        db.execute(stmt, [
+            {"user_id": user_id, "month": month, "category": category, "total": amount, "count": count}
+            for (month, category), (amount, count) in deltas.items()
+        ])
+        return
+    for (month, category), (amount, count) in deltas.items():
+        row = (
+            db.query(CategorySpending)
+            .filter_by(user_id=user_id, month=month, category=category)
+            .with_for_update()
+            .first()
+        )
+        if row is None:
+            db.add(CategorySpending(user_id=user_id, month=month, category=category, total=amount, count=count))
+        else:
+            row.total += amount
+            row.count += count
+
+
+def apply_transaction(db: Session, tx: Transaction, sign: int = 1) -> None:
+    """Add (sign=1) or remove (sign=-1) one transaction's contribution."""
+    key = rollup_key(tx)
+    if key is not None:
+        apply_deltas(db, tx.user_id, {key: (sign * (tx.amount or 0.0), sign)})
+
+
+def collect_deltas(rows: Iterable[dict]) -> Dict[Key, Tuple[float, int]]:
+    """Aggregate raw transaction dicts (e.g. one import batch) into rollup deltas."""
+    deltas: Dict[Key, List] = defaultdict(lambda: [0.0, 0])
+    for row in rows:
+        if row.get("date") is None:
+            continue
+        delta = deltas[(month_start(row["date"]), row.get("category") or UNCATEGORIZED)]
+        delta[0] += row.get("amount") or 0.0
+        delta[1] += 1
+    return {key: (amount, count) for key, (amount, count) in deltas.items()}
+
+
+def get_monthly_spending(db: Session, user_id: int, month: date) -> List[CategorySpending]:
+    return (
+        db.query(CategorySpending)
+        .filter(CategorySpending.user_id == user_id, CategorySpending.month == month)
+        .all()
+    )
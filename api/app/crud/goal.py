@@ -1,12 +1,49 @@
-from typing import List, Optional
+import math
+import re
+from datetime import date
+from typing import Any, Dict, List, Optional
+import numpy as np
 from sqlalchemy.orm import Session
 
+from app.crud import projection as crud_projection
 from app.models import Goal
 from app.schemas.goal import GoalCreate, GoalUpdate
+from compute.goals import DEFAULT_CONFIDENCE, evaluate_goals, required_contributions
+from compute.monte_carlo import assumptions_for_risk_level, simulate_growth
+from compute.projection import DEFAULT_YEARS
+
+# Paths in the return matrix shared by all of a user's goals
+FEASIBILITY_PATHS = 2_000
+# Upper bound on paths x goals per request
+MAX_FEASIBILITY_CELLS = 1_000_000
+# Goals further out are evaluated at this horizon
+MAX_GOAL_YEARS = 100
+
+
+# First number in a free-text amount and an optional scale word after it
+_AMOUNT = re.compile(r"([-+]?\d[\d,]*(?:\.\d+)?)\s*(k|thousand|m|mn|million|b|bn|billion)?\b", re.IGNORECASE)
+_SCALES = {"k": 1e3, "thousand": 1e3, "m": 1e6, "mn": 1e6, "million": 1e6, "b": 1e9, "bn": 1e9, "billion": 1e9}
+
+
+def parse_amount(value: Optional[str]) -> Optional[float]:
+    """'Ksh. 50,000' -> 50000.0, '1.5M' -> 1500000.0; None when the string holds no number."""
+    if value is None:
+        return None
+    match = _AMOUNT.search(str(value))
+    if match is None:
+        return None
+    number, scale = match.groups()
+    return float(number.replace(",", "")) * (_SCALES[scale.lower()] if scale else 1)
+
+
+def _sync_amounts(goal: Goal) -> None:
+    goal.target_amount = parse_amount(goal.target)
+    goal.current_amount = parse_amount(goal.current)
 
 
 def create_goal(db: Session, data: GoalCreate, user_id: int) -> Goal:
     goal = Goal(**data.dict(), user_id=user_id)
+    _sync_amounts(goal)
     db.add(goal)
     db.commit()
     db.refresh(goal)
@@ -37,6 +74,7 @@ def update_goal(db: Session, goal_id: int, data: GoalUpdate, user_id: int) -> Op
     if goal:
         for field, value in data.dict(exclude_unset=True).items():
             setattr(goal, field, value)
+        _sync_amounts(goal)
         db.commit()
         db.refresh(goal)
     return goal
@@ -48,3 +86,83 @@ def delete_goal(db: Session, goal_id: int, user_id: int) -> Optional[Goal]:
         db.delete(goal)
         db.commit()
     return goal
+
+
+def _years_until(target_date: Optional[str], today: date) -> Optional[int]:
+    """Whole years from today to an ISO ``target_date``, rounded up; None if unparseable."""
+    try:
+        target = date.fromisoformat(target_date[:10])
+    except (TypeError, ValueError):
+        return None
+    return max(math.ceil((target - today).days / 365.25), 0)
+
+
+def goal_feasibility(
+    db: Session,
+    user_id: int,
+    confidence: float = DEFAULT_CONFIDENCE,
+    n_paths: int = FEASIBILITY_PATHS,
+) -> List[Dict[str, Any]]:
+    """Required contribution, success odds and projected completion for every goal.
+
+    The user's monthly surplus (income less budgeted expenses) is shared
+    between dated goals in proportion to what each requires. One return
+    matrix, seeded with the user id and drawn at the user's risk level, is
+    simulated once and reused by all goals.
+
+    Raises ValueError when ``n_paths`` times the number of goals exceeds
+    MAX_FEASIBILITY_CELLS.
+    """
+    goals = (
+        db.query(Goal.id, Goal.name, Goal.target_amount, Goal.current_amount, Goal.target_date)
+        .filter(Goal.user_id == user_id, Goal.target_amount.isnot(None))
+        .order_by(Goal.id)
+        .all()
+    )
+    if not goals:
+        return []
+    if n_paths * len(goals) > MAX_FEASIBILITY_CELLS:
+        raise ValueError(
+            f"{n_paths} paths for {len(goals)} goals exceeds {MAX_FEASIBILITY_CELLS} simulated goal paths; "
+            "request fewer paths"
+        )
+    inputs = crud_projection.load_inputs(db, [user_id])[user_id]
+    today = date.today()
+    horizons = [_years_until(goal.target_date, today) for goal in goals]
+    dated = np.array([years is not None for years in horizons])
+    # Undated goals are evaluated at horizon 0 and their horizon results dropped
+    at = [min(years or 0, MAX_GOAL_YEARS) for years in horizons]
+    current = [goal.current_amount or 0.0 for goal in goals]
+    targets = [goal.target_amount for goal in goals]
+
+    mean_return, volatility = assumptions_for_risk_level(inputs["risk_level"])
+    growth, deposits = simulate_growth(max([DEFAULT_YEARS] + at), mean_return, volatility, n_paths=n_paths, seed=user_id)
+
+    required = required_contributions(current, targets, at, growth, deposits, confidence=confidence)
+    required = np.where(dated, required, np.nan)
+    surplus = max(inputs["annual_income"] - inputs["annual_expenses"], 0.0)
+    affordable = np.isfinite(required)
+    total = required[affordable].sum()
+    planned = np.zeros(len(goals))
+    if total > 0:
+        planned[affordable] = np.minimum(required[affordable], surplus * required[affordable] / total)
+    result = evaluate_goals(current, targets, at, planned, growth, deposits)
+
+    dob = inputs["date_of_birth"]
+    age = today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day)) if dob else None
+    feasibility = []
+    for i, goal in enumerate(goals):
+        completion = int(result["completion_years"][i])
+        feasibility.append({
+            "goal_id": goal.id,
+            "name": goal.name,
+            "target_amount": goal.target_amount,
+            "current_amount": goal.current_amount,
+            "years_to_target": horizons[i],
+            "required_monthly_contribution": float(required[i]) / 12 if affordable[i] else None,
+            "planned_monthly_contribution": float(planned[i]) / 12,
+            "success_probability": float(result["success_probability"][i]) if dated[i] else None,
+            "projected_completion_years": completion if completion >= 0 else None,
+            "projected_completion_age": age + completion if age is not None and completion >= 0 else None,
+        })
+    return feasibility
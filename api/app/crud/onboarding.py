@@ -0,0 +1,125 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import JSON, String, Text, case, cast, func, literal, type_coerce
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import OnboardingState
+
+# Onboarding step number -> OnboardingState JSON column holding its payload
+STEP_COLUMNS = {
+    1: "personal_data",
+    2: "risk_data",
+    3: "financial_data",
+    4: "goals_data",
+    5: "preferences_data",
+}
+
+# Stored JSON text that counts as "no data" (mirrors Python truthiness of the payload)
+_EMPTY_JSON = ("null", "{}", "[]", '""')
+
+
+def completed_steps_for(state: Dict[str, Any]) -> List[int]:
+    """Step 1 is always complete; later steps once their payload is non-empty."""
+    return [1] + [step for step, column in STEP_COLUMNS.items() if step > 1 and state.get(column)]
+
+
+def apply_patch(current: Optional[dict], patch: Dict[str, Any]) -> dict:
+    """Top-level merge patch: set each field, or remove it when the value is None."""
+    merged = dict(current or {})
+    for key, value in patch.items():
+        if value is None:
+            merged.pop(key, None)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _patch_expr(dialect: str, column, patch: Dict[str, Any]):
+    """SQL equivalent of apply_patch(<stored column>, patch)."""
+    if dialect == "postgresql":
+        merged = func.coalesce(cast(column, JSONB), cast(literal("{}"), JSONB)).op("||")(
+            cast(literal(json.dumps({k: v for k, v in patch.items() if v is not None})), JSONB)
+        )
+        removed = [key for key, value in patch.items() if value is None]
+        if removed:
+            merged = merged.op("-")(cast(literal(removed, ARRAY(Text)), ARRAY(Text)))
+        return cast(merged, JSON)
+    # SQLite's json_patch merges nested objects recursively; nulling object-valued
+    # keys first makes them replace, matching apply_patch.
+    target = func.coalesce(column, "{}")
+    nested = {key: None for key, value in patch.items() if isinstance(value, dict)}
+    if nested:
+        target = func.json_patch(target, json.dumps(nested))
+    return func.json_patch(target, json.dumps(patch))
+
+
+def _has_data(expr):
+    return expr.isnot(None) & cast(expr, String).notin_(_EMPTY_JSON)
+
+
+def save_step(
+    db: Session, user_id: int, step_number: int, data: Dict[str, Any], patch: bool = False
+) -> Dict[str, Any]:
+    """Store one step's payload and the derived progress fields.
+
+    With ``patch`` the payload is merged into the stored step (see apply_patch)
+    instead of replacing it. On Postgres/SQLite this is a single upsert that
+    recomputes completed_steps and current_step in SQL and returns them. Does
+    not commit.
+    """
+    column = STEP_COLUMNS[step_number]
+    now = datetime.utcnow()
+    dialect = db.get_bind().dialect.name
+    if dialect not in ("postgresql", "sqlite"):
+        return _save_step_orm(db, user_id, step_number, data, patch, now)
+
+    table = OnboardingState.__table__
+    value = apply_patch(None, data) if patch else data
+    stmt = (pg_insert if dialect == "postgresql" else sqlite_insert)(table).values(
+        user_id=user_id,
+        current_step=step_number,
+        completed_steps=completed_steps_for({column: value}),
+        is_complete=False,
+        created_at=now,
+        updated_at=now,
+        **{column: value},
+    )
+    new_value = _patch_expr(dialect, table.c[column], data) if patch else stmt.excluded[column]
+
+    # completed_steps as JSON text: "[1" + ",2" if step 2 has data ... + "]"
+    steps = literal("[1")
+    for step, name in STEP_COLUMNS.items():
+        if step > 1:
+            present = _has_data(new_value if name == column else table.c[name])
+            steps = steps + case((present, f",{step}"), else_="")
+    steps = steps + "]"
+
+    current = func.coalesce(table.c.current_step, 1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={
+            column: new_value,
+            "completed_steps": cast(steps, JSON) if dialect == "postgresql" else type_coerce(steps, JSON),
+            "current_step": case((current > step_number, current), else_=step_number),
+            "updated_at": now,
+        },
+    ).returning(table.c.current_step, table.c.completed_steps, table.c.is_complete)
+    return dict(db.execute(stmt).mappings().one())
+
+
+def _save_step_orm(db, user_id, step_number, data, patch, now):
+    state = db.query(OnboardingState).filter_by(user_id=user_id).with_for_update().first()
+    if state is None:
+        state = OnboardingState(user_id=user_id, current_step=1, completed_steps=[], is_complete=False)
+        db.add(state)
+    column = STEP_COLUMNS[step_number]
+    setattr(state, column, apply_patch(getattr(state, column), data) if patch else data)
+    state.current_step = max(state.current_step or 1, step_number)
+    state.completed_steps = completed_steps_for({name: getattr(state, name) for name in STEP_COLUMNS.values()})
+    state.updated_at = now
+    db.flush()
+    return {"current_step": state.current_step, "completed_steps": state.completed_steps, "is_complete": state.is_complete}
@@ -0,0 +1,128 @@
+from collections import defaultdict
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.crud.balance_sheet import account_kind
+from app.models import Account, ExpenseCategory, IncomeSource, Profile
+from compute.monte_carlo import assumptions_for_risk_level
+from compute.projection import (
+    DEFAULT_INCOME_GROWTH,
+    DEFAULT_INFLATION,
+    DEFAULT_YEARS,
+    annualize,
+    project_batch,
+)
+
+# ExpenseCategory.budgeted_amount is a monthly budget
+EXPENSE_PERIODS_PER_YEAR = 12
+
+
+def load_inputs(db: Session, user_ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
+    """Projection inputs for every user in ``user_ids`` from four grouped queries.
+
+    Income is the annualised sum of the user's income sources, falling back to
+    ``Profile.annual_income`` when they have none. Raises ValueError for an
+    income source with an unknown frequency.
+    """
+    inputs = {
+        user_id: {
+            "annual_income": 0.0,
+            "annual_expenses": 0.0,
+            "assets": 0.0,
+            "liabilities": 0.0,
+            "risk_level": None,
+            "date_of_birth": None,
+        }
+        for user_id in user_ids
+    }
+    if not inputs:
+        return inputs
+    ids = list(inputs)
+
+    payments = defaultdict(lambda: ([], []))
+    for user_id, frequency, amount in db.execute(
+        select(IncomeSource.user_id, IncomeSource.frequency, func.sum(IncomeSource.amount))
+        .where(IncomeSource.user_id.in_(ids))
+        .group_by(IncomeSource.user_id, IncomeSource.frequency)
+    ):
+        payments[user_id][0].append(amount)
+        payments[user_id][1].append(frequency)
+    for user_id, (amounts, frequencies) in payments.items():
+        inputs[user_id]["annual_income"] = annualize(amounts, frequencies)
+
+    for user_id, budgeted in db.execute(
+        select(ExpenseCategory.user_id, func.sum(ExpenseCategory.budgeted_amount))
+        .where(ExpenseCategory.user_id.in_(ids))
+        .group_by(ExpenseCategory.user_id)
+    ):
+        inputs[user_id]["annual_expenses"] = (budgeted or 0.0) * EXPENSE_PERIODS_PER_YEAR
+
+    kind = account_kind().label("kind")
+    for user_id, kind_, total in db.execute(
+        select(Account.user_id, kind, func.sum(func.abs(func.coalesce(Account.balance, 0.0))))
+        .where(Account.user_id.in_(ids))
+        .group_by(Account.user_id, kind)
+    ):
+        inputs[user_id]["assets" if kind_ == "asset" else "liabilities"] = float(total or 0.0)
+
+    for user_id, annual_income, risk_level, date_of_birth in db.execute(
+        select(Profile.user_id, Profile.annual_income, Profile.risk_level, Profile.date_of_birth)
+        .where(Profile.user_id.in_(ids))
+    ):
+        inputs[user_id].update(risk_level=risk_level, date_of_birth=date_of_birth)
+        if user_id not in payments:
+            inputs[user_id]["annual_income"] = annual_income or 0.0
+    return inputs
+
+
+def project_users(
+    db: Session,
+    user_ids: Sequence[int],
+    years: int = DEFAULT_YEARS,
+    income_growth: float = DEFAULT_INCOME_GROWTH,
+    inflation: float = DEFAULT_INFLATION,
+    expected_return: Optional[float] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """Net-worth projections for many users: four queries and one vectorised pass.
+
+    Without an ``expected_return`` each user's portfolio earns the mean return
+    for their risk level.
+    """
+    inputs = load_inputs(db, user_ids)
+    if not inputs:
+        return {}
+    ids = list(inputs)
+    columns = {name: [inputs[user_id][name] for user_id in ids] for name in inputs[ids[0]]}
+    returns = [
+        assumptions_for_risk_level(level)[0] if expected_return is None else expected_return
+        for level in columns["risk_level"]
+    ]
+    result = project_batch(
+        columns["annual_income"],
+        columns["annual_expenses"],
+        columns["assets"],
+        columns["liabilities"],
+        years=years,
+        income_growth=income_growth,
+        inflation=inflation,
+        expected_return=returns,
+    )
+
+    projections = {}
+    for row, user_id in enumerate(ids):
+        projections[user_id] = {
+            **{name: inputs[user_id][name] for name in ("annual_income", "annual_expenses", "assets", "liabilities")},
+            "assumptions": {
+                "income_growth": income_growth,
+                "inflation": inflation,
+                "expected_return": returns[row],
+            },
+            "income": result["income"][row].tolist(),
+            "expenses": result["expenses"][row].tolist(),
+            "savings": result["savings"][row].tolist(),
+            "net_worth": result["net_worth"][row].tolist(),
+        }
+    return projections
+
@@ -1,9 +1,26 @@
-from typing import List, Optional
+import base64
+import json
+from typing import Iterable, List, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import Select, and_, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models import Transaction, Account
 from app.schemas.transaction import TransactionCreate, TransactionUpdate
+from app.crud import category_spending as crud_spending
+
+# Columns clients may sort by; anything else is rejected rather than getattr'd.
+SORTABLE_FIELDS = {
+    "date": Transaction.date,
+    "amount": Transaction.amount,
+    "description": Transaction.description,
+    "category": Transaction.category,
+    "id": Transaction.id,
+}
+
+# Fields whose change moves a transaction between category_spending buckets
+ROLLUP_FIELDS = {"date", "amount", "category"}
 
 
 def create_transaction(db: Session, tx_in: TransactionCreate, user_id: int) -> Optional[Transaction]:
@@ -12,39 +29,142 @@ def create_transaction(db: Session, tx_in: TransactionCreate, user_id: int) -> O
         return None
     tx = Transaction(**tx_in.dict(), user_id=user_id)
     db.add(tx)
+    crud_spending.apply_transaction(db, tx)
     db.commit()
     db.refresh(tx)
     return tx
 
 
+def bulk_create_transactions(db: Session, rows: Iterable[dict], user_id: int, account_id: int, account_name: Optional[str] = None, batch_size: int = 1000) -> int:
+    """Insert already-validated rows with one multi-row INSERT per batch.
+
+    The caller is responsible for checking that ``account_id`` belongs to
+    ``user_id``. The whole import is one transaction: batches bound memory,
+    not durability, so a failure part-way rolls everything back (and
+    re-raises) rather than leaving an unreported partial import. Returns the
+    number of rows inserted.
+    """
+    inserted = 0
+    batch: List[dict] = []
+    try:
+        for row in rows:
+            batch.append({**row, "user_id": user_id, "account_id": account_id, "account": account_name})
+            if len(batch) >= batch_size:
+                _insert_batch(db, batch, user_id)
+                inserted += len(batch)
+                batch = []
+        if batch:
+            _insert_batch(db, batch, user_id)
+            inserted += len(batch)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return inserted
+
+
+def _insert_batch(db: Session, batch: List[dict], user_id: int) -> None:
+    db.execute(insert(Transaction), batch)
+    crud_spending.apply_deltas(db, user_id, crud_spending.collect_deltas(batch))
+
+
 def get_transaction(db: Session, tx_id: int, user_id: int) -> Optional[Transaction]:
     return db.query(Transaction).filter(Transaction.id == tx_id, Transaction.user_id == user_id).first()
 
 
-def get_transactions(db: Session, user_id: int, skip: int = 0, limit: int = 100, category: str = None, start_date: datetime = None, end_date: datetime = None, sort_by: str = None, sort_order: str = "asc") -> List[Transaction]:
-    query = db.query(Transaction).filter(Transaction.user_id == user_id)
+def transactions_query(user_id: int, skip: int = 0, limit: int = 100, category: str = None, start_date: datetime = None, end_date: datetime = None, sort_by: str = None, sort_order: str = "asc", cursor: str = None) -> Select:
+    """SELECT for a page of a user's transactions; shared by the sync and async paths.
+
+    Without ``sort_by`` (or with ``sort_by="date"``) rows are ordered by
+    (date, id), and ``cursor`` - as returned by ``encode_cursor`` for the last
+    row of the previous page - selects the next page by keyset instead of
+    OFFSET. Undated rows (dates the import could not parse) sort after every
+    dated row, before them when descending, whatever the database's default.
+    Raises ValueError for a non-whitelisted sort field or order, or a cursor
+    combined with another sort field.
+    """
+    if sort_by is not None and sort_by not in SORTABLE_FIELDS:
+        raise ValueError(f"sort_by must be one of {sorted(SORTABLE_FIELDS)}")
+    if sort_order not in ("asc", "desc"):
+        raise ValueError("sort_order must be 'asc' or 'desc'")
+    keyset = sort_by in (None, "date")
+    if cursor is not None and not keyset:
+        raise ValueError("cursor pagination requires sorting by date")
+
+    query = select(Transaction).where(Transaction.user_id == user_id)
 
     if category:
-        query = query.filter(Transaction.category.ilike(f"%{category}%"))
+        query = query.where(Transaction.category.ilike(f"%{category}%"))
     if start_date:
-        query = query.filter(Transaction.date >= start_date)
+        query = query.where(Transaction.date >= start_date)
     if end_date:
-        query = query.filter(Transaction.date <= end_date)
+        query = query.where(Transaction.date <= end_date)
+
+    descending = sort_order == "desc"
+    if keyset:
+        if cursor is not None:
+            query = query.where(_after_cursor(*decode_cursor(cursor), descending))
+            skip = 0
+        date_order = Transaction.date.desc().nulls_first() if descending else Transaction.date.asc().nulls_last()
+        query = query.order_by(date_order, Transaction.id.desc() if descending else Transaction.id.asc())
+    else:
+        order = (SORTABLE_FIELDS[sort_by], Transaction.id)
+        query = query.order_by(*(column.desc() if descending else column.asc() for column in order))
+
+    return query.offset(skip).limit(limit)
+
+
+def _after_cursor(last_date: Optional[datetime], last_id: int, descending: bool):
+    """Keyset condition for rows after (last_date, last_id), NULL dates sorting last ascending."""
+    undated = Transaction.date.is_(None)
+    if descending:
+        if last_date is None:
+            return or_(and_(undated, Transaction.id < last_id), Transaction.date.isnot(None))
+        return or_(Transaction.date < last_date, and_(Transaction.date == last_date, Transaction.id < last_id))
+    if last_date is None:
+        return and_(undated, Transaction.id > last_id)
+    return or_(
+        Transaction.date > last_date,
+        and_(Transaction.date == last_date, Transaction.id > last_id),
+        undated,
+    )
+
+
+def get_transactions(db: Session, user_id: int, **filters) -> List[Transaction]:
+    """List a user's transactions; see transactions_query for the filters."""
+    return db.scalars(transactions_query(user_id, **filters)).all()
+
+
+async def get_transactions_async(db: AsyncSession, user_id: int, **filters) -> List[Transaction]:
+    """get_transactions on an AsyncSession."""
+    return (await db.scalars(transactions_query(user_id, **filters))).all()
+
+
+def encode_cursor(tx: Transaction) -> str:
+    """Opaque keyset cursor pointing just past ``tx`` in (date, id) order."""
+    payload = json.dumps([tx.date.isoformat() if tx.date else None, tx.id]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
 
-    if sort_by:
-        if sort_order == "desc":
-            query = query.order_by(getattr(Transaction, sort_by).desc())
-        else:
-            query = query.order_by(getattr(Transaction, sort_by).asc())
 
-    return query.offset(skip).limit(limit).all()
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    try:
+        last_date, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (None if last_date is None else datetime.fromisoformat(last_date)), int(last_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
 
 
 def update_transaction(db: Session, tx_id: int, tx_in: TransactionUpdate, user_id: int) -> Optional[Transaction]:
     tx = db.query(Transaction).filter(Transaction.id == tx_id, Transaction.user_id == user_id).first()
     if tx:
-        for field, value in tx_in.dict(exclude_unset=True).items():
+        changes = tx_in.dict(exclude_unset=True)
+        moves_rollup = bool(ROLLUP_FIELDS.intersection(changes))
+        if moves_rollup:
+            crud_spending.apply_transaction(db, tx, sign=-1)
+        for field, value in changes.items():
             setattr(tx, field, value)
+        if moves_rollup:
+            crud_spending.apply_transaction(db, tx)
         db.commit()
         db.refresh(tx)
     return tx
@@ -53,6 +173,7 @@ def update_transaction(db: Session, tx_id: int, tx_in: TransactionUpdate, user_i
 def delete_transaction(db: Session, tx_id: int, user_id: int) -> Optional[Transaction]:
     tx = db.query(Transaction).filter(Transaction.id == tx_id, Transaction.user_id == user_id).first()
     if tx:
+        crud_spending.apply_transaction(db, tx, sign=-1)
         db.delete(tx)
         db.commit()
     return tx
@@ -1,30 +1,210 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 import os
+import threading
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://user:password@db:5432/app")
 
-# Use a dictionary to store engines for persistence in tests
-_engines = {}
+# Async drivers used for the async engine when ASYNC_DATABASE_URL is not set
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+# In-memory SQLite is opened as a named shared-cache database so the sync and
+# async engines (necessarily separate connections) see the same tables.
+MEMORY_SQLITE_DATABASE = "file:app_memdb"
+MEMORY_SQLITE_QUERY = {"mode": "memory", "cache": "shared", "uri": "true"}
+
+# Pool tuning, per worker process: with N uvicorn workers the database sees up
+# to N * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+# Postgres only; 0 disables
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+# psycopg2 only: "values_only" (SQLAlchemy default) or "values_plus_batch"
+DB_EXECUTEMANY_MODE = os.getenv("DB_EXECUTEMANY_MODE")
+# Connections opened per pool at startup (see app.startup)
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", "2"))
+
+
+class PoolMetrics:
+    """Connection pool counters plus time spent waiting for a free connection."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
 
-def get_engine():
-    if SQLALCHEMY_DATABASE_URL.startswith("sqlite:///:memory:"):
-        if "sqlite_memory" not in _engines:
-            _engines["sqlite_memory"] = create_engine(
-                SQLALCHEMY_DATABASE_URL,
-                connect_args={"check_same_thread": False},
-                poolclass=StaticPool,
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self, pool) -> dict:
+        data = {
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
+        if isinstance(pool, QueuePool):
+            data.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                idle=pool.checkedin(),
             )
-        return _engines["sqlite_memory"]
-    elif SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
-        return create_engine(
-            SQLALCHEMY_DATABASE_URL,
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool,
+        return data
+
+
+class _WaitTimingMixin:
+    """Reports how long each pool checkout waited for a connection."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _count(metrics: PoolMetrics, name: str):
+    def listener(*args):
+        with metrics._lock:
+            setattr(metrics, name, getattr(metrics, name) + 1)
+    return listener
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def _engine_options(url: str, async_: bool = False):
+    """Pool and connect arguments for ``url`` from the DB_* settings."""
+    parsed = make_url(url)
+    backend, driver = parsed.get_backend_name(), parsed.get_driver_name()
+    kwargs = {"pool_pre_ping": DB_POOL_PRE_PING}
+    connect_args = {}
+
+    if backend == "sqlite":
+        connect_args["check_same_thread"] = False
+        if _is_memory_sqlite(url):
+            # One shared connection keeps the in-memory database alive
+            parsed = parsed.set(database=MEMORY_SQLITE_DATABASE, query=MEMORY_SQLITE_QUERY)
+            kwargs["poolclass"] = StaticPool
+    if "poolclass" not in kwargs:
+        kwargs.update(
+            poolclass=InstrumentedAsyncQueuePool if async_ else InstrumentedQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
         )
-    else:
-        return create_engine(SQLALCHEMY_DATABASE_URL)
+    if backend == "postgresql":
+        if DB_STATEMENT_TIMEOUT_MS and driver == "asyncpg":
+            connect_args["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+        elif DB_STATEMENT_TIMEOUT_MS:
+            connect_args["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+        if driver == "psycopg2" and DB_EXECUTEMANY_MODE:
+            kwargs["executemany_mode"] = DB_EXECUTEMANY_MODE
+    return parsed, connect_args, kwargs
+
+
+def _instrument(url: str, engine: Engine) -> None:
+    metrics = PoolMetrics()
+    engine.pool.metrics = metrics
+    _metrics[url] = metrics
+    event.listen(engine, "connect", _count(metrics, "connects"))
+    event.listen(engine, "checkout", _count(metrics, "checkouts"))
+    event.listen(engine, "checkin", _count(metrics, "checkins"))
+
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL) -> Engine:
+    """Build an engine for ``url`` with the env-driven pool and driver settings."""
+    target, connect_args, kwargs = _engine_options(url)
+    engine = create_engine(target, connect_args=connect_args, **kwargs)
+    _instrument(url, engine)
+    return engine
+
+
+def async_database_url(url: str = SQLALCHEMY_DATABASE_URL) -> str:
+    """ASYNC_DATABASE_URL, or ``url`` with its driver swapped for the async one."""
+    override = os.getenv("ASYNC_DATABASE_URL")
+    if override:
+        return override
+    parsed = make_url(url)
+    return parsed.set(drivername=ASYNC_DRIVERS[parsed.get_backend_name()]).render_as_string(hide_password=False)
+
+
+def create_async_db_engine(url: str) -> AsyncEngine:
+    """Async counterpart of create_db_engine; ``url`` must name an async driver."""
+    target, connect_args, kwargs = _engine_options(url, async_=True)
+    engine = create_async_engine(target, connect_args=connect_args, **kwargs)
+    _instrument(url, engine.sync_engine)
+    return engine
+
+
+# One engine (and pool) per URL for the whole process
+_engines: Dict[str, Engine] = {}
+_async_engines: Dict[str, AsyncEngine] = {}
+_metrics: Dict[str, PoolMetrics] = {}
+
+
+def get_engine(url: str = SQLALCHEMY_DATABASE_URL) -> Engine:
+    if url not in _engines:
+        _engines[url] = create_db_engine(url)
+    return _engines[url]
+
+
+def get_async_engine(url: Optional[str] = None) -> AsyncEngine:
+    url = url or async_database_url()
+    if url not in _async_engines:
+        _async_engines[url] = create_async_db_engine(url)
+    return _async_engines[url]
+
+
+def pool_metrics(url: str = SQLALCHEMY_DATABASE_URL) -> dict:
+    """Pool checkout/wait counters and current occupancy for ``url``'s engine."""
+    engine = _async_engines[url].sync_engine if url in _async_engines else get_engine(url)
+    return _metrics[url].snapshot(engine.pool)
+
 
 engine = get_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -36,3 +216,45 @@ def get_db():
     finally:
         db.close()
 
+
+# Async sessions don't expire on commit: attribute access after commit would
+# otherwise need implicit IO, which AsyncSession can't do.
+async_engine = get_async_engine()
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_engines() -> None:
+    """Close pooled connections at shutdown.
+
+    In-memory SQLite is left alone: its one pooled connection is the database.
+    """
+    if not _is_memory_sqlite(SQLALCHEMY_DATABASE_URL):
+        await async_engine.dispose()
+        engine.dispose()
+
+
+def warm_pool(connections: int = DB_POOL_WARM) -> None:
+    """Open ``connections`` pooled connections up front so requests don't pay for connect."""
+    opened = [engine.connect() for _ in range(max(connections, 1))]
+    try:
+        for connection in opened:
+            connection.exec_driver_sql("SELECT 1")
+    finally:
+        for connection in opened:
+            connection.close()
+
+
+async def warm_async_pool(connections: int = DB_POOL_WARM) -> None:
+    """Async counterpart of warm_pool."""
+    opened = [await async_engine.connect() for _ in range(max(connections, 1))]
+    try:
+        for connection in opened:
+            await connection.exec_driver_sql("SELECT 1")
+    finally:
+        for connection in opened:
+            await connection.close()
@@ -0,0 +1,68 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.schemas.debt import PayoffPlan, PayoffPlanRequest
+from app.security import TokenClaims, get_token_claims
+from compute.debt import compare_strategies
+
+router = APIRouter(prefix="/debts", tags=["debts"])
+
+
+def _month_date(start: date, months: int) -> Optional[date]:
+    """First day of the month ``months`` after ``start``'s month, or None for -1."""
+    if months < 0:
+        return None
+    index = start.year * 12 + start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+@router.post("/payoff-plan", response_model=PayoffPlan)
+def plan_payoff(
+    request: PayoffPlanRequest,
+    claims: TokenClaims = Depends(get_token_claims),
+):
+    """Payoff month, debt-free date and total interest under each strategy.
+
+    Month 1 is the first payment, due at the start of next month. All
+    strategies are simulated together, month by month, as array operations.
+    """
+    debts = request.debts
+    try:
+        plans = compare_strategies(
+            [d.balance for d in debts],
+            [d.annual_rate for d in debts],
+            [d.minimum_payment for d in debts],
+            request.monthly_budget,
+            strategies=list(dict.fromkeys(request.strategies)),
+            custom_order=request.custom_order,
+            months=request.months,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    today = date.today()
+    strategies = []
+    for strategy, plan in plans.items():
+        debt_free = int(plan["months_to_debt_free"])
+        payoff_months = plan["payoff_month"].tolist()
+        strategies.append({
+            "strategy": strategy,
+            "order": [debts[i].name for i in plan["order"]],
+            "months_to_debt_free": debt_free if debt_free >= 0 else None,
+            "debt_free_date": _month_date(today, debt_free),
+            "total_interest": float(plan["total_interest"]),
+            "total_paid": float(plan["total_paid"]),
+            "debts": [
+                {
+                    "name": debt.name,
+                    "payoff_month": month if month >= 0 else None,
+                    "payoff_date": _month_date(today, month),
+                }
+                for debt, month in zip(debts, payoff_months)
+            ],
+            "remaining": plan["remaining"][: debt_free + 1 if debt_free >= 0 else None].tolist(),
+        })
+    recommended = min(strategies, key=lambda s: (s["months_to_debt_free"] is None, s["total_interest"]))
+    return {"recommended": recommended["strategy"], "strategies": strategies}
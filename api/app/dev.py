@@ -4,8 +4,6 @@ from sqlalchemy.exc import SQLAlchemyError
 import os
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import Base and engine from the main database configuration
@@ -1,7 +1,11 @@
 import base64
 import os
 import datetime
-from typing import Optional, Any
+from typing import Dict, Optional, Any
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
 try:
     from sqlalchemy.types import TypeDecorator, String  # type: ignore
 except Exception:  # pragma: no cover - SQLAlchemy not installed
@@ -19,28 +23,146 @@ except Exception:  # pragma: no cover - SQLAlchemy not installed
     class String:  # pragma: no cover - stub
         pass
 
-_key_env = os.getenv("ENCRYPTION_KEY")
-if _key_env:
-    key = base64.urlsafe_b64decode(_key_env)
-else:
-    key = os.urandom(32)
-    os.environ["ENCRYPTION_KEY"] = base64.urlsafe_b64encode(key).decode()
+# Envelope: "v1:<key id>:<urlsafe b64 of nonce(12) + ciphertext + tag(16)>".
+# The "v1:<key id>" header is authenticated as associated data, so neither the
+# version nor the key id can be swapped without failing decryption.
+ENVELOPE_VERSION = "v1"
+NONCE_SIZE = 12
+AES_KEY_SIZES = (16, 24, 32)
+
+
+class DecryptionError(ValueError):
+    """Ciphertext was tampered with, truncated, or its key is unknown."""
+
+
+class KeyRing:
+    """AES-GCM keys by id; new values use the active key, old ids still decrypt.
+
+    ``legacy_key`` decrypts values written by the previous XOR scheme (plain
+    base64, no envelope) so they can be read and re-encrypted.
+    """
+
+    def __init__(self, keys: Dict[str, bytes], active_key_id: str, legacy_key: Optional[bytes] = None):
+        if active_key_id not in keys:
+            raise ValueError(f"active key id {active_key_id!r} not in key ring")
+        self.active_key_id = active_key_id
+        self.legacy_key = legacy_key
+        self._ciphers = {key_id: AESGCM(key) for key_id, key in keys.items()}
+
+    @classmethod
+    def from_env(cls) -> "KeyRing":
+        """Build from ENCRYPTION_KEYS ("id:b64key,...") and ENCRYPTION_KEY_ID.
+
+        A lone ENCRYPTION_KEY (the original setting) becomes key id "default"
+        when it is a valid AES key size; otherwise it only decrypts legacy
+        values and ENCRYPTION_KEYS must supply the AES key. Raises ValueError
+        when no usable AES key is configured.
+        """
+        legacy_env = os.environ.get("ENCRYPTION_KEY")
+        legacy = base64.urlsafe_b64decode(legacy_env) if legacy_env else None
+        keys = {}
+        for item in filter(None, os.getenv("ENCRYPTION_KEYS", "").split(",")):
+            key_id, _, encoded = item.strip().partition(":")
+            keys[key_id] = base64.urlsafe_b64decode(encoded)
+            if len(keys[key_id]) not in AES_KEY_SIZES:
+                raise ValueError(f"ENCRYPTION_KEYS key {key_id!r} must be 16, 24 or 32 bytes, got {len(keys[key_id])}")
+        if not keys and legacy is not None and len(legacy) in AES_KEY_SIZES:
+            keys["default"] = legacy
+        if not keys:
+            raise ValueError(
+                "no AES encryption key configured: set ENCRYPTION_KEYS to \"id:<base64 16, 24 or 32 byte key>\" "
+                "(ENCRYPTION_KEY is only used for legacy values unless it is a valid AES key)"
+            )
+        active = os.getenv("ENCRYPTION_KEY_ID") or next(iter(keys))
+        return cls(keys, active, legacy)
+
+    def encrypt(self, plaintext: str) -> str:
+        header = f"{ENVELOPE_VERSION}:{self.active_key_id}"
+        nonce = os.urandom(NONCE_SIZE)
+        sealed = self._ciphers[self.active_key_id].encrypt(nonce, plaintext.encode("utf-8"), header.encode())
+        return f"{header}:{base64.urlsafe_b64encode(nonce + sealed).decode()}"
+
+    def decrypt(self, value: str) -> str:
+        if not value.startswith(ENVELOPE_VERSION + ":"):
+            return self._decrypt_legacy(value)
+        header, _, payload = value.rpartition(":")
+        key_id = header.split(":", 1)[1]
+        cipher = self._ciphers.get(key_id)
+        if cipher is None:
+            raise DecryptionError(f"unknown encryption key id {key_id!r}")
+        try:
+            data = base64.urlsafe_b64decode(payload)
+            return cipher.decrypt(data[:NONCE_SIZE], data[NONCE_SIZE:], header.encode()).decode("utf-8")
+        except (InvalidTag, ValueError) as exc:
+            raise DecryptionError("could not decrypt value") from exc
+
+    def needs_reencrypt(self, value: str) -> bool:
+        """True for legacy values or envelopes sealed with a non-active key."""
+        return not value.startswith(f"{ENVELOPE_VERSION}:{self.active_key_id}:")
+
+    def _decrypt_legacy(self, value: str) -> str:
+        if self.legacy_key is None:
+            raise DecryptionError("legacy value but no ENCRYPTION_KEY configured")
+        data = base64.b64decode(value)
+        key = self.legacy_key
+        return bytes(b ^ key[i % len(key)] for i, b in enumerate(data)).decode()
+
+
+if not os.getenv("ENCRYPTION_KEY") and not os.getenv("ENCRYPTION_KEYS"):
+    os.environ["ENCRYPTION_KEY"] = base64.urlsafe_b64encode(os.urandom(32)).decode()
+
+keyring = KeyRing.from_env()
+
 
 class EncryptedString(TypeDecorator):
     impl = String
+    cache_ok = True
 
     def process_bind_param(self, value: Optional[Any], dialect):
         if value is None:
             return value
         if isinstance(value, (datetime.date, datetime.datetime)):
             value = value.isoformat()
-        data = str(value).encode("utf-8")
-        enc = bytes(b ^ key[i % len(key)] for i, b in enumerate(data))
-        return base64.b64encode(enc).decode()
+        return keyring.encrypt(str(value))
 
     def process_result_value(self, value: Optional[str], dialect):
         if value is None:
             return value
-        data = base64.b64decode(value)
-        dec = bytes(b ^ key[i % len(key)] for i, b in enumerate(data))
-        return dec.decode()
+        return keyring.decrypt(value)
+
+
+def reencrypt_column(connection, table: str, column: str, pk: str = "id", batch_size: int = 1000) -> int:
+    """Re-seal every legacy or old-key value of ``table.column`` with the active key.
+
+    Walks the table by primary key in batches, reading raw stored strings, and
+    rewrites only rows that need it. Returns the number of rows rewritten.
+    Commit handling is left to the caller (e.g. a migration or engine.begin()).
+    """
+    from sqlalchemy import bindparam, column as sa_column, select, table as sa_table
+
+    target = sa_table(table, sa_column(pk), sa_column(column))
+    query = (
+        select(target.c[pk], target.c[column])
+        .where(target.c[pk] > bindparam("last_id"))
+        .order_by(target.c[pk])
+        .limit(batch_size)
+    )
+    update = (
+        target.update()
+        .where(target.c[pk] == bindparam("row_id"))
+        .values({column: bindparam("value")})
+    )
+    rewritten, last_id = 0, 0
+    while True:
+        rows = connection.execute(query, {"last_id": last_id}).fetchall()
+        if not rows:
+            return rewritten
+        changed = [
+            {"row_id": row_id, "value": keyring.encrypt(keyring.decrypt(value))}
+            for row_id, value in rows
+            if value is not None and keyring.needs_reencrypt(value)
+        ]
+        if changed:
+            connection.execute(update, changed)
+            rewritten += len(changed)
+        last_id = rows[-1][0]
@@ -0,0 +1,79 @@
+import hashlib
+import json
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.cache import fire_cache, fire_cache_key
+from app.database import get_db
+from app.schemas.fire import FireGrid, FireGridRequest
+from app.security import TokenClaims, get_token_claims
+from app.crud import advisor as crud_advisor
+from app.crud import projection as crud_projection
+from compute.fire import evaluate_grid
+
+router = APIRouter(prefix="/fire", tags=["fire"])
+
+# Largest savings rate x return x spend grid evaluated in one call
+MAX_GRID_POINTS = 20_000
+
+
+def _nullable(values: np.ndarray) -> list:
+    """Nested lists with unreachable (infinite) entries as None."""
+    values = values.astype(object)
+    values[~np.isfinite(values.astype(np.float64))] = None
+    return values.tolist()
+
+
+@router.post("/grid", response_model=FireGrid)
+def evaluate_fire_grid(
+    request: FireGridRequest,
+    db: Session = Depends(get_db),
+    claims: TokenClaims = Depends(get_token_claims),
+):
+    """Years to financial independence for every savings rate x return x spend.
+
+    Savings and income not given in the request come from the user's (or,
+    for an advisor, an accepted client's) balances and income sources. Results
+    are cached by their resolved inputs.
+    """
+    points = len(request.savings_rates) * len(request.expected_returns) * len(request.annual_spends)
+    if points > MAX_GRID_POINTS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Grid has {points} scenarios; the limit is {MAX_GRID_POINTS}",
+        )
+
+    user_id = claims.user_id
+    if request.client_id is not None:
+        if claims.role != "advisor" or not crud_advisor.has_client(db, claims.user_id, request.client_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+        user_id = request.client_id
+
+    inputs = request.dict(exclude={"client_id"})
+    try:
+        if request.current_savings is None or request.annual_income is None:
+            stored = crud_projection.load_inputs(db, [user_id])[user_id]
+            if inputs["current_savings"] is None:
+                inputs["current_savings"] = stored["assets"] - stored["liabilities"]
+            if inputs["annual_income"] is None:
+                inputs["annual_income"] = stored["annual_income"]
+
+        key = fire_cache_key(hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest())
+        cached = fire_cache.get(key)
+        if cached is not None:
+            return cached
+        result = evaluate_grid(**inputs)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    grid = {
+        **inputs,
+        "required_portfolio": result["required_portfolio"][0, 0].tolist(),
+        "years_to_fi": _nullable(result["years_to_fi"]),
+    }
+    if "required_savings_rate" in result:
+        grid["required_savings_rate"] = _nullable(result["required_savings_rate"][0])
+    fire_cache.set(key, grid)
+    return grid
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import User
-from app.schemas import Goal as GoalSchema, GoalCreate, GoalUpdate
+from app.schemas import Goal as GoalSchema, GoalCreate, GoalFeasibility, GoalUpdate
 from app.security import get_current_user
 from app.crud import goal as crud_goal
+from compute.goals import DEFAULT_CONFIDENCE
 
 router = APIRouter(prefix="/goals", tags=["goals"])
 
@@ -32,6 +33,21 @@ def list_goals(
     return crud_goal.get_goals(db=db, user_id=current_user.id)
 
 
+@router.get("/feasibility", response_model=list[GoalFeasibility])
+def get_goal_feasibility(
+    confidence: float = Query(DEFAULT_CONFIDENCE, gt=0, lt=1),
+    paths: int = Query(crud_goal.FEASIBILITY_PATHS, ge=100, le=20_000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Required monthly contribution, probability of success and projected
+    completion age for each of the user's goals with a numeric target."""
+    try:
+        return crud_goal.goal_feasibility(db, current_user.id, confidence=confidence, n_paths=paths)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+
 @router.get("/{goal_id}", response_model=GoalSchema)
 def get_goal(
     goal_id: int,
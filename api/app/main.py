@@ -1,45 +1,97 @@
+import asyncio
 import os
+import time
 import uuid
 import inspect
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Response, Depends, status, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from .database import engine, get_db
+from .database import async_engine, dispose_engines, engine, get_db, pool_metrics
+from .core import metrics
+from .core.autosave import autosave
+from .core.log import bind_request, configure_logging, reset_request
 from .auth import router as auth_router
 from .profile import router as profile_router
 from .accounts import router as accounts_router
+from .admin import router as admin_router
+from .advisors import router as advisors_router
+from .balance_sheet import router as balance_sheet_router
+from .debts import router as debts_router
+from .fire import router as fire_router
+from .projections import router as projections_router
 from .transactions import router as transactions_router
 from .milestones import router as milestones_router
 from .goals import router as goals_router
 from .income_sources import router as income_sources_router
 from .expense_categories import router as expense_categories_router
+from .budgets import router as budgets_router
 from .dev import router as dev_router
 # from .onboarding import router as onboarding_router  # REMOVED - conflicting with v1 API
-from api.app.api.v1.api import api_router
-from api.app.core.exceptions import UnauthorizedException, ForbiddenException, NotFoundException, ConflictException, UnprocessableEntityException
+from app.api.v1.api import api_router
+from app.core.exceptions import UnauthorizedException, ForbiddenException, NotFoundException, ConflictException, UnprocessableEntityException
 
-# Import all models to register them with SQLAlchemy
-from .models import (
-    Base, User, Profile, RiskProfile, OnboardingState, Account, 
-    Transaction, Milestone, Goal, IncomeSource, ExpenseCategory
-)
-
-# Create any tables that don't yet exist
-Base.metadata.create_all(bind=engine)
+# Schema is managed by Alembic; nothing here issues DDL. Base is re-exported
+# for tests and scripts that build a throwaway schema.
+from .models import Base
+from .startup import FAST_STARTUP, warm_up
 
 
 from pydantic import BaseModel
 from compute.operations import add
 
-app = FastAPI(title=os.getenv("APP_NAME", "FastAPI App"))
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warming = asyncio.create_task(warm_up()) if FAST_STARTUP else None
+    if warming is None:
+        await warm_up()
+    yield
+    if warming is not None:
+        warming.cancel()
+    autosave.flush_all()
+    await dispose_engines()
+
+
+configure_logging()
+app = FastAPI(title=os.getenv("APP_NAME", "FastAPI App"), lifespan=lifespan)
+
+metrics.instrument_engine(engine)
+metrics.instrument_engine(async_engine.sync_engine)
+
+# Registered before add_trace_id so it runs inside it, with the trace id bound
+@app.middleware("http")
+async def collect_metrics(request: Request, call_next):
+    stats, token = metrics.start_request()
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        route = request.scope.get("route")
+        metrics.finish_request(
+            token,
+            stats,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=status_code,
+            seconds=time.perf_counter() - start,
+        )
+    response.headers["Server-Timing"] = f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries"'
+    return response
 
 @app.middleware("http")
 async def add_trace_id(request: Request, call_next):
     trace_id = str(uuid.uuid4())
     request.state.trace_id = trace_id  # Ensure trace_id is always set
-    response = await call_next(request)
+    # Log records from this request carry the trace id and share one sampling decision
+    tokens = bind_request(trace_id, request.url.path)
+    try:
+        response = await call_next(request)
+    finally:
+        reset_request(tokens)
     response.headers["X-Trace-ID"] = trace_id
     return response
 
@@ -52,6 +104,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Trace-ID", "X-Next-Cursor"],
 )
 
 # Exception Handlers
@@ -126,6 +179,16 @@ class Message(BaseModel):
 def healthz():
     return {"status": "ok", "engines": {}}
 
+@app.get("/healthz/db")
+def healthz_db():
+    """Connection pool checkout/wait counters for this worker process."""
+    return pool_metrics()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    """Prometheus scrape endpoint: route latency, per-request queries, pool counters."""
+    return PlainTextResponse(metrics.render(pool_metrics()), media_type="text/plain; version=0.0.4")
+
 @app.post("/echo")
 def echo(msg: Message):
     return {"message": msg.message}
@@ -143,11 +206,18 @@ def add_numbers(nums: Numbers):
 app.include_router(auth_router)
 app.include_router(profile_router)
 app.include_router(accounts_router)
+app.include_router(admin_router)
+app.include_router(advisors_router)
+app.include_router(balance_sheet_router)
+app.include_router(debts_router)
+app.include_router(fire_router)
+app.include_router(projections_router)
 app.include_router(transactions_router)
 app.include_router(milestones_router)
 app.include_router(goals_router)
 app.include_router(income_sources_router)
 app.include_router(expense_categories_router)
+app.include_router(budgets_router)
 app.include_router(dev_router)
 # app.include_router(onboarding_router)  # REMOVED - conflicting with v1 API
 app.include_router(api_router, prefix="/api/v1")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, Date, DateTime, ForeignKey, Float, JSON
+from sqlalchemy import Column, Integer, String, Boolean, Date, DateTime, ForeignKey, Float, JSON, Index, UniqueConstraint
 from datetime import datetime
 # Use JSON for portable storage of lists. ARRAY is not supported by SQLite,
 # which is used in tests, so replacing ARRAY(Integer) with JSON ensures the
@@ -47,7 +47,7 @@ class Profile(Base):
     questionnaire = Column(JSON)
     risk_score = Column(Integer)
     risk_level = Column(Integer)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
     
     # Advisor-specific fields
     firm_name = Column(String, nullable=True, index=True)
@@ -134,26 +134,78 @@ class Account(Base):
     type = Column(String)
     balance = Column(Float)
     institution_name = Column(String) # Added based on PRD review
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
 
     owner = relationship("User", back_populates="accounts")
     transactions = relationship("Transaction", back_populates="account_rel")
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Per-user date ranges; INCLUDE lets Postgres answer amount sums index-only
+        Index("ix_transactions_user_id_date", "user_id", "date", postgresql_include=["amount"]),
+        Index("ix_transactions_user_id_category_date", "user_id", "category", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    date = Column(String) # Store as string for now, convert to DateTime later
+    date = Column(DateTime)
     description = Column(String)
     amount = Column(Float)
     category = Column(String)
     account = Column(String)
     user_id = Column(Integer, ForeignKey("users.id"))
-    account_id = Column(Integer, ForeignKey("accounts.id"))
+    account_id = Column(Integer, ForeignKey("accounts.id"), index=True)
 
     owner = relationship("User", back_populates="transactions")
     account_rel = relationship("Account", back_populates="transactions")
 
+class CategorySpending(Base):
+    """Monthly per-category transaction totals, maintained by the transaction CRUD."""
+    __tablename__ = "category_spending"
+    __table_args__ = (
+        UniqueConstraint("user_id", "month", "category", name="uq_category_spending_user_month_category"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    month = Column(Date, nullable=False)  # First day of the month
+    category = Column(String, nullable=False)
+    total = Column(Float, nullable=False, default=0.0)  # Net sum of amounts
+    count = Column(Integer, nullable=False, default=0)
+
+class AdvisorClient(Base):
+    """Links an advisor (a user with role "advisor") to a client user.
+
+    The advisor creates the link as an invitation; it grants access to the
+    client's data only once the client accepts it (``accepted_at`` is set).
+    """
+    __tablename__ = "advisor_clients"
+    __table_args__ = (
+        UniqueConstraint("advisor_id", "client_id", name="uq_advisor_clients_advisor_client"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    advisor_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    client_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    accepted_at = Column(DateTime, nullable=True)
+
+class NetWorthSnapshot(Base):
+    """Daily balance-sheet totals per user, maintained by the account CRUD."""
+    __tablename__ = "net_worth_snapshots"
+    __table_args__ = (
+        UniqueConstraint("user_id", "as_of", name="uq_net_worth_snapshots_user_as_of"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    as_of = Column(Date, nullable=False)
+    total_assets = Column(Float, nullable=False, default=0.0)
+    total_liabilities = Column(Float, nullable=False, default=0.0)
+    net_worth = Column(Float, nullable=False, default=0.0)
+    breakdown = Column(JSON)  # [{"type", "kind", "total", "accounts"}, ...]
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 class Milestone(Base):
     __tablename__ = "milestones"
 
@@ -176,9 +228,12 @@ class Goal(Base):
     name = Column(String)
     target = Column(String)
     current = Column(String)
+    # Numeric copies of target/current, kept in sync by crud.goal
+    target_amount = Column(Float)
+    current_amount = Column(Float)
     progress = Column(Float)
     target_date = Column(String)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
 
     owner = relationship("User", back_populates="goals")
 
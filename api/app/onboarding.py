@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import Account, Transaction
+from app.crud import balance_sheet as crud_balance_sheet
 from app.schemas.balance_sheet import InitialBalanceSheetSnapshot
 from app.security import get_current_user
 
@@ -13,18 +13,11 @@ def get_initial_balance_sheet(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    user_id = current_user.id
-
-    total_assets = sum([account.balance for account in db.query(Account).filter(Account.user_id == user_id).all()])
-    total_liabilities = 0.0 # Placeholder for now, assuming liabilities are not yet tracked in accounts
-
-    # You might want to calculate liabilities from specific transaction categories or dedicated liability accounts
-    # For now, let's assume liabilities are not directly in 'accounts' model for simplicity in this initial snapshot
-
-    net_worth = total_assets - total_liabilities
+    sheet = crud_balance_sheet.get_balance_sheet(db, current_user.id)
+    db.commit()
 
     return InitialBalanceSheetSnapshot(
-        total_assets=total_assets,
-        total_liabilities=total_liabilities,
-        net_worth=net_worth
-    )
\ No newline at end of file
+        total_assets=sheet["total_assets"],
+        total_liabilities=sheet["total_liabilities"],
+        net_worth=sheet["net_worth"]
+    )
@@ -4,10 +4,8 @@ from datetime import date
 from typing import List
 
 from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-import jwt
-from api.app.core.exceptions import UnprocessableEntityException
+from app.core.exceptions import UnprocessableEntityException
 
 from app.database     import get_db
 from app.models import User, Profile
@@ -15,33 +13,17 @@ from app.schemas.user import ProfileOut, ProfileUpdate, Dependents
 ProfileOut.Config.orm_mode = True
 ProfileOut.Config.orm_mode = True
 ProfileOut.Config.orm_mode = True
-from app.security     import SECRET_KEY, ALGORITHM
+from app.security     import get_current_user
 from compute.risk_engine import compute_risk_score, compute_risk_level
 from app.utils import normalize_questionnaire
 
 router = APIRouter(tags=["profile"])
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
 def calculate_age(dob: date) -> int:
     return (date.today() - dob).days // 365
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db:    Session = Depends(get_db),
-) -> User:
-    """Decode JWT and return the User, or 401."""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    except jwt.PyJWTError:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    user = db.query(User).get(payload["sub"])
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    return user
-
-
 @router.get("/profile")
 def read_profile(
     current: User = Depends(get_current_user),
@@ -0,0 +1,36 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.projection import NetWorthProjection
+from app.security import TokenClaims, get_token_claims
+from app.crud import projection as crud_projection
+from compute.projection import DEFAULT_INCOME_GROWTH, DEFAULT_INFLATION, DEFAULT_YEARS
+
+router = APIRouter(prefix="/projection", tags=["projection"])
+
+
+@router.get("/net-worth", response_model=NetWorthProjection)
+def get_net_worth_projection(
+    years: int = Query(DEFAULT_YEARS, ge=1, le=80),
+    income_growth: float = Query(DEFAULT_INCOME_GROWTH, gt=-1, le=1),
+    inflation: float = Query(DEFAULT_INFLATION, gt=-1, le=1),
+    expected_return: Optional[float] = Query(None, gt=-1, le=1),
+    db: Session = Depends(get_db),
+    claims: TokenClaims = Depends(get_token_claims),
+):
+    """Year-by-year cash flow and net worth from the user's income sources,
+    expense budgets and account balances.
+
+    ``expected_return`` defaults to the mean return for the user's risk level.
+    """
+    try:
+        projections = crud_projection.project_users(
+            db, [claims.user_id], years=years, income_growth=income_growth,
+            inflation=inflation, expected_return=expected_return,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    return projections[claims.user_id]
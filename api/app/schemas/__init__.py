@@ -1,6 +1,6 @@
-from .user import UserBase, UserCreate, UserInDB, User, Token, TokenData, RegisterResponse, ProfileBase, ProfileCreate, ProfileUpdate, Profile, RegisterRequest, ProfileOut, ProfileResponse, Dependents, DeleteAccountRequest, DeleteAccountResponse, CreateAccountRequest, CreateAccountResponse, CompleteProfileRequest, CompleteProfileResponse
+from .user import UserBase, UserCreate, UserInDB, User, Token, TokenData, RegisterResponse, ProfileBase, ProfileCreate, ProfileUpdate, Profile, RegisterRequest, ProfileOut, ProfileResponse, Dependents, DeleteAccountRequest, DeleteAccountResponse, CreateAccountRequest, CreateAccountResponse, RoleUpdate, CompleteProfileRequest, CompleteProfileResponse
 from .risk_profile import RiskProfileBase, RiskProfileCreate, RiskProfileUpdate, RiskProfile
-from .transaction import TransactionBase, TransactionCreate, TransactionUpdate, Transaction
+from .transaction import TransactionBase, TransactionCreate, TransactionUpdate, Transaction, TransactionImportError, TransactionImportResult
 from .milestone import MilestoneBase, MilestoneCreate, MilestoneUpdate, Milestone
-from .goal import GoalBase, GoalCreate, GoalUpdate, Goal
+from .goal import GoalBase, GoalCreate, GoalUpdate, Goal, GoalFeasibility
 from .account import AccountBase, AccountCreate, AccountUpdate, Account
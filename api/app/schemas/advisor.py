@@ -0,0 +1,35 @@
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+class ClientLinkRequest(BaseModel):
+    client_email: str
+
+class ClientLink(BaseModel):
+    client_id: int
+    email: str
+    accepted: bool  # False until the client accepts the invitation
+
+class AdvisorInvitation(BaseModel):
+    advisor_id: int
+    email: str
+    invited_at: Optional[datetime] = None
+
+class ClientSummary(BaseModel):
+    client_id: int
+    email: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    onboarding_complete: bool
+    risk_score: Optional[int] = None
+    risk_level: Optional[int] = None
+    persona: Optional[str] = None
+    alignment_score: Optional[float] = None
+    # From the newest balance-sheet snapshot; unset until the client has one
+    net_worth: Optional[float] = None
+    total_assets: Optional[float] = None
+    total_liabilities: Optional[float] = None
+    net_worth_as_of: Optional[date] = None
+    goal_count: int = 0
+    goal_progress: Optional[float] = None  # Mean progress across goals
@@ -1,6 +1,25 @@
+from datetime import date
+from typing import List
+
 from pydantic import BaseModel
 
 class InitialBalanceSheetSnapshot(BaseModel):
     total_assets: float
     total_liabilities: float
-    net_worth: float
\ No newline at end of file
+    net_worth: float
+
+class BalanceSheetLine(BaseModel):
+    type: str
+    kind: str  # "asset" or "liability"
+    total: float  # Positive for both kinds
+    accounts: int
+
+class BalanceSheet(InitialBalanceSheetSnapshot):
+    as_of: date  # Day of the last account change
+    breakdown: List[BalanceSheetLine]
+
+class NetWorthPoint(InitialBalanceSheetSnapshot):
+    as_of: date
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,17 @@
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel
+
+class BudgetLine(BaseModel):
+    category: str
+    budgeted: Optional[float] = None
+    actual: float
+    variance: Optional[float] = None  # budgeted - actual; negative means overspent
+    percent_used: Optional[float] = None
+    transaction_count: int
+
+class BudgetVsActual(BaseModel):
+    month: date
+    total_budgeted: float
+    total_actual: float
+    lines: List[BudgetLine]
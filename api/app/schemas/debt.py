@@ -0,0 +1,36 @@
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+class DebtIn(BaseModel):
+    name: str
+    balance: float = Field(..., ge=0)
+    annual_rate: float = Field(..., ge=0, le=10)  # e.g. 0.18 for 18% APR
+    minimum_payment: float = Field(..., ge=0)
+
+class PayoffPlanRequest(BaseModel):
+    debts: List[DebtIn] = Field(..., min_length=1, max_length=1000)
+    monthly_budget: float = Field(..., gt=0)  # Total paid towards all debts each month
+    strategies: List[str] = ["avalanche", "snowball"]  # avalanche, snowball, custom
+    custom_order: Optional[List[int]] = None  # Debt indices, first paid first
+    months: int = Field(360, ge=1, le=600)
+
+class DebtPayoff(BaseModel):
+    name: str
+    payoff_month: Optional[int] = None  # 1-based; null if not paid off within the horizon
+    payoff_date: Optional[date] = None
+
+class StrategyPlan(BaseModel):
+    strategy: str
+    order: List[str]  # Debt names in the order extra payments go to them
+    months_to_debt_free: Optional[int] = None
+    debt_free_date: Optional[date] = None
+    total_interest: float
+    total_paid: float
+    debts: List[DebtPayoff]
+    remaining: List[float]  # Total balance after each month, starting today
+
+class PayoffPlan(BaseModel):
+    recommended: str  # Strategy paying the least interest
+    strategies: List[StrategyPlan]
@@ -0,0 +1,33 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+class FireGridRequest(BaseModel):
+    # Grid axes; every combination is evaluated
+    savings_rates: List[float] = Field(..., min_length=1)  # Share of income saved, 0-1
+    expected_returns: List[float] = Field(..., min_length=1)
+    annual_spends: List[float] = Field(..., min_length=1)  # Spending to cover once FI
+    # Default to the user's net worth and annual income
+    current_savings: Optional[float] = None
+    annual_income: Optional[float] = Field(None, ge=0)
+    withdrawal_rate: float = Field(0.04, gt=0, le=1)
+    income_growth: float = Field(0.0, gt=-1, le=1)
+    inflation: float = Field(0.0, gt=-1, le=1)
+    target_years: Optional[float] = Field(None, ge=0, le=100)  # Also solve for the savings rate to be FI by then
+    client_id: Optional[int] = None  # Advisors: evaluate a linked client's inputs
+
+class FireGrid(BaseModel):
+    current_savings: float
+    annual_income: float
+    withdrawal_rate: float
+    income_growth: float
+    inflation: float
+    target_years: Optional[float] = None
+    savings_rates: List[float]
+    expected_returns: List[float]
+    annual_spends: List[float]
+    required_portfolio: List[float]  # Per annual spend
+    # [savings rate][return][spend]; null when FI is out of reach
+    years_to_fi: List[List[List[Optional[float]]]]
+    # [return][spend], with target_years; null when unreachable
+    required_savings_rate: Optional[List[List[Optional[float]]]] = None
@@ -24,7 +24,22 @@ class GoalUpdate(BaseModel):
 class Goal(GoalBase):
     id: int
     user_id: int
+    # target/current parsed as numbers; null when they are not numeric
+    target_amount: Optional[float] = None
+    current_amount: Optional[float] = None
 
     class Config:
         orm_mode = True
         from_attributes = True
+
+class GoalFeasibility(BaseModel):
+    goal_id: int
+    name: str
+    target_amount: Optional[float] = None
+    current_amount: Optional[float] = None
+    years_to_target: Optional[int] = None  # From target_date; null without one
+    required_monthly_contribution: Optional[float] = None  # At the requested confidence
+    planned_monthly_contribution: float  # This goal's share of the user's surplus
+    success_probability: Optional[float] = None  # At the planned contribution, 0-1
+    projected_completion_years: Optional[int] = None  # Median path; null if beyond the horizon
+    projected_completion_age: Optional[int] = None
@@ -0,0 +1,70 @@
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+class ProjectionAssumptions(BaseModel):
+    income_growth: float
+    inflation: float
+    expected_return: float
+
+class NetWorthProjection(BaseModel):
+    # Today's inputs, annualised
+    annual_income: float
+    annual_expenses: float
+    assets: float
+    liabilities: float
+    assumptions: ProjectionAssumptions
+    # One entry per projected year, starting with this one
+    income: List[float]
+    expenses: List[float]
+    savings: List[float]
+    net_worth: List[float]  # Years 0..years; entry 0 is today
+
+class ProfileGoal(BaseModel):
+    # One entry of Profile.goals; other keys (category, priority, ...) pass through
+    title: Optional[str] = None
+    target_age: Optional[int] = Field(None, ge=0, le=120)
+    target_amount: Optional[float] = Field(None, ge=0)
+    current_amount: Optional[float] = Field(None, ge=0)
+
+    class Config:
+        extra = "allow"
+
+class ProfileDelta(BaseModel):
+    # Hypothetical changes; unset fields keep their current values
+    annual_income: Optional[float] = Field(None, ge=0)
+    annual_expenses: Optional[float] = Field(None, ge=0)
+    assets: Optional[float] = Field(None, ge=0)
+    liabilities: Optional[float] = Field(None, ge=0)
+    risk_level: Optional[int] = Field(None, ge=1, le=5)
+    dependents: Optional[int] = Field(None, ge=0)
+    date_of_birth: Optional[date] = None
+    goals: Optional[Dict[str, ProfileGoal]] = None
+
+class TimelineState(BaseModel):
+    current_age: int
+    persona: str
+    life_phase: str
+    alignment_score: float
+    net_worth: List[float]  # One entry per year from current_age
+
+class MilestoneShift(BaseModel):
+    id: str
+    title: Optional[str] = None
+    target_amount: Optional[float] = None
+    age_before: Optional[int] = None  # None when the milestone only exists on one side
+    age_after: Optional[int] = None
+    confidence_before: Optional[float] = None
+    confidence_after: Optional[float] = None
+    # Age at which projected net worth first covers the target
+    funded_age_before: Optional[int] = None
+    funded_age_after: Optional[int] = None
+    shift_years: Optional[int] = None  # funded_age_after - funded_age_before
+
+class WhatIf(BaseModel):
+    changes: Dict[str, Any]
+    recomputed: List[str]  # Projection parts the changes touched
+    before: TimelineState
+    after: TimelineState
+    milestone_shifts: List[MilestoneShift]
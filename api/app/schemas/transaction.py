@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from pydantic import BaseModel
 
@@ -27,7 +27,19 @@ class TransactionUpdate(BaseModel):
 class Transaction(TransactionBase):
     id: int
     user_id: int
+    # Imported rows whose date could not be parsed are stored undated
+    date: Optional[datetime] = None
 
     class Config:
         orm_mode = True
         from_attributes = True
+
+
+class TransactionImportError(BaseModel):
+    row: int
+    error: str
+
+class TransactionImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[TransactionImportError]
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import date, datetime
 
 from pydantic import BaseModel, EmailStr, constr
@@ -42,7 +42,6 @@ class RegisterResponse(BaseModel):
 class RegisterRequest(BaseModel):
     email: EmailStr
     password: constr(min_length=8)
-    user_type: str = "user"  # 'user' or 'advisor'
     # Optional fields with defaults for simplified registration
     first_name: str = "New"
     last_name: str = "User"
@@ -196,7 +195,10 @@ class DeleteAccountResponse(BaseModel):
 class CreateAccountRequest(BaseModel):
     email: EmailStr
     password: str
-    user_type: str
+
+class RoleUpdate(BaseModel):
+    # Roles are granted by an administrator, never chosen at registration
+    role: Literal["user", "advisor"]
 
 class CreateAccountResponse(BaseModel):
     access_token: str
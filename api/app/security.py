@@ -1,9 +1,13 @@
 from __future__ import annotations
+import asyncio
+import logging
 import os
 import base64
 import hashlib
 import hmac
 import secrets
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional, List
 
@@ -11,10 +15,12 @@ import jwt
 from fastapi import Depends, status
 from app.core.exceptions import UnauthorizedException, ForbiddenException
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.database import get_db
 from app.models import User
+from app.core import cache
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 if not SECRET_KEY:
@@ -23,24 +29,90 @@ if not SECRET_KEY:
     else:
         # Development fallback with warning
         SECRET_KEY = "dev-secret-key-change-in-production-" + secrets.token_hex(32)
-        print("⚠️  WARNING: Using auto-generated secret key for development. Set SECRET_KEY env var for production.")
+        logging.getLogger(__name__).warning(
+            "Using auto-generated secret key for development. Set SECRET_KEY env var for production."
+        )
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 525600
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Password hashing: scrypt (memory-hard) in a versioned, self-describing format
+#   $scrypt$v=1$n=<N>,r=<r>,p=<p>$<salt b64>$<key b64>
+# Hashes from before the switch (base64 of salt + SHA-256 digest) still verify
+# and are flagged by needs_rehash so login can upgrade them transparently.
+PASSWORD_SCHEME = "scrypt"
+PASSWORD_SCHEME_VERSION = 1
+SCRYPT_N = int(os.getenv("PASSWORD_SCRYPT_N", str(2 ** 14)))
+SCRYPT_R = int(os.getenv("PASSWORD_SCRYPT_R", "8"))
+SCRYPT_P = int(os.getenv("PASSWORD_SCRYPT_P", "1"))
+SCRYPT_KEY_LEN = 32
+
+# Bounded pool for KDF work: caps concurrent CPU/memory use during login bursts
+# and keeps hashing off the event loop.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2))),
+    thread_name_prefix="password-hash",
+)
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode(), salt=salt, n=n, r=r, p=p,
+        maxmem=256 * n * r * p, dklen=SCRYPT_KEY_LEN,
+    )
+
+
 def hash_password(password: str) -> str:
     salt = secrets.token_bytes(16)
-    digest = hashlib.sha256(salt + password.encode()).digest()
-    return base64.b64encode(salt + digest).decode()
+    key = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    return "${}$v={}$n={},r={},p={}${}${}".format(
+        PASSWORD_SCHEME, PASSWORD_SCHEME_VERSION, SCRYPT_N, SCRYPT_R, SCRYPT_P,
+        base64.b64encode(salt).decode(), base64.b64encode(key).decode(),
+    )
+
+
+def _parse_scrypt_hash(hashed: str):
+    _, scheme, version, params, salt, key = hashed.split("$")
+    if scheme != PASSWORD_SCHEME or version != f"v={PASSWORD_SCHEME_VERSION}":
+        raise ValueError("unsupported password hash scheme")
+    cost = dict(item.split("=") for item in params.split(","))
+    return (int(cost["n"]), int(cost["r"]), int(cost["p"]),
+            base64.b64decode(salt), base64.b64decode(key))
 
 
 def verify_password(password: str, hashed: str) -> bool:
-    data = base64.b64decode(hashed.encode())
+    try:
+        if hashed.startswith("$"):
+            n, r, p, salt, key = _parse_scrypt_hash(hashed)
+            return hmac.compare_digest(key, _scrypt(password, salt, n, r, p))
+        # Legacy: base64(salt[16] + sha256(salt + password))
+        data = base64.b64decode(hashed.encode())
+    except (ValueError, KeyError):
+        return False
     salt, digest = data[:16], data[16:]
     return hmac.compare_digest(digest, hashlib.sha256(salt + password.encode()).digest())
 
 
+def needs_rehash(hashed: str) -> bool:
+    """True for legacy hashes or scrypt hashes below the configured cost."""
+    try:
+        n, r, p, _, _ = _parse_scrypt_hash(hashed)
+    except (ValueError, KeyError):
+        return True
+    return (n, r, p) != (SCRYPT_N, SCRYPT_R, SCRYPT_P)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password on the bounded hashing pool."""
+    return await asyncio.get_running_loop().run_in_executor(_hash_executor, hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """verify_password on the bounded hashing pool."""
+    return await asyncio.get_running_loop().run_in_executor(_hash_executor, verify_password, password, hashed)
+
+
 def create_access_token(user: User | str, scope: str = "user") -> str:
     """Return a signed JWT for the given user object or user id."""
     now = datetime.utcnow()
@@ -59,26 +131,93 @@ def create_access_token(user: User | str, scope: str = "user") -> str:
     }
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+def decode_access_token(token: str) -> dict:
+    """Return the claims of a valid JWT, or raise UnauthorizedException."""
     credentials_exception = UnauthorizedException(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
     except jwt.PyJWTError:
         raise credentials_exception
+    if payload.get("sub") is None:
+        raise credentials_exception
+    return payload
+
+
+# Columns cached per user; hashed_password is left out and lazy-loads if needed.
+_SNAPSHOT_COLUMNS = ("id", "email", "is_active", "is_superuser", "role")
+
+
+def _user_snapshot(user: User) -> dict:
+    return {column: getattr(user, column) for column in _SNAPSHOT_COLUMNS}
+
+
+def _user_from_snapshot(db: Session, snapshot: dict) -> User:
+    """Attach a cached snapshot to the session as a persistent User, without SQL."""
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target: User) -> None:
+    cache.invalidate_user(target.id)
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    """The token's user, from the snapshot cache when possible.
+
+    ORM writes to a user drop its snapshot in this process; changes made by
+    another worker (or by bulk UPDATEs) are picked up within USER_CACHE_TTL.
+    """
+    user_id: str = decode_access_token(token)["sub"]
+    use_cache = cache.USER_CACHE_TTL > 0
+    snapshot = cache.user_cache.get(cache.user_cache_key(user_id)) if use_cache else None
+    if snapshot is not None:
+        return _user_from_snapshot(db, snapshot)
+
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
-        raise credentials_exception
+        raise UnauthorizedException(
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if use_cache:
+        cache.user_cache.set(cache.user_cache_key(user_id), _user_snapshot(user))
     return user
 
+
+@dataclass(frozen=True)
+class TokenClaims:
+    sub: str
+    role: str
+    scope: str
+
+    @property
+    def user_id(self) -> int:
+        return int(self.sub)
+
+
+def get_token_claims(token: str = Depends(oauth2_scheme)) -> TokenClaims:
+    """Claims-only auth for reads scoped by user id: no DB lookup at all.
+
+    Unlike get_current_user this does not check that the user still exists,
+    so only use it where a deleted user's token can at worst read nothing.
+    """
+    payload = decode_access_token(token)
+    return TokenClaims(
+        sub=str(payload["sub"]),
+        role=payload.get("role", "user"),
+        scope=payload.get("scope", "user"),
+    )
+
+
 class RoleChecker:
     def __init__(self, allowed_roles: List[str]):
         self.allowed_roles = allowed_roles
@@ -0,0 +1,45 @@
+"""
+Explicit startup work, run from the application lifespan instead of at import.
+
+Schema is managed by Alembic (or create_tables.py for a fresh database), so
+startup never touches DDL. warm_up() pre-opens pooled connections and runs the
+numeric kernels once, so the first requests a new worker serves don't pay
+for mapper configuration, connection setup or NumPy's first-call
+initialisation.
+"""
+import logging
+import os
+import time
+
+from sqlalchemy.orm import configure_mappers
+from starlette.concurrency import run_in_threadpool
+
+from app.database import warm_async_pool, warm_pool
+
+logger = logging.getLogger(__name__)
+
+# FAST_STARTUP=1: start serving immediately and warm up in the background.
+FAST_STARTUP = os.getenv("FAST_STARTUP", "").lower() in ("1", "true", "yes")
+
+
+def _warm_compute() -> None:
+    from compute.monte_carlo import simulate_milestones
+    from compute.risk_engine import compute_risk_levels, compute_risk_scores
+
+    simulate_milestones(10_000, 1_000, [5, 10], [20_000, 40_000], 0.06, 0.12, n_paths=1_000, seed=0)
+    compute_risk_levels(compute_risk_scores([35], [50_000], [1], [10], [[3] * 8]))
+
+
+async def warm_up() -> None:
+    start = time.perf_counter()
+    try:
+        # Resolve ORM relationships now rather than on the first query
+        await run_in_threadpool(configure_mappers)
+        await run_in_threadpool(warm_pool)
+        await warm_async_pool()
+        await run_in_threadpool(_warm_compute)
+    except Exception:
+        # A cold cache is slower, not broken; never fail startup over it
+        logger.exception("startup warm-up failed")
+        return
+    logger.info("startup warm-up finished in %.0f ms", (time.perf_counter() - start) * 1000)
@@ -0,0 +1,154 @@
+"""
+Streaming parsers for bank statement exports (CSV, OFX/QFX, QIF).
+
+Each parser is a generator over text lines yielding ``(row_number, record)``
+where ``record`` is either a dict ready for the transactions table or a
+``RowError`` describing why that row was rejected. Nothing is buffered
+beyond the current record, so arbitrarily large files stream in constant
+memory.
+"""
+import csv
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+@dataclass
+class RowError:
+    row: int
+    error: str
+
+
+Record = Union[Dict[str, Any], RowError]
+
+_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%Y%m%d", "%d-%m-%Y")
+
+
+def parse_date(value: str) -> datetime:
+    value = (value or "").strip()
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    # OFX timestamps look like 20240131120000.000[-5:EST]
+    ofx = re.match(r"^(\d{8})(\d{6})?", value)
+    if ofx:
+        try:
+            return datetime.strptime(ofx.group(1) + (ofx.group(2) or "000000"), "%Y%m%d%H%M%S")
+        except ValueError:
+            pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"unrecognised date {value!r}")
+
+
+def parse_amount(value: str) -> float:
+    cleaned = (value or "").strip().replace(",", "").replace(" ", "")
+    if cleaned.startswith("(") and cleaned.endswith(")"):  # accounting negative
+        cleaned = "-" + cleaned[1:-1]
+    try:
+        return float(cleaned)
+    except ValueError:
+        raise ValueError(f"invalid amount {value!r}")
+
+
+def _record(row: int, date: Optional[str], amount: Optional[str],
+            description: Optional[str], category: Optional[str]) -> Record:
+    try:
+        return {
+            "date": parse_date(date),
+            "amount": parse_amount(amount),
+            "description": (description or "").strip(),
+            "category": (category or "").strip() or None,
+        }
+    except ValueError as exc:
+        return RowError(row=row, error=str(exc))
+
+
+def parse_csv(lines: Iterable[str]) -> Iterator[Tuple[int, Record]]:
+    """CSV with a header row containing date, amount and description/payee columns."""
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None:
+        return
+    columns = {name.strip().lower(): name for name in reader.fieldnames if name}
+    missing = [c for c in ("date", "amount") if c not in columns]
+    if missing:
+        yield 1, RowError(row=1, error=f"missing column(s): {', '.join(missing)}")
+        return
+    description = columns.get("description") or columns.get("payee") or columns.get("memo")
+    category = columns.get("category")
+
+    for row_number, row in enumerate(reader, start=2):
+        yield row_number, _record(
+            row_number,
+            row.get(columns["date"]),
+            row.get(columns["amount"]),
+            row.get(description) if description else None,
+            row.get(category) if category else None,
+        )
+
+
+_OFX_TAG = re.compile(r"<(\w+)>([^<\r\n]*)")
+
+
+def parse_ofx(lines: Iterable[str]) -> Iterator[Tuple[int, Record]]:
+    """OFX/QFX (SGML or XML flavour): one record per <STMTTRN> block.
+
+    OFX has no spending category (TRNTYPE is just DEBIT/CREDIT/...), so
+    imported rows are left uncategorised.
+    """
+    current: Optional[Dict[str, str]] = None
+    index = 0
+    for line in lines:
+        upper = line.upper()
+        if "<STMTTRN>" in upper:
+            current = {}
+        if current is not None:
+            for tag, value in _OFX_TAG.findall(line):
+                if value.strip():
+                    current[tag.upper()] = value.strip()
+        if "</STMTTRN>" in upper and current is not None:
+            index += 1
+            yield index, _record(
+                index,
+                current.get("DTPOSTED"),
+                current.get("TRNAMT"),
+                current.get("NAME") or current.get("MEMO"),
+                None,
+            )
+            current = None
+
+
+def parse_qif(lines: Iterable[str]) -> Iterator[Tuple[int, Record]]:
+    """QIF: D(ate), T(amount), P(ayee), L(category) fields, records end with ^."""
+    fields: Dict[str, str] = {}
+    index = 0
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line or line.startswith("!"):
+            continue
+        if line.startswith("^"):
+            if fields:
+                index += 1
+                yield index, _record(index, fields.get("D"), fields.get("T") or fields.get("U"),
+                                     fields.get("P") or fields.get("M"), fields.get("L"))
+            fields = {}
+            continue
+        fields[line[0]] = line[1:]
+    if fields:
+        index += 1
+        yield index, _record(index, fields.get("D"), fields.get("T") or fields.get("U"),
+                             fields.get("P") or fields.get("M"), fields.get("L"))
+
+
+PARSERS = {"csv": parse_csv, "ofx": parse_ofx, "qif": parse_qif}
+
+
+def detect_format(filename: Optional[str]) -> str:
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension == "qfx":
+        return "ofx"
+    return extension if extension in PARSERS else "csv"
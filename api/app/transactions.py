@@ -1,15 +1,23 @@
+import io
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models import User
-from app.schemas import Transaction as TransactionSchema, TransactionCreate, TransactionUpdate
-from app.security import get_current_user
+from app.schemas import Transaction as TransactionSchema, TransactionCreate, TransactionUpdate, TransactionImportResult
+from app.security import TokenClaims, get_current_user, get_token_claims
+from app.crud import account as crud_account
 from app.crud import transaction as crud_transaction
+from app.transaction_import import PARSERS, RowError, detect_format
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
+# Cap on per-row errors echoed back; the failed count is always exact.
+MAX_REPORTED_ERRORS = 1000
+
 
 @router.post("/", response_model=TransactionSchema, status_code=status.HTTP_201_CREATED)
 def create_transaction(
@@ -23,28 +31,95 @@ def create_transaction(
     return tx
 
 
+@router.post("/import", response_model=TransactionImportResult)
+def import_transactions(
+    account_id: int = Form(...),
+    file: UploadFile = File(...),
+    format: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Bulk-import a CSV, OFX/QFX or QIF statement into one of the user's accounts.
+
+    The file is streamed through the parser and inserted in batches; rows
+    that fail validation are reported back without aborting the import. The
+    import commits as a whole, so an error part-way imports nothing.
+    """
+    account = crud_account.get_account(db=db, account_id=account_id, user_id=current_user.id)
+    if account is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
+    file_format = (format or detect_format(file.filename)).lower()
+    if file_format not in PARSERS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"format must be one of {sorted(PARSERS)}",
+        )
+
+    errors: list[RowError] = []
+    failed = 0
+
+    def valid_rows():
+        nonlocal failed
+        lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", errors="replace", newline="")
+        for _, record in PARSERS[file_format](lines):
+            if isinstance(record, RowError):
+                failed += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append(record)
+                continue
+            yield record
+
+    imported = crud_transaction.bulk_create_transactions(
+        db=db, rows=valid_rows(), user_id=current_user.id, account_id=account.id, account_name=account.name
+    )
+    return {
+        "imported": imported,
+        "failed": failed,
+        "errors": [{"row": e.row, "error": e.error} for e in errors],
+    }
+
+
 @router.get("/", response_model=list[TransactionSchema])
-def list_transactions(
-    skip: int = 0,
-    limit: int = 100,
+async def list_transactions(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
     category: str = None,
     start_date: datetime = None,
     end_date: datetime = None,
     sort_by: str = None,
     sort_order: str = "asc",
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    cursor: str = None,
+    db: AsyncSession = Depends(get_async_db),
+    claims: TokenClaims = Depends(get_token_claims),
 ):
-    return crud_transaction.get_transactions(db=db, user_id=current_user.id)
+    try:
+        transactions = await crud_transaction.get_transactions_async(
+            db=db,
+            user_id=claims.user_id,
+            skip=skip,
+            limit=limit,
+            category=category,
+            start_date=start_date,
+            end_date=end_date,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    if len(transactions) == limit and sort_by in (None, "date"):
+        response.headers["X-Next-Cursor"] = crud_transaction.encode_cursor(transactions[-1])
+    return transactions
 
 
 @router.get("/{tx_id}", response_model=TransactionSchema)
 def get_transaction(
     tx_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    claims: TokenClaims = Depends(get_token_claims),
 ):
-    tx = crud_transaction.get_transaction(db=db, tx_id=tx_id, user_id=current_user.id)
+    tx = crud_transaction.get_transaction(db=db, tx_id=tx_id, user_id=claims.user_id)
     if tx is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
     return tx
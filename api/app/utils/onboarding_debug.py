@@ -4,7 +4,6 @@ Onboarding Debug Utilities - For monitoring and troubleshooting the fixed onboar
 from sqlalchemy.orm import Session
 from datetime import datetime
 from typing import Dict, Any, List, Optional
-import json
 import logging
 
 from ..models import OnboardingState, User
@@ -233,7 +232,6 @@ def log_onboarding_save_attempt(user_id: int, step_number: int, step_data: Dict[
     """Log detailed information about onboarding save attempts for debugging"""
     
     log_entry = {
-        "timestamp": datetime.utcnow().isoformat(),
         "user_id": user_id,
         "step_number": step_number,
         "step_data_keys": list(step_data.keys()) if step_data else [],
@@ -245,6 +243,7 @@ def log_onboarding_save_attempt(user_id: int, step_number: int, step_data: Dict[
     }
     
     if success:
-        logger.info(f"Onboarding save success: {json.dumps(log_entry)}")
+        logger.info("onboarding step saved", extra=log_entry)
     else:
-        logger.error(f"Onboarding save failed: {json.dumps(log_entry)}")
\ No newline at end of file
+        # Called from the except block, so the traceback is attached
+        logger.error("onboarding step save failed", extra=log_entry, exc_info=True)
\ No newline at end of file
@@ -1,6 +1,13 @@
 #!/usr/bin/env python3
 """
-Script to manually create database tables
+Prepare the database schema before the app starts (the app never runs DDL).
+
+- Empty database: create every table from the models and stamp it at the
+  Alembic head.
+- Database already under Alembic: `alembic upgrade head`.
+- Tables but no alembic_version (an old create_all-built schema): refuse,
+  since stamping would silently skip migrations; stamp the matching revision
+  by hand, then rerun.
 """
 import os
 import sys
@@ -8,13 +15,38 @@ import sys
 # Add the parent directory to the path so we can import the app modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
 from app.database import engine
 from app.models import Base
 
+API_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def alembic_config() -> Config:
+    config = Config(os.path.join(API_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(API_DIR, "alembic"))
+    return config
+
+
 if __name__ == "__main__":
-    print("Creating database tables...")
+    tables = set(inspect(engine).get_table_names())
     try:
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables created successfully!")
+        if "alembic_version" in tables:
+            print("Applying migrations...")
+            command.upgrade(alembic_config(), "head")
+            print("✅ Database schema is at Alembic head!")
+        elif tables:
+            print("❌ Existing tables without an alembic_version: run `alembic stamp <revision>` "
+                  "for the revision this schema matches, then rerun.")
+            sys.exit(1)
+        else:
+            print("Creating database tables...")
+            Base.metadata.create_all(bind=engine)
+            command.stamp(alembic_config(), "head")
+            print("✅ Database tables created and stamped at Alembic head!")
     except Exception as e:
-        print(f"❌ Error creating tables: {e}")
\ No newline at end of file
+        print(f"❌ Error preparing database schema: {e}")
+        sys.exit(1)
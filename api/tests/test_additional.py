@@ -43,6 +43,25 @@ def test_login_bad_credentials():
     assert resp.status_code == 401
 
 
+def test_login_upgrades_legacy_password_hash():
+    from app.database import SessionLocal
+    from app.models import User
+    from tests.test_security import _legacy_hash
+
+    email = f"{uuid.uuid4()}@e.com"
+    register_user(email=email)
+    db = SessionLocal()
+    user = db.query(User).filter_by(email=email).first()
+    user.hashed_password = _legacy_hash(USER["password"])
+    db.commit()
+
+    assert login(email).status_code == 200
+    db.refresh(user)
+    assert user.hashed_password.startswith("$scrypt$")
+    assert login(email).status_code == 200
+    db.close()
+
+
 def test_dependents_routes():
     token = register_user(str(uuid.uuid4())+"@e.com").json()["access_token"]
     headers = {"Authorization": f"Bearer {token}"}
@@ -64,3 +83,83 @@ def test_trace_id_header_on_error():
 def test_profile_update_invalid_fields():
     token = register_user(email=f"{uuid.uuid4()}@e.com", kra_pin=str(uuid.uuid4())).json()["access_token"]
 
+
+
+def _auth(email):
+    register_user(email=email)
+    return {"Authorization": f"Bearer {login(email).json()['access_token']}"}
+
+
+def test_authenticated_user_is_cached_between_requests():
+    from sqlalchemy import event
+
+    headers = _auth(f"{uuid.uuid4()}@e.com")
+    assert client.get("/profile", headers=headers).status_code == 200
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert client.get("/profile", headers=headers).status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert statements and not any("FROM users" in s for s in statements)
+
+
+def test_user_cache_can_be_turned_off(monkeypatch):
+    from sqlalchemy import event
+    from app.core import cache
+
+    monkeypatch.setattr(cache, "USER_CACHE_TTL", 0)
+    headers = _auth(f"{uuid.uuid4()}@e.com")
+    assert client.get("/profile", headers=headers).status_code == 200
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert client.get("/profile", headers=headers).status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert any("FROM users" in s for s in statements)
+
+
+def test_cached_user_invalidated_on_role_change_and_deletion():
+    from app.core.cache import user_cache, user_cache_key
+    from app.database import SessionLocal
+    from app.models import User
+
+    email = f"{uuid.uuid4()}@e.com"
+    headers = _auth(email)
+    assert client.get("/profile", headers=headers).status_code == 200
+    db = SessionLocal()
+    user = db.query(User).filter_by(email=email).first()
+    assert user_cache.get(user_cache_key(str(user.id)))["role"] == "user"
+
+    user.role = "advisor"
+    db.commit()
+    assert user_cache.get(user_cache_key(str(user.id))) is None
+    db.close()
+
+    assert client.get("/profile", headers=headers).status_code == 200
+    resp = client.request("DELETE", "/auth/delete-account", json={"password": USER["password"]}, headers=headers)
+    assert resp.status_code == 200
+    assert client.get("/profile", headers=headers).status_code == 401
+
+
+def test_claims_only_read_skips_user_lookup():
+    from app.security import create_access_token
+
+    # A validly signed token for a user id that doesn't exist: claims-only
+    # reads never look the user up, full-user routes still reject it.
+    headers = {"Authorization": f"Bearer {create_access_token('999999')}"}
+    resp = client.get("/transactions/", headers=headers)
+    assert resp.status_code == 200 and resp.json() == []
+    assert client.get("/profile", headers=headers).status_code == 401
+    assert client.get("/transactions/", headers={"Authorization": "Bearer nope"}).status_code == 401
@@ -0,0 +1,145 @@
+import os
+import uuid
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app, Base, engine
+from app.database import SessionLocal
+from app.models import User
+
+Base.metadata.create_all(bind=engine)
+client = TestClient(app)
+
+
+def _register(user_type="user", dob="1990-01-01", dependents=0):
+    email = f"{uuid.uuid4()}@example.com"
+    resp = client.post(
+        "/auth/register",
+        json={
+            "email": email,
+            "password": "pass1234",
+            "user_type": user_type,
+            "dob": dob,
+            "dependents": dependents,
+            "kra_pin": str(uuid.uuid4()),
+            "questionnaire": [3] * 8,
+        },
+    )
+    assert resp.status_code == 201
+    return email, {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def _user_id(email):
+    with SessionLocal() as db:
+        return db.query(User.id).filter_by(email=email).scalar()
+
+
+def _admin():
+    email, headers = _register()
+    with SessionLocal() as db:
+        db.query(User).filter_by(email=email).first().is_superuser = True
+        db.commit()
+    return headers
+
+
+def _advisor():
+    email, headers = _register()
+    resp = client.put(f"/admin/users/{_user_id(email)}/role", json={"role": "advisor"}, headers=_admin())
+    assert resp.status_code == 200
+    return _user_id(email), headers
+
+
+def test_client_summaries_use_constant_queries():
+    advisor_id, advisor = _advisor()
+    clients = []
+    for i in range(25):
+        email, headers = _register(dob="2000-01-01" if i % 2 else "1960-01-01", dependents=i % 3)
+        clients.append(email)
+        assert client.post("/advisor/clients", json={"client_email": email}, headers=advisor).status_code == 201
+        assert client.post(f"/advisor/invitations/{advisor_id}/accept", headers=headers).status_code == 200
+        if i < 5:
+            client.post(
+                "/accounts/",
+                json={"name": "Checking", "type": "Checking", "balance": 1000.0 * (i + 1), "institution_name": "Bank"},
+                headers=headers,
+            )
+            client.post("/goals/", json={"name": "House", "target": "100", "current": "10", "progress": 10.0 * i}, headers=headers)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    pages, cursor = [], None
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        while True:
+            statements.clear()
+            params = {"limit": 10, **({"cursor": cursor} if cursor else {})}
+            resp = client.get("/advisor/clients", params=params, headers=advisor)
+            assert resp.status_code == 200
+            assert len(statements) == 3
+            pages.append(resp.json())
+            cursor = resp.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    summaries = [summary for page in pages for summary in page]
+    assert [s["email"] for s in summaries] == clients
+    first = summaries[0]
+    assert first["net_worth"] == 1000.0 and first["goal_count"] == 1 and first["persona"] == "Samuel"
+    assert summaries[3]["persona"] == "Jamal" and summaries[3]["goal_progress"] == 30.0
+    assert summaries[-1]["net_worth"] is None and summaries[-1]["goal_count"] == 0
+    assert all(s["alignment_score"] is not None for s in summaries)
+
+
+def test_client_routes_require_advisor_role():
+    email, user = _register()
+    assert client.get("/advisor/clients", headers=user).status_code == 403
+
+    # The role cannot be self-assigned at registration, only by an administrator
+    advisor_email, self_registered = _register("advisor")
+    assert client.post("/advisor/clients", json={"client_email": email}, headers=self_registered).status_code == 403
+    advisor_id = _user_id(advisor_email)
+    assert client.put(f"/admin/users/{advisor_id}/role", json={"role": "advisor"}, headers=user).status_code == 403
+
+    _, advisor = _advisor()
+    assert client.post("/advisor/clients", json={"client_email": "nobody@example.com"}, headers=advisor).status_code == 404
+    client_id = client.post("/advisor/clients", json={"client_email": email}, headers=advisor).json()["client_id"]
+    assert client.delete(f"/advisor/clients/{client_id}", headers=advisor).status_code == 204
+    assert client.get("/advisor/clients", headers=advisor).json() == []
+
+
+def test_clients_are_hidden_until_they_accept():
+    email, user = _register()
+    advisor_id, advisor = _advisor()
+    link = client.post("/advisor/clients", json={"client_email": email}, headers=advisor).json()
+    assert link["accepted"] is False
+    assert client.get("/advisor/clients", headers=advisor).json() == []
+
+    invitations = client.get("/advisor/invitations", headers=user).json()
+    assert [i["advisor_id"] for i in invitations] == [advisor_id]
+    assert client.post(f"/advisor/invitations/{advisor_id + 10**6}/accept", headers=user).status_code == 404
+    assert client.post(f"/advisor/invitations/{advisor_id}/accept", headers=user).json()["accepted"] is True
+    assert client.get("/advisor/invitations", headers=user).json() == []
+    assert [c["email"] for c in client.get("/advisor/clients", headers=advisor).json()] == [email]
+
+    # The client can revoke access again
+    assert client.delete(f"/advisor/invitations/{advisor_id}", headers=user).status_code == 204
+    assert client.get("/advisor/clients", headers=advisor).json() == []
+
+
+def test_revoking_the_role_drops_links():
+    email, user = _register()
+    advisor_id, advisor = _advisor()
+    client.post("/advisor/clients", json={"client_email": email}, headers=advisor)
+    client.post(f"/advisor/invitations/{advisor_id}/accept", headers=user)
+
+    assert client.put(f"/admin/users/{advisor_id}/role", json={"role": "user"}, headers=_admin()).status_code == 200
+    assert client.get("/advisor/clients", headers=advisor).status_code == 403
+    assert client.get("/advisor/invitations", headers=user).json() == []
@@ -0,0 +1,76 @@
+import os
+import uuid
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app, Base, engine
+
+Base.metadata.create_all(bind=engine)
+client = TestClient(app)
+
+
+def _headers():
+    email = f"{uuid.uuid4()}@example.com"
+    resp = client.post("/auth/register", json={"email": email, "password": "pass1234", "kra_pin": str(uuid.uuid4())})
+    assert resp.status_code == 201
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def _account(headers, name, type_, balance):
+    resp = client.post(
+        "/accounts/",
+        json={"name": name, "type": type_, "balance": balance, "institution_name": "Bank"},
+        headers=headers,
+    )
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+def test_balance_sheet_classifies_liabilities():
+    headers = _headers()
+    assert client.get("/balance-sheet/", headers=headers).json()["net_worth"] == 0
+
+    _account(headers, "Checking", "Checking", 1500.0)
+    _account(headers, "Savings", "Savings", 500.0)
+    card = _account(headers, "Card", "Credit Card", -300.0)
+    _account(headers, "Mortgage", "Mortgage", 1000.0)
+
+    sheet = client.get("/balance-sheet/", headers=headers).json()
+    assert sheet["total_assets"] == 2000.0
+    assert sheet["total_liabilities"] == 1300.0
+    assert sheet["net_worth"] == 700.0
+    assert {line["type"]: line["kind"] for line in sheet["breakdown"]} == {
+        "Checking": "asset", "Savings": "asset", "Credit Card": "liability", "Mortgage": "liability",
+    }
+
+    # Writes refresh the snapshot; the cache is dropped after commit
+    client.put(f"/accounts/{card}", json={"balance": -100.0}, headers=headers)
+    assert client.get("/balance-sheet/", headers=headers).json()["net_worth"] == 900.0
+    client.delete(f"/accounts/{card}", headers=headers)
+    assert client.get("/balance-sheet/", headers=headers).json()["total_liabilities"] == 1000.0
+
+    history = client.get("/balance-sheet/history", headers=headers).json()
+    assert len(history) == 1  # one point per day
+    assert history[0]["net_worth"] == 1000.0
+
+
+def test_balance_sheet_reads_do_not_scan_accounts():
+    headers = _headers()
+    for i in range(20):
+        _account(headers, f"Account {i}", "Savings", 100.0)
+    client.get("/balance-sheet/", headers=headers)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        sheet = client.get("/balance-sheet/", headers=headers).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert sheet["total_assets"] == 2000.0
+    assert not any("FROM accounts" in statement for statement in statements)
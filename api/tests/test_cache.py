@@ -0,0 +1,59 @@
+import time
+from datetime import date
+
+from app.core.cache import (
+    InMemoryCache,
+    invalidate_projection,
+    projection_cache,
+    projection_cache_key,
+)
+from app.models import Profile
+from app.api.v1.endpoints import timeline_clean
+
+
+def test_lru_evicts_least_recently_used():
+    cache = InMemoryCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_expires_entries():
+    cache = InMemoryCache(maxsize=10, ttl=0.01)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=60)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_projection_is_reused_until_profile_changes(monkeypatch):
+    built = []
+    original_init = timeline_clean.TimelineProjection.__init__
+
+    def counting_init(self, *args, **kwargs):
+        built.append(1)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(timeline_clean.TimelineProjection, "__init__", counting_init)
+    projection_cache.clear()
+    profile = Profile(user_id=42, date_of_birth=date(1990, 1, 1), dependents=1, annual_income=60000)
+
+    first = timeline_clean.get_timeline_projection(profile, None)
+    second = timeline_clean.get_timeline_projection(profile, None)
+    assert len(built) == 1
+    assert second.milestones == first.milestones
+    assert second.confidence_bands() == first.confidence_bands()
+
+    profile.annual_income = 90000  # new version hash
+    timeline_clean.get_timeline_projection(profile, None)
+    assert len(built) == 2
+
+    invalidate_projection(42)
+    assert projection_cache.get(projection_cache_key(42)) is None
+    timeline_clean.get_timeline_projection(profile, None)
+    assert len(built) == 3
@@ -0,0 +1,63 @@
+import os
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app import database
+from app.main import app
+
+
+def test_single_engine_per_process():
+    import sys
+    from app.core import database as core_database
+
+    assert core_database.engine is database.engine
+    # One package root: nothing is loaded a second time as api.app.*
+    assert not [name for name in sys.modules if name.startswith("api.app")]
+
+
+def test_pool_metrics_track_checkout_and_wait(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(database, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(database, "DB_POOL_TIMEOUT", 0.05)
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = database.get_engine(url)
+
+    with engine.connect():
+        held = database.pool_metrics(url)
+        assert held["checkouts"] == 1 and held["checked_out"] == 1 and held["size"] == 1
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    metrics = database.pool_metrics(url)
+    assert metrics["timeouts"] == 1
+    assert metrics["checked_out"] == 0 and metrics["checkins"] == 1
+    assert metrics["wait_seconds_max"] >= 0.05
+    engine.dispose()
+
+
+def test_pool_metrics_endpoint():
+    resp = TestClient(app).get("/healthz/db")
+    assert resp.status_code == 200
+    assert {"checkouts", "checkins", "wait_seconds_total"} <= resp.json().keys()
+
+
+def test_lifespan_warms_pools_without_ddl():
+    from sqlalchemy import event
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    before = database.pool_metrics()["checkouts"]
+    event.listen(database.engine, "before_cursor_execute", record)
+    try:
+        with TestClient(app) as client:
+            assert client.get("/healthz").status_code == 200
+    finally:
+        event.remove(database.engine, "before_cursor_execute", record)
+    assert database.pool_metrics()["checkouts"] > before
+    assert statements and not any("CREATE" in s.upper() for s in statements)
@@ -0,0 +1,51 @@
+import os
+import uuid
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+from fastapi.testclient import TestClient
+
+from app.main import app, Base, engine
+
+Base.metadata.create_all(bind=engine)
+client = TestClient(app)
+
+
+def _headers():
+    email = f"{uuid.uuid4()}@example.com"
+    resp = client.post("/auth/register", json={"email": email, "password": "pass1234", "kra_pin": str(uuid.uuid4())})
+    assert resp.status_code == 201
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+DEBTS = [
+    {"name": "Card", "balance": 500, "annual_rate": 0.20, "minimum_payment": 25},
+    {"name": "Car Loan", "balance": 5000, "annual_rate": 0.10, "minimum_payment": 100},
+    {"name": "Store Card", "balance": 2000, "annual_rate": 0.25, "minimum_payment": 50},
+]
+
+
+def test_payoff_plan_compares_strategies():
+    headers = _headers()
+    resp = client.post(
+        "/debts/payoff-plan",
+        json={"debts": DEBTS, "monthly_budget": 500, "strategies": ["avalanche", "snowball", "custom"], "custom_order": [1, 0, 2]},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    plan = resp.json()
+    assert plan["recommended"] == "avalanche"
+    by_name = {s["strategy"]: s for s in plan["strategies"]}
+    assert by_name["avalanche"]["order"] == ["Store Card", "Card", "Car Loan"]
+    assert by_name["snowball"]["order"] == ["Card", "Store Card", "Car Loan"]
+    avalanche = by_name["avalanche"]
+    assert len(avalanche["remaining"]) == avalanche["months_to_debt_free"] + 1
+    assert avalanche["remaining"][-1] == 0
+    assert avalanche["debt_free_date"] == max(d["payoff_date"] for d in avalanche["debts"])
+
+
+def test_payoff_plan_rejects_unaffordable_budget():
+    headers = _headers()
+    resp = client.post("/debts/payoff-plan", json={"debts": DEBTS, "monthly_budget": 100}, headers=headers)
+    assert resp.status_code == 422
+    resp = client.post("/debts/payoff-plan", json={"debts": DEBTS, "monthly_budget": 500, "strategies": ["custom"]}, headers=headers)
+    assert resp.status_code == 422
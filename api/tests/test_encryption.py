@@ -4,6 +4,7 @@ import datetime
 
 import pytest
 
+from app import encryption
 from app.encryption import EncryptedString
 
 
@@ -31,3 +32,76 @@ def test_date_encodes_as_str():
     assert encrypted != dt.isoformat()
     decrypted = field.process_result_value(encrypted, None)
     assert decrypted == dt.isoformat()
+
+
+def _legacy_xor(value: str, key: bytes) -> str:
+    data = value.encode()
+    return base64.b64encode(bytes(b ^ key[i % len(key)] for i, b in enumerate(data))).decode()
+
+
+def test_envelope_is_versioned_and_authenticated():
+    field = EncryptedString()
+    encrypted = field.process_bind_param("secret-value", None)
+    assert encrypted.startswith(f"v1:{encryption.keyring.active_key_id}:")
+    assert field.process_bind_param("secret-value", None) != encrypted  # fresh nonce
+
+    header, _, payload = encrypted.rpartition(":")
+    data = bytearray(base64.urlsafe_b64decode(payload))
+    data[-1] ^= 1
+    with pytest.raises(encryption.DecryptionError):
+        field.process_result_value(f"{header}:{base64.urlsafe_b64encode(bytes(data)).decode()}", None)
+
+
+def test_key_rotation_and_legacy_values():
+    old_key, new_key = os.urandom(32), os.urandom(32)
+    old = encryption.KeyRing({"k1": old_key}, "k1", legacy_key=old_key)
+    rotated = encryption.KeyRing({"k1": old_key, "k2": new_key}, "k2", legacy_key=old_key)
+
+    sealed_old = old.encrypt("1990-01-01")
+    legacy = _legacy_xor("A123", old_key)
+    assert rotated.decrypt(sealed_old) == "1990-01-01"
+    assert rotated.decrypt(legacy) == "A123"
+    assert rotated.needs_reencrypt(sealed_old) and rotated.needs_reencrypt(legacy)
+    assert not rotated.needs_reencrypt(rotated.encrypt("x"))
+    with pytest.raises(encryption.DecryptionError):
+        encryption.KeyRing({"k2": new_key}, "k2").decrypt(sealed_old)
+
+
+def test_reencrypt_column_rewrites_stale_rows(monkeypatch):
+    from sqlalchemy import create_engine, text
+
+    old_key, new_key = os.urandom(32), os.urandom(32)
+    old = encryption.KeyRing({"k1": old_key}, "k1", legacy_key=old_key)
+    rotated = encryption.KeyRing({"k1": old_key, "k2": new_key}, "k2", legacy_key=old_key)
+    values = [old.encrypt("a"), _legacy_xor("b", old_key), None, rotated.encrypt("d")]
+
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE secrets (id INTEGER PRIMARY KEY, pin VARCHAR)"))
+        conn.execute(text("INSERT INTO secrets (pin) VALUES (:pin)"), [{"pin": v} for v in values])
+
+    monkeypatch.setattr(encryption, "keyring", rotated)
+    with engine.begin() as conn:
+        assert encryption.reencrypt_column(conn, "secrets", "pin", batch_size=2) == 2
+        stored = [row[0] for row in conn.execute(text("SELECT pin FROM secrets ORDER BY id"))]
+    assert stored[2] is None and stored[3] == values[3]
+    assert all(value.startswith("v1:k2:") for value in stored if value)
+    assert [rotated.decrypt(v) for v in stored if v] == ["a", "b", "d"]
+
+
+def test_from_env_keeps_short_legacy_key_out_of_the_aes_keys(monkeypatch):
+    short, aes_key = b"legacy-xor", os.urandom(32)
+    monkeypatch.setenv("ENCRYPTION_KEY", base64.urlsafe_b64encode(short).decode())
+    monkeypatch.delenv("ENCRYPTION_KEY_ID", raising=False)
+    monkeypatch.delenv("ENCRYPTION_KEYS", raising=False)
+    with pytest.raises(ValueError, match="ENCRYPTION_KEYS"):
+        encryption.KeyRing.from_env()
+
+    monkeypatch.setenv("ENCRYPTION_KEYS", f"k1:{base64.urlsafe_b64encode(aes_key).decode()}")
+    keyring = encryption.KeyRing.from_env()
+    assert keyring.active_key_id == "k1" and keyring.legacy_key == short
+    assert keyring.decrypt(_legacy_xor("A123", short)) == "A123"
+
+    monkeypatch.setenv("ENCRYPTION_KEYS", f"k2:{base64.urlsafe_b64encode(short).decode()}")
+    with pytest.raises(ValueError, match="'k2'"):
+        encryption.KeyRing.from_env()
@@ -0,0 +1,72 @@
+import os
+import uuid
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+from fastapi.testclient import TestClient
+
+from app.main import app, Base, engine
+from app.database import SessionLocal
+from app.models import User
+
+Base.metadata.create_all(bind=engine)
+client = TestClient(app)
+
+
+def _register():
+    email = f"{uuid.uuid4()}@example.com"
+    resp = client.post(
+        "/auth/register",
+        json={"email": email, "password": "pass1234", "kra_pin": str(uuid.uuid4())},
+    )
+    assert resp.status_code == 201
+    return email, {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def _advisor():
+    email, _ = _register()
+    with SessionLocal() as db:
+        user = db.query(User).filter_by(email=email).first()
+        user.role = "advisor"
+        db.commit()
+        advisor_id = user.id
+    token = client.post("/auth/login", data={"username": email, "password": "pass1234"}).json()["access_token"]
+    return advisor_id, {"Authorization": f"Bearer {token}"}
+
+
+GRID = {"savings_rates": [0.0, 0.2, 0.5], "expected_returns": [0.05, 0.07], "annual_spends": [40000, 80000]}
+
+
+def test_grid_uses_stored_income_and_savings():
+    email, headers = _register()
+    client.post("/income-sources/", json={"name": "Salary", "amount": 10000.0, "frequency": "monthly"}, headers=headers)
+    client.post(
+        "/accounts/",
+        json={"name": "Savings", "type": "Savings", "balance": 50000.0, "institution_name": "Bank"},
+        headers=headers,
+    )
+
+    resp = client.post("/fire/grid", json={**GRID, "target_years": 20}, headers=headers)
+    assert resp.status_code == 200
+    grid = resp.json()
+    assert (grid["annual_income"], grid["current_savings"]) == (120000, 50000)
+    assert grid["required_portfolio"] == [1_000_000, 2_000_000]
+    assert len(grid["years_to_fi"]) == 3 and len(grid["years_to_fi"][0]) == 2
+    assert round(grid["years_to_fi"][0][0][0], 2) == 61.40  # growth of the 50k alone
+    faster, slower = grid["years_to_fi"][2][1][0], grid["years_to_fi"][1][1][0]
+    assert 0 < faster < slower
+    assert len(grid["required_savings_rate"]) == 2
+    assert client.post("/fire/grid", json={**GRID, "target_years": 20}, headers=headers).json() == grid
+
+    # Advisors can evaluate clients who accepted them only
+    advisor_id, advisor = _advisor()
+    assert client.post("/fire/grid", json={**GRID, "client_id": 10**6}, headers=advisor).status_code == 404
+    user_id = client.post("/advisor/clients", json={"client_email": email}, headers=advisor).json()["client_id"]
+    assert client.post("/fire/grid", json={**GRID, "client_id": user_id}, headers=advisor).status_code == 404
+    client.post(f"/advisor/invitations/{advisor_id}/accept", headers=headers)
+    assert client.post("/fire/grid", json={**GRID, "client_id": user_id}, headers=advisor).json()["annual_income"] == 120000
+
+
+def test_grid_size_is_limited():
+    _, headers = _register()
+    big = {"savings_rates": [0.1] * 100, "expected_returns": [0.05] * 100, "annual_spends": [40000] * 3}
+    assert client.post("/fire/grid", json=big, headers=headers).status_code == 422
@@ -0,0 +1,93 @@
+import os
+import uuid
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+from fastapi.testclient import TestClient
+
+from app.main import app, Base, engine
+
+Base.metadata.create_all(bind=engine)
+client = TestClient(app)
+
+
+def _headers():
+    email = f"{uuid.uuid4()}@example.com"
+    resp = client.post(
+        "/auth/register",
+        json={"email": email, "password": "pass1234", "dob": "1990-01-01", "kra_pin": str(uuid.uuid4()), "questionnaire": [3] * 8},
+    )
+    assert resp.status_code == 201
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def _goal(headers, name, target, current, target_date=None):
+    resp = client.post(
+        "/goals/",
+        json={"name": name, "target": target, "current": current, "progress": 0.0, "target_date": target_date},
+        headers=headers,
+    )
+    assert resp.status_code == 201
+    return resp.json()
+
+
+def test_goal_amounts_are_numeric():
+    headers = _headers()
+    goal = _goal(headers, "House", "KES 1,500,000", "250000")
+    assert (goal["target_amount"], goal["current_amount"]) == (1_500_000, 250_000)
+    updated = client.put(f"/goals/{goal['id']}", json={"current": "n/a"}, headers=headers).json()
+    assert updated["current"] == "n/a" and updated["current_amount"] is None
+
+
+def test_parse_amount_reads_the_first_number():
+    from app.crud.goal import parse_amount
+
+    assert parse_amount("Ksh. 50,000") == 50_000
+    assert parse_amount("50k") == 50_000
+    assert parse_amount("1.5M") == 1_500_000
+    assert parse_amount("2 million shillings") == 2_000_000
+    assert parse_amount("50 KES") == 50
+    assert parse_amount("-1,000.5") == -1000.5
+    assert parse_amount("soon") is None and parse_amount(None) is None
+
+
+def test_feasibility_for_all_goals():
+    headers = _headers()
+    client.post("/income-sources/", json={"name": "Salary", "amount": 100_000.0, "frequency": "monthly"}, headers=headers)
+    client.post("/expense-categories/", json={"name": "Living", "budgeted_amount": 60_000.0}, headers=headers)
+    _goal(headers, "Emergency", "120000", "120000", "2030-01-01")
+    _goal(headers, "House", "5000000", "0", "2040-06-30")
+    _goal(headers, "Someday", "300000", "0")
+    _goal(headers, "Vague", "a lot", "0", "2035-01-01")
+
+    resp = client.get("/goals/feasibility", params={"confidence": 0.8}, headers=headers)
+    assert resp.status_code == 200
+    goals = {g["name"]: g for g in resp.json()}
+    assert set(goals) == {"Emergency", "House", "Someday"}
+
+    emergency, house, someday = goals["Emergency"], goals["House"], goals["Someday"]
+    assert emergency["required_monthly_contribution"] == 0
+    assert emergency["success_probability"] > 0.5  # already funded, but markets can fall
+    assert emergency["projected_completion_years"] == 0
+    assert house["required_monthly_contribution"] > 0
+    # The 40k monthly surplus covers the house at 80% confidence
+    assert house["planned_monthly_contribution"] == house["required_monthly_contribution"]
+    assert house["success_probability"] >= 0.8
+    assert house["projected_completion_age"] == house["projected_completion_years"] + emergency["projected_completion_age"]
+    # Undated goals get no contribution but still report a (never) completion
+    assert someday["years_to_target"] is None and someday["success_probability"] is None
+    assert someday["planned_monthly_contribution"] == 0 and someday["projected_completion_years"] is None
+
+
+def test_feasibility_caps_paths_times_goals(monkeypatch):
+    from app.crud import goal as crud_goal
+
+    headers = _headers()
+    for name in ("A", "B", "C"):
+        _goal(headers, name, "100000", "0", "9999-01-01")
+    monkeypatch.setattr(crud_goal, "MAX_FEASIBILITY_CELLS", 3 * 1_000)
+    resp = client.get("/goals/feasibility", params={"paths": 1_001}, headers=headers)
+    assert resp.status_code == 422 and "fewer paths" in resp.json()["detail"]
+
+    resp = client.get("/goals/feasibility", params={"paths": 1_000}, headers=headers)
+    assert resp.status_code == 200
+    assert [g["years_to_target"] > crud_goal.MAX_GOAL_YEARS for g in resp.json()] == [True] * 3
@@ -0,0 +1,66 @@
+import os
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+import io
+import json
+import logging
+
+from fastapi.testclient import TestClient
+
+from app.core import log
+from app.main import app
+
+
+def _capture(monkeypatch):
+    stream = io.StringIO()
+    monkeypatch.setenv("LOG_FORMAT", "json")
+    log.configure_logging(stream)
+    return stream
+
+
+def _records(stream):
+    log.shutdown_logging()  # flushes the queue
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_records_carry_request_trace_id(monkeypatch):
+    stream = _capture(monkeypatch)
+    endpoint_logger = logging.getLogger("app.api.v1.endpoints.timeline_clean")
+    monkeypatch.setattr(endpoint_logger, "level", logging.DEBUG)
+    try:
+        response = TestClient(app).get("/api/v1/timeline/timeline/test")
+    finally:
+        records = _records(stream)
+        log.configure_logging()
+
+    assert response.status_code == 200
+    entry = next(r for r in records if r["message"] == "timeline test endpoint called")
+    assert entry["trace_id"] == response.headers["X-Trace-ID"]
+    assert entry["route"] == "/api/v1/timeline/timeline/test"
+    assert entry["level"] == "DEBUG"
+
+
+def test_sampling_drops_info_but_keeps_warnings(monkeypatch):
+    monkeypatch.setattr(log, "SAMPLE_RATES", {"/quiet/*": 0.0})
+    stream = _capture(monkeypatch)
+    logger = logging.getLogger("test.sampling")
+    try:
+        tokens = log.bind_request("abc", "/quiet/route")
+        logger.info("dropped")
+        logger.warning("kept", extra={"step": 3})
+        log.reset_request(tokens)
+        logger.info("outside request")
+    finally:
+        records = _records(stream)
+        log.configure_logging()
+
+    assert [r["message"] for r in records] == ["kept", "outside request"]
+    assert records[0]["step"] == 3 and records[0]["trace_id"] == "abc"
+
+
+def test_sample_decision_is_stable_per_trace(monkeypatch):
+    monkeypatch.setattr(log, "SAMPLE_RATES", {"/api/*": 0.5})
+    decisions = [log.should_sample(f"trace-{i}", "/api/x") for i in range(1000)]
+    assert 400 < sum(decisions) < 600
+    assert decisions == [log.should_sample(f"trace-{i}", "/api/x") for i in range(1000)]
+    assert log.sample_rate("/other") == log.SAMPLE_DEFAULT
@@ -0,0 +1,75 @@
+import os
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+import asyncio
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app import database
+from app.core import metrics
+from app.main import app
+
+
+def test_queries_are_attributed_to_the_current_request():
+    stats, token = metrics.start_request()
+    try:
+        with database.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+        async def run_async():
+            async with database.async_engine.connect() as connection:
+                await connection.execute(text("SELECT 3"))
+
+        asyncio.run(run_async())
+    finally:
+        metrics.current_queries.reset(token)
+
+    assert stats.count == 3
+    assert stats.seconds > 0
+    assert stats.most_repeated()[1] == 1
+
+
+
+def test_failed_statements_leave_no_timing_state():
+    stats, token = metrics.start_request()
+    try:
+        with database.engine.connect() as connection:
+            for _ in range(3):
+                try:
+                    connection.execute(text("SELECT * FROM no_such_table"))
+                except Exception:
+                    pass
+            connection.execute(text("SELECT 1"))
+            assert "query_start" not in connection.connection.info
+            assert "query_start" not in connection.info
+    finally:
+        metrics.current_queries.reset(token)
+
+    assert stats.count == 1
+
+
+def test_repeated_statement_is_flagged_as_n_plus_one(monkeypatch, caplog):
+    monkeypatch.setattr(metrics, "N_PLUS_ONE_THRESHOLD", 3)
+    before = metrics.query_budget_exceeded.value(route="/n-plus-one")
+    stats, token = metrics.start_request()
+    for _ in range(3):
+        stats.record("SELECT * FROM profiles WHERE user_id = ?", 0.001)
+    metrics.finish_request(token, stats, method="GET", route="/n-plus-one", status=200, seconds=0.01)
+
+    assert metrics.query_budget_exceeded.value(route="/n-plus-one") == before + 1
+    flagged = [r for r in caplog.records if r.getMessage() == "query budget exceeded"]
+    assert flagged and flagged[-1].repeats == 3
+
+
+def test_metrics_endpoint_exposes_route_histograms():
+    client = TestClient(app)
+    response = client.get("/healthz")
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+
+    body = client.get("/metrics").text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/healthz",le="+Inf"}' in body
+    assert 'http_requests_total{method="GET",route="/healthz",status="200"}' in body
+    assert 'db_queries_per_request_count{route="/healthz"}' in body
+    assert "# TYPE db_pool_checkouts counter" in body
@@ -0,0 +1,203 @@
+import os
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import engine, SessionLocal
+from app.models import Base, User, OnboardingState
+from app.crud import onboarding as crud_onboarding
+from app.main import app
+
+Base.metadata.create_all(bind=engine)
+
+
+def _user(email):
+    db = SessionLocal()
+    user = User(email=email, hashed_password="x")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def test_save_step_is_one_statement():
+    user_id = _user("onboarding-upsert@example.com")
+    db = SessionLocal()
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        first = crud_onboarding.save_step(db, user_id, 1, {"firstName": "Ada"})
+        second = crud_onboarding.save_step(db, user_id, 3, {"income": 1000})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    db.commit()
+
+    assert len(statements) == 2
+    assert first == {"current_step": 1, "completed_steps": [1], "is_complete": False}
+    assert second == {"current_step": 3, "completed_steps": [1, 3], "is_complete": False}
+
+    # Going back to an earlier step keeps the furthest current_step
+    assert crud_onboarding.save_step(db, user_id, 2, {"q1": 4})["completed_steps"] == [1, 2, 3]
+    assert crud_onboarding.save_step(db, user_id, 2, {})["current_step"] == 3
+    db.commit()
+    state = db.query(OnboardingState).filter_by(user_id=user_id).one()
+    assert state.completed_steps == [1, 3] and state.financial_data == {"income": 1000}
+    db.close()
+
+
+def test_patch_merges_top_level_fields():
+    user_id = _user("onboarding-patch@example.com")
+    db = SessionLocal()
+    crud_onboarding.save_step(db, user_id, 1, {"firstName": "Ada", "address": {"city": "London", "zip": "N1"}})
+    progress = crud_onboarding.save_step(
+        db, user_id, 1, {"lastName": "Lovelace", "firstName": None, "address": {"city": "Paris"}}, patch=True
+    )
+    db.commit()
+
+    state = db.query(OnboardingState).filter_by(user_id=user_id).one()
+    expected = {"lastName": "Lovelace", "address": {"city": "Paris"}}
+    assert state.personal_data == expected
+    assert crud_onboarding.apply_patch(
+        {"firstName": "Ada", "address": {"city": "London", "zip": "N1"}},
+        {"lastName": "Lovelace", "firstName": None, "address": {"city": "Paris"}},
+    ) == expected
+    assert progress["completed_steps"] == [1]
+
+    # Patching a step that has no row yet creates it
+    crud_onboarding.save_step(db, user_id, 4, {"goal": "house", "extra": None}, patch=True)
+    db.commit()
+    db.expire_all()
+    state = db.query(OnboardingState).filter_by(user_id=user_id).one()
+    assert state.goals_data == {"goal": "house"} and state.completed_steps == [1, 4]
+    db.close()
+
+
+def test_patch_endpoint_autosaves_fields():
+    client = TestClient(app)
+    email = "onboarding-route@example.com"
+    client.post(
+        "/auth/register",
+        json={"email": email, "password": "Secretpass1!", "first_name": "A", "last_name": "B", "phone_number": "+15555550100"},
+    )
+    token = client.post("/auth/login", data={"username": email, "password": "Secretpass1!"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    saved = client.post(
+        "/api/v1/onboarding/save-step", json={"step_number": 3, "step_data": {"income": 1}}, headers=headers
+    )
+    assert saved.status_code == 200 and saved.json()["completed_steps"] == [1, 3]
+    patched = client.patch("/api/v1/onboarding/steps/3", json={"expenses": 2}, headers=headers)
+    assert patched.status_code == 200 and patched.json()["current_step"] == 3
+
+    state = client.get("/api/v1/onboarding/state", headers=headers).json()
+    assert state["financial_data"] == {"income": 1, "expenses": 2}
+    assert client.patch("/api/v1/onboarding/steps/9", json={}, headers=headers).status_code == 400
+
+
+def test_autosave_coalesces_saves_and_flushes_on_complete(monkeypatch):
+    from app.core import autosave as autosave_module
+
+    monkeypatch.setattr(autosave_module, "AUTOSAVE_DEBOUNCE_SECONDS", 60)
+    buffer = autosave_module.autosave
+    client = TestClient(app)
+    email = "onboarding-autosave@example.com"
+    client.post(
+        "/auth/register",
+        json={"email": email, "password": "Secretpass1!", "first_name": "A", "last_name": "B", "phone_number": "+15555550101"},
+    )
+    token = client.post("/auth/login", data={"username": email, "password": "Secretpass1!"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    db = SessionLocal()
+    user_id = db.query(User).filter_by(email=email).one().id
+
+    for step, fields in [(1, {"firstName": "Ada"}), (2, {"q1": 3}), (3, {"income": 1}), (3, {"expenses": 2})]:
+        response = client.patch(f"/api/v1/onboarding/steps/{step}", json=fields, headers=headers)
+        assert response.status_code == 200
+    assert response.json()["completed_steps"] == [1, 2, 3]
+
+    # Nothing written yet, but reads see the buffered state
+    assert db.query(OnboardingState).filter_by(user_id=user_id).first() is None
+    state = client.get("/api/v1/onboarding/state", headers=headers).json()
+    assert state["financial_data"] == {"income": 1, "expenses": 2} and state["current_step"] == 3
+
+    writes = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.startswith("INSERT INTO onboarding_states"):
+            writes.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        completed = client.post("/api/v1/onboarding/complete", json={}, headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert completed.status_code == 200, completed.text
+    assert len(writes) == 3  # one per step, the two step-3 saves coalesced
+
+    stored = db.query(OnboardingState).filter_by(user_id=user_id).one()
+    assert stored.financial_data == {"income": 1, "expenses": 2} and stored.is_complete
+    assert buffer.overlay(user_id, {"current_step": 1}) == {"current_step": 1}
+    db.close()
+
+
+def test_autosave_flushes_are_serialised_and_failures_are_503(monkeypatch):
+    import threading
+    from app.core import autosave as autosave_module
+
+    monkeypatch.setattr(autosave_module, "AUTOSAVE_DEBOUNCE_SECONDS", 60)
+    buffer = autosave_module.AutosaveBuffer()
+    entered, release = threading.Event(), threading.Event()
+    save_step = crud_onboarding.save_step
+
+    def slow_save(db, user_id, step_number, data, patch=False):
+        entered.set()
+        release.wait(5)
+        return save_step(db, user_id, step_number, data, patch=patch)
+
+    monkeypatch.setattr(crud_onboarding, "save_step", slow_save)
+    db = SessionLocal()
+    user = User(email="onboarding-serial@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    buffer.submit(user.id, 1, {"firstName": "Ada"})
+    background = threading.Thread(target=buffer.flush_all)
+    background.start()
+    assert entered.wait(5)
+
+    # The step is in flight in another flush; flush_user must wait for its commit
+    flushed = threading.Thread(target=buffer.flush_user, args=(user.id,))
+    flushed.start()
+    flushed.join(0.2)
+    assert flushed.is_alive()
+    release.set()
+    background.join(5)
+    flushed.join(5)
+    assert not flushed.is_alive()
+    db.expire_all()
+    assert db.query(OnboardingState).filter_by(user_id=user.id).one().personal_data == {"firstName": "Ada"}
+    db.close()
+
+    def failing_save(*args, **kwargs):
+        raise RuntimeError("database is down")
+
+    monkeypatch.setattr(crud_onboarding, "save_step", failing_save)
+    client = TestClient(app)
+    email = "onboarding-flush-fails@example.com"
+    client.post(
+        "/auth/register",
+        json={"email": email, "password": "Secretpass1!", "first_name": "A", "last_name": "B", "phone_number": "+15555550102"},
+    )
+    token = client.post("/auth/login", data={"username": email, "password": "Secretpass1!"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.patch("/api/v1/onboarding/steps/1", json={"firstName": "Ada"}, headers=headers).status_code == 200
+    completed = client.post("/api/v1/onboarding/complete", json={}, headers=headers)
+    assert completed.status_code == 503
+    # Still buffered for the next attempt
+    assert client.get("/api/v1/onboarding/state", headers=headers).json()["personal_data"] == {"firstName": "Ada"}
+    autosave_module.autosave._pending.clear()
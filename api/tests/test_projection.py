@@ -0,0 +1,51 @@
+import os
+import uuid
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+from fastapi.testclient import TestClient
+
+from app.main import app, Base, engine
+
+Base.metadata.create_all(bind=engine)
+client = TestClient(app)
+
+
+def _headers():
+    email = f"{uuid.uuid4()}@example.com"
+    resp = client.post("/auth/register", json={"email": email, "password": "pass1234", "kra_pin": str(uuid.uuid4())})
+    assert resp.status_code == 201
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def test_projection_uses_income_expenses_and_balances():
+    headers = _headers()
+    client.post("/income-sources/", json={"name": "Salary", "amount": 5000.0, "frequency": "Monthly"}, headers=headers)
+    client.post("/income-sources/", json={"name": "Side", "amount": 500.0, "frequency": "weekly"}, headers=headers)
+    client.post("/expense-categories/", json={"name": "Rent", "budgeted_amount": 2000.0}, headers=headers)
+    client.post(
+        "/accounts/",
+        json={"name": "Savings", "type": "Savings", "balance": 10000.0, "institution_name": "Bank"},
+        headers=headers,
+    )
+    client.post(
+        "/accounts/",
+        json={"name": "Loan", "type": "Loan", "balance": 4000.0, "institution_name": "Bank"},
+        headers=headers,
+    )
+
+    resp = client.get("/projection/net-worth", params={"expected_return": 0.05, "inflation": 0.0}, headers=headers)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["annual_income"] == 5000 * 12 + 500 * 52
+    assert body["annual_expenses"] == 24000
+    assert (body["assets"], body["liabilities"]) == (10000, 4000)
+    assert len(body["net_worth"]) == 41 and len(body["savings"]) == 40
+    assert body["net_worth"][0] == 6000
+    assert body["net_worth"][1] == (10000 + 86000 - 24000) * 1.05 - 4000
+    assert body["expenses"][-1] == 24000
+
+
+def test_unknown_income_frequency_is_rejected():
+    headers = _headers()
+    client.post("/income-sources/", json={"name": "Gig", "amount": 100.0, "frequency": "sometimes"}, headers=headers)
+    assert client.get("/projection/net-worth", headers=headers).status_code == 422
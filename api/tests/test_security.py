@@ -1,8 +1,13 @@
+import base64
+import hashlib
+import os
+
 import jwt
 
 from app.security import (
     hash_password,
     verify_password,
+    needs_rehash,
     create_access_token,
     SECRET_KEY,
     ALGORITHM,
@@ -21,3 +26,21 @@ def test_create_access_token_contains_claims():
     decoded = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     assert decoded["sub"] == "user1"
     assert decoded["scope"] == "user"
+
+
+def _legacy_hash(password: str) -> str:
+    salt = os.urandom(16)
+    return base64.b64encode(salt + hashlib.sha256(salt + password.encode()).digest()).decode()
+
+
+def test_password_hash_is_versioned_scrypt():
+    hashed = hash_password("secret")
+    assert hashed.startswith("$scrypt$v=1$")
+    assert not needs_rehash(hashed)
+
+
+def test_legacy_sha256_hash_still_verifies_and_needs_rehash():
+    legacy = _legacy_hash("secret")
+    assert verify_password("secret", legacy)
+    assert not verify_password("bad", legacy)
+    assert needs_rehash(legacy)
@@ -0,0 +1,243 @@
+import os
+import uuid
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from app.main import app, Base, engine
+
+Base.metadata.create_all(bind=engine)
+client = TestClient(app)
+
+USER_DATA = {
+    "password": "pass1234",
+    "dob": "1990-01-01",
+    "annual_income": 10000,
+    "dependents": 0,
+    "goals": {"timeHorizon": 5},
+    "questionnaire": [3] * 8,
+}
+
+
+def _headers_and_account():
+    data = dict(USER_DATA, email=f"{uuid.uuid4()}@example.com", kra_pin=str(uuid.uuid4()))
+    token = client.post("/auth/register", json=data).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    account = {"name": "Checking", "type": "cash", "balance": 0.0, "institution_name": "Bank"}
+    account_id = client.post("/accounts/", json=account, headers=headers).json()["id"]
+    return headers, account_id
+
+
+def _headers_with_transactions(count: int):
+    headers, account_id = _headers_and_account()
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        tx = {
+            # Two transactions per day so (date, id) ties are exercised
+            "date": (start + timedelta(days=i // 2)).isoformat(),
+            "description": f"tx{i}",
+            "amount": float(i),
+            "category": "groceries" if i % 3 else "rent",
+            "account_id": account_id,
+        }
+        assert client.post("/transactions/", json=tx, headers=headers).status_code == 201
+    return headers
+
+
+def test_filters_and_offset_reach_the_query():
+    headers = _headers_with_transactions(9)
+    resp = client.get("/transactions/", params={"category": "rent"}, headers=headers)
+    assert [t["description"] for t in resp.json()] == ["tx0", "tx3", "tx6"]
+
+    resp = client.get(
+        "/transactions/",
+        params={"sort_by": "amount", "sort_order": "desc", "skip": 1, "limit": 2},
+        headers=headers,
+    )
+    assert [t["amount"] for t in resp.json()] == [7.0, 6.0]
+
+    resp = client.get("/transactions/", params={"start_date": "2024-01-03T00:00:00"}, headers=headers)
+    assert [t["description"] for t in resp.json()] == ["tx4", "tx5", "tx6", "tx7", "tx8"]
+
+
+def test_keyset_pagination_walks_every_row_once():
+    headers = _headers_with_transactions(7)
+    for order in ("asc", "desc"):
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3, "sort_order": order}
+            if cursor:
+                params["cursor"] = cursor
+            resp = client.get("/transactions/", params=params, headers=headers)
+            assert resp.status_code == 200
+            seen += [t["description"] for t in resp.json()]
+            cursor = resp.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        expected = [f"tx{i}" for i in range(7)]
+        assert seen == (expected if order == "asc" else expected[::-1])
+
+
+def test_keyset_pagination_includes_undated_rows():
+    from app.database import SessionLocal
+    from app.models import Transaction
+
+    headers = _headers_with_transactions(4)
+    user_id = client.get("/transactions/", headers=headers).json()[0]["user_id"]
+    with SessionLocal() as db:
+        db.add_all(Transaction(user_id=user_id, date=None, description=f"undated{i}", amount=1.0) for i in range(3))
+        db.commit()
+
+    for order in ("asc", "desc"):
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 2, "sort_order": order, **({"cursor": cursor} if cursor else {})}
+            resp = client.get("/transactions/", params=params, headers=headers)
+            assert resp.status_code == 200
+            seen += [t["description"] for t in resp.json()]
+            cursor = resp.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        expected = [f"tx{i}" for i in range(4)] + [f"undated{i}" for i in range(3)]
+        assert seen == (expected if order == "asc" else expected[::-1])
+
+
+def test_sort_by_is_whitelisted():
+    headers = _headers_with_transactions(1)
+    for params in ({"sort_by": "owner"}, {"sort_by": "__table__"}, {"sort_order": "sideways"},
+                   {"cursor": "not-a-cursor"}, {"sort_by": "amount", "cursor": "W10="}):
+        resp = client.get("/transactions/", params=params, headers=headers)
+        assert resp.status_code == 422, params
+
+
+CSV_EXPORT = """Date,Description,Amount,Category
+2024-01-05,Salary,"2,500.00",income
+2024-01-06,Groceries,-54.20,groceries
+not-a-date,Broken,10,misc
+2024-01-07,Refund,abc,misc
+07/01/2024,Coffee,(3.50),dining
+"""
+
+OFX_EXPORT = """OFXHEADER:100
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20240110120000[-5:EST]
+<TRNAMT>-42.00
+<NAME>Fuel
+</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT</TRNTYPE><DTPOSTED>20240111</DTPOSTED><TRNAMT>100.00</TRNAMT><NAME>Transfer</NAME></STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+QIF_EXPORT = """!Type:Bank
+D2024-01-12
+T-15.00
+PLunch
+Ldining
+^
+D2024-01-13
+T200
+PGift
+^
+"""
+
+
+def _import(headers, account_id, name, content, **form):
+    return client.post(
+        "/transactions/import",
+        data={"account_id": str(account_id), **form},
+        files={"file": (name, content.encode(), "text/plain")},
+        headers=headers,
+    )
+
+
+def test_import_csv_reports_bad_rows_without_aborting():
+    headers, account_id = _headers_and_account()
+    resp = _import(headers, account_id, "export.csv", CSV_EXPORT)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["imported"] == 3
+    assert body["failed"] == 2
+    assert [e["row"] for e in body["errors"]] == [4, 5]
+
+    rows = client.get("/transactions/", headers=headers).json()
+    assert [(t["description"], t["amount"]) for t in rows] == [
+        ("Salary", 2500.0), ("Groceries", -54.2), ("Coffee", -3.5),
+    ]
+    assert all(t["account_id"] == account_id for t in rows)
+
+
+def test_import_ofx_and_qif():
+    headers, account_id = _headers_and_account()
+    assert _import(headers, account_id, "bank.qfx", OFX_EXPORT).json()["imported"] == 2
+    assert _import(headers, account_id, "bank.txt", QIF_EXPORT, format="qif").json()["imported"] == 2
+    rows = client.get("/transactions/", headers=headers).json()
+    assert [t["description"] for t in rows] == ["Fuel", "Transfer", "Lunch", "Gift"]
+    assert [t["category"] for t in rows] == [None, None, "dining", None]
+    assert rows[0]["date"].startswith("2024-01-10T12:00:00")
+
+
+def test_failed_import_commits_nothing():
+    import pytest
+    from app.database import SessionLocal
+    from app.crud import transaction as crud_transaction
+    from app.models import Transaction
+
+    headers, account_id = _headers_and_account()
+    user_id = client.get(f"/accounts/{account_id}", headers=headers).json()["user_id"]
+
+    def rows():
+        for i in range(5):
+            yield {"date": datetime(2024, 1, 1), "amount": float(i), "description": f"row{i}", "category": None}
+        raise RuntimeError("connection lost")
+
+    with SessionLocal() as db:
+        with pytest.raises(RuntimeError):
+            crud_transaction.bulk_create_transactions(db, rows(), user_id, account_id, batch_size=2)
+        assert db.query(Transaction).filter_by(user_id=user_id).count() == 0
+
+
+def test_import_checks_account_ownership_once():
+    headers, _ = _headers_and_account()
+    _, other_account = _headers_and_account()
+    assert _import(headers, other_account, "export.csv", CSV_EXPORT).status_code == 404
+    assert _import(headers, other_account, "x.csv", "", format="xlsx").status_code in (404, 422)
+
+
+def _budget(headers, month):
+    resp = client.get("/budget/vs-actual", params={"month": month}, headers=headers)
+    assert resp.status_code == 200
+    return {line["category"]: line for line in resp.json()["lines"]}
+
+
+def test_budget_vs_actual_follows_transaction_crud():
+    headers, account_id = _headers_and_account()
+    client.post("/expense-categories/", json={"name": "Groceries", "budgeted_amount": 300.0}, headers=headers)
+
+    def create(amount, category, day):
+        tx = {"date": f"2024-03-{day:02d}T10:00:00", "description": "x", "amount": amount,
+              "category": category, "account_id": account_id}
+        return client.post("/transactions/", json=tx, headers=headers).json()["id"]
+
+    first = create(-120.0, "groceries", 2)
+    create(-80.0, "groceries", 15)
+    fuel = create(-40.0, "fuel", 20)
+
+    lines = _budget(headers, "2024-03")
+    assert lines["Groceries"]["actual"] == 200.0
+    assert lines["Groceries"]["variance"] == 100.0
+    assert lines["Groceries"]["transaction_count"] == 2
+    assert lines["fuel"]["budgeted"] is None
+
+    # Moving a transaction to another month/category updates both buckets
+    client.put(f"/transactions/{first}", json={"date": "2024-04-01T00:00:00", "category": "fuel"}, headers=headers)
+    client.delete(f"/transactions/{fuel}", headers=headers)
+    lines = _budget(headers, "2024-03")
+    assert lines["Groceries"]["actual"] == 80.0
+    assert lines["fuel"]["transaction_count"] == 0
+    assert _budget(headers, "2024-04")["fuel"]["actual"] == 120.0
+
+    _import(headers, account_id, "march.csv", "Date,Description,Amount,Category\n2024-03-30,Market,-20,Groceries\n")
+    assert _budget(headers, "2024-03")["Groceries"]["actual"] == 100.0
+
+    assert client.get("/budget/vs-actual", params={"month": "March"}, headers=headers).status_code == 422
@@ -0,0 +1,138 @@
+import os
+from datetime import date
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+from sqlalchemy import event
+
+from app.database import engine, SessionLocal
+from app.models import Base, User, Profile, OnboardingState
+from app.core.user_context import load_user_context
+from app.api.v1.endpoints.timeline_clean import TimelineProjection
+
+Base.metadata.create_all(bind=engine)
+
+
+def test_load_user_context_uses_one_query():
+    db = SessionLocal()
+    user = User(email="context@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    db.add(Profile(user_id=user.id, date_of_birth=date(1990, 1, 1), dependents=1, annual_income=60000))
+    db.add(OnboardingState(user_id=user.id, completed_steps=[1], is_complete=True))
+    db.commit()
+    user_id = user.id
+    db.close()
+
+    db = SessionLocal()
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        context = load_user_context(db, user_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert context.user.id == user_id
+    assert context.profile.annual_income == 60000
+    assert context.onboarding.is_complete
+    assert len(statements) == 1
+    db.close()
+
+
+def test_load_user_context_missing_user():
+    db = SessionLocal()
+    assert load_user_context(db, 987654) is None
+    db.close()
+
+
+def test_timeline_projection_caches_confidence_bands():
+    profile = Profile(user_id=1, date_of_birth=date(1990, 1, 1), dependents=1, annual_income=60000)
+    projection = TimelineProjection(profile, None)
+    assert projection.persona == "Aisha"
+    assert projection.milestones
+    bands = projection.confidence_bands(n_paths=500)
+    assert projection.confidence_bands(n_paths=500) is bands
+
+
+def test_async_user_context_matches_sync_and_serves_timeline():
+    import asyncio
+    from fastapi.testclient import TestClient
+    from app.database import AsyncSessionLocal
+    from app.core.user_context import load_user_context_async
+    from app.main import app
+    from app.security import create_access_token
+
+    db = SessionLocal()
+    user = User(email="async-context@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    db.add(Profile(user_id=user.id, date_of_birth=date(1985, 6, 1), dependents=2, annual_income=90000))
+    db.commit()
+    user_id = user.id
+    db.close()
+
+    async def load():
+        async with AsyncSessionLocal() as session:
+            return await load_user_context_async(session, str(user_id))
+
+    context = asyncio.run(load())
+    assert context.user.id == user_id and context.profile.dependents == 2 and context.onboarding is None
+
+    headers = {"Authorization": f"Bearer {create_access_token(str(user_id))}"}
+    resp = TestClient(app).get("/api/v1/timeline/timeline/journey?paths=500", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["user_id"] == user_id
+
+
+def test_timeline_survives_milestone_without_target_age():
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.security import create_access_token
+
+    db = SessionLocal()
+    user = User(email="no-target-age@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    db.add(Profile(user_id=user.id, date_of_birth=date(1990, 1, 1), dependents=0, annual_income=60000))
+    db.commit()
+    user_id = user.id
+    db.close()
+
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {create_access_token(str(user_id))}"}
+    resp = client.post(
+        "/api/v1/timeline/timeline/milestone",
+        json={"title": "Someday", "target_amount": "a lot"},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert resp.json()["milestone"]["target_age"] is None
+
+    for path in ("journey?paths=500", "alignment", "dashboard-overview"):
+        assert client.get(f"/api/v1/timeline/timeline/{path}", headers=headers).status_code == 200
+
+
+def test_milestone_confidence_skips_bad_ages_and_caps_horizon(monkeypatch):
+    from types import SimpleNamespace
+    from app.api.v1.endpoints import timeline_clean
+
+    horizons = []
+    simulate_growth = timeline_clean.simulate_growth
+
+    def record(years, *args, **kwargs):
+        horizons.append(years)
+        return simulate_growth(years, *args, **kwargs)
+
+    monkeypatch.setattr(timeline_clean, "simulate_growth", record)
+    profile = SimpleNamespace(user_id=1, risk_level=3, annual_income=60000, goals={})
+    milestones = [
+        {"id": "a", "age": "forty", "target_amount": 1000},
+        {"id": "b", "age": 20000, "target_amount": 1000},
+        {"id": "c", "age": 40, "target_amount": 1000},
+    ]
+    confidence = timeline_clean.estimate_milestone_confidence(profile, milestones, 30, n_paths=200)
+    assert confidence[0] is None and confidence[1] == confidence[2] == 100
+    assert horizons == [70]
+    assert timeline_clean.estimate_milestone_confidence(profile, milestones[:1], 30) == [None]
@@ -0,0 +1,101 @@
+import os
+import uuid
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+from fastapi.testclient import TestClient
+
+from app.main import app, Base, engine
+from app.database import SessionLocal
+from app.models import Profile, User
+
+Base.metadata.create_all(bind=engine)
+client = TestClient(app)
+
+WHAT_IF = "/api/v1/timeline/timeline/what-if"
+
+
+def _register():
+    email = f"{uuid.uuid4()}@example.com"
+    resp = client.post(
+        "/auth/register",
+        json={
+            "email": email,
+            "password": "pass1234",
+            "dob": "1998-01-01",
+            "annual_income": 600000,
+            "kra_pin": str(uuid.uuid4()),
+            "questionnaire": [3] * 8,
+        },
+    )
+    assert resp.status_code == 201
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    client.post("/expense-categories/", json={"name": "Living", "budgeted_amount": 30000.0}, headers=headers)
+    client.post(
+        "/accounts/",
+        json={"name": "Savings", "type": "Savings", "balance": 100000.0, "institution_name": "Bank"},
+        headers=headers,
+    )
+    return email, headers
+
+
+def test_what_if_recomputes_only_affected_parts():
+    email, headers = _register()
+    resp = client.post(WHAT_IF, json={"annual_expenses": 240000}, headers=headers)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["recomputed"] == ["net_worth"]
+    before, after = body["before"], body["after"]
+    assert before["net_worth"][0] == after["net_worth"][0] == 100000
+    assert after["net_worth"][-1] > before["net_worth"][-1]  # 360k/yr budget cut to 240k
+    assert (after["persona"], after["alignment_score"]) == (before["persona"], before["alignment_score"])
+    shifts = {s["id"]: s for s in body["milestone_shifts"]}
+    assert shifts["first_investment"]["age_before"] == shifts["first_investment"]["age_after"]
+    assert shifts["first_investment"]["shift_years"] <= 0
+
+    assert client.post(WHAT_IF, json={"assets": 0}, headers=headers).json()["after"]["net_worth"][0] == 0
+
+    # Nothing was written
+    with SessionLocal() as db:
+        profile = db.query(Profile).join(User, User.id == Profile.user_id).filter(User.email == email).one()
+        assert profile.dependents == 0 and profile.annual_income == 600000
+
+
+def test_what_if_profile_changes_move_persona_and_milestones():
+    _, headers = _register()
+    body = client.post(WHAT_IF, json={"date_of_birth": "1960-01-01", "annual_income": 1200000}, headers=headers).json()
+    assert body["recomputed"] == ["milestones", "net_worth", "persona"]
+    assert (body["before"]["persona"], body["after"]["persona"]) == ("Jamal", "Samuel")
+    shifts = {s["id"]: s for s in body["milestone_shifts"]}
+    assert shifts["emergency_fund"]["age_after"] is None  # Jamal-only milestone
+    assert shifts["retirement_fund"]["age_before"] is None and shifts["retirement_fund"]["age_after"] == 65
+    assert shifts["retirement_fund"]["target_amount"] == 12000000
+
+
+def test_baseline_is_refreshed_after_account_writes():
+    _, headers = _register()
+    first = client.post(WHAT_IF, json={}, headers=headers).json()
+    assert first["recomputed"] == [] and first["before"] == first["after"]
+    client.post(
+        "/accounts/",
+        json={"name": "Loan", "type": "Loan", "balance": 40000.0, "institution_name": "Bank"},
+        headers=headers,
+    )
+    assert client.post(WHAT_IF, json={}, headers=headers).json()["before"]["net_worth"][0] == 60000
+
+
+def test_unknown_income_frequency_is_unprocessable():
+    _, headers = _register()
+    client.post("/income-sources/", json={"name": "Gig", "amount": 100.0, "frequency": "whenever"}, headers=headers)
+    resp = client.post(WHAT_IF, json={"assets": 0}, headers=headers)
+    assert resp.status_code == 422 and "whenever" in resp.json()["detail"]
+
+
+def test_what_if_goals_must_be_numeric():
+    _, headers = _register()
+    for goal in ({"target_age": "forty"}, {"target_amount": "50k"}, {"target_age": 20000}, {"target_amount": -1}):
+        resp = client.post(WHAT_IF, json={"goals": {"house": goal}}, headers=headers)
+        assert resp.status_code == 422, goal
+    goal = {"title": "House", "target_age": 40, "target_amount": 500000, "category": "home"}
+    body = client.post(WHAT_IF, json={"goals": {"house": goal}}, headers=headers).json()
+    shifts = {s["id"]: s for s in body["milestone_shifts"]}
+    assert shifts["house"]["age_after"] == 40 and shifts["house"]["target_amount"] == 500000
@@ -0,0 +1 @@
+"""Ad-hoc throughput benchmarks. Run a module with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,102 @@
+"""
+Concurrent load on the async read routes (/transactions/, v1 timeline) and
+/auth/login with httpx.
+
+Against a running server backed by a local Postgres (the meaningful case,
+since the async routes win when requests wait on DB round-trips):
+
+    uvicorn app.main:app --app-dir api --workers 1 &
+    PYTHONPATH=api python -m benchmarks.bench_async_routes \\
+        --base-url http://127.0.0.1:8000 --concurrency 200
+
+Without --base-url the app runs in-process on in-memory SQLite, which is
+only a smoke test of the harness.
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+
+import httpx
+
+ROUTES = {
+    "transactions": "/transactions/?limit=50",
+    "dashboard": "/api/v1/timeline/timeline/dashboard-overview",
+    "journey": "/api/v1/timeline/timeline/journey?paths=1000",
+}
+
+
+async def _seed(client: httpx.AsyncClient) -> dict:
+    email, password = f"bench-{uuid.uuid4()}@example.com", "benchpassword"
+    registered = await client.post("/auth/register", json={
+        "email": email, "password": password, "dob": "1988-04-02", "kra_pin": str(uuid.uuid4()),
+        "annual_income": 85000, "dependents": 2,
+        "goals": {"type": "growth", "targetAmount": 250000, "timeHorizon": 20},
+        "questionnaire": [3] * 8, "role": "user",
+    })
+    registered.raise_for_status()
+    headers = {"Authorization": f"Bearer {registered.json()['access_token']}"}
+    account = await client.post("/accounts/", json={"name": "Bench", "type": "cash", "balance": 0, "institution_name": "Bank"}, headers=headers)
+    account.raise_for_status()
+    rows = "\n".join(f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d},Shop {i},-{i % 90}.50,cat{i % 8}" for i in range(500))
+    imported = await client.post(
+        "/transactions/import", headers=headers,
+        data={"account_id": str(account.json()["id"])},
+        files={"file": ("bench.csv", "Date,Description,Amount,Category\n" + rows, "text/csv")},
+    )
+    imported.raise_for_status()
+    return {"headers": headers, "email": email, "password": password}
+
+
+async def _run(client: httpx.AsyncClient, make_request, total: int, concurrency: int):
+    latencies = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with gate:
+            start = time.perf_counter()
+            response = await make_request()
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return total / elapsed, statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1]
+
+
+async def main_async(args) -> None:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+    else:
+        from app.main import Base, app, engine
+
+        Base.metadata.create_all(bind=engine)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+    async with client:
+        seeded = await _seed(client)
+        scenarios = {name: (lambda path=path: client.get(path, headers=seeded["headers"])) for name, path in ROUTES.items()}
+        scenarios["login"] = lambda: client.post(
+            "/auth/login", data={"username": seeded["email"], "password": seeded["password"]}
+        )
+        for name, make_request in scenarios.items():
+            total = args.requests if name != "login" else max(args.requests // 10, 1)
+            rate, p50, p95 = await _run(client, make_request, total, args.concurrency)
+            print(f"{name:13s} {rate:8.0f} req/s   p50 {p50 * 1000:7.1f} ms   p95 {p95 * 1000:7.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="running server to load; default is in-process")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
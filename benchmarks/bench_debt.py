@@ -0,0 +1,39 @@
+"""
+Latency of comparing debt payoff strategies.
+
+    python -m benchmarks.bench_debt [--debts 300] [--months 360]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from compute.debt import compare_strategies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--debts", type=int, default=300)
+    parser.add_argument("--months", type=int, default=360)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    balances = rng.uniform(1_000, 50_000, args.debts)
+    rates = rng.uniform(0.03, 0.30, args.debts)
+    minimums = balances * rates / 12 + balances * 0.01
+    strategies = ("avalanche", "snowball", "custom")
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        compare_strategies(balances, rates, minimums, minimums.sum() * 1.2, strategies=strategies,
+                           custom_order=rng.permutation(args.debts), months=args.months)
+        timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    print(f"{args.debts} debts x {args.months} months, {len(strategies)} strategies")
+    print(f"  best {timings[0] * 1e3:.1f} ms, median {timings[len(timings) // 2] * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Encrypted column cost: load N profile-like rows with two EncryptedString
+columns, and compare per-row decrypt cost with the old XOR scheme.
+Load time includes ORM row construction; decrypt-only isolates the cipher.
+
+    PYTHONPATH=api python -m benchmarks.bench_encryption [--rows 100000]
+"""
+import argparse
+import base64
+import time
+
+from sqlalchemy import Column, Integer, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+from app.encryption import EncryptedString, keyring
+
+Base = declarative_base()
+
+
+class EncryptedProfile(Base):
+    __tablename__ = "bench_encrypted_profiles"
+
+    id = Column(Integer, primary_key=True)
+    kra_pin = Column(EncryptedString)
+    date_of_birth = Column(EncryptedString)
+
+
+def _xor(value: str, key: bytes) -> str:
+    data = value.encode()
+    return base64.b64encode(bytes(b ^ key[i % len(key)] for i, b in enumerate(data))).decode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    rows = [{"kra_pin": f"A{i:09d}Z", "date_of_birth": f"19{i % 90 + 10}-01-01"} for i in range(args.rows)]
+
+    start = time.perf_counter()
+    with Session(engine) as session:
+        session.execute(EncryptedProfile.__table__.insert(), rows)
+        session.commit()
+    write = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with Session(engine) as session:
+        loaded = session.scalars(select(EncryptedProfile)).all()
+    read = time.perf_counter() - start
+    assert loaded[-1].kra_pin == rows[-1]["kra_pin"]
+
+    sealed = [(keyring.encrypt(r["kra_pin"]), keyring.encrypt(r["date_of_birth"])) for r in rows]
+    start = time.perf_counter()
+    for pin, dob in sealed:
+        keyring.decrypt(pin)
+        keyring.decrypt(dob)
+    aead = time.perf_counter() - start
+
+    # Previous scheme, decrypt only, same values
+    key = keyring.legacy_key or bytes(32)
+    legacy = [(_xor(r["kra_pin"], key), _xor(r["date_of_birth"], key)) for r in rows]
+    start = time.perf_counter()
+    for pin, dob in legacy:
+        for value in (pin, dob):
+            data = base64.b64decode(value)
+            bytes(b ^ key[i % len(key)] for i, b in enumerate(data)).decode()
+    xor = time.perf_counter() - start
+
+    print(f"{args.rows} rows, 2 encrypted columns each (AES-GCM, key {keyring.active_key_id!r})")
+    print(f"insert: {write:.2f}s ({write / args.rows * 1e6:.1f} us/row)")
+    print(f"load:   {read:.2f}s ({read / args.rows * 1e6:.1f} us/row)")
+    print(f"decrypt only: AES-GCM {aead / args.rows * 1e6:.1f} us/row, "
+          f"legacy XOR {xor / args.rows * 1e6:.1f} us/row")
+
+
+if __name__ == "__main__":
+    main()
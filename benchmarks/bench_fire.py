@@ -0,0 +1,39 @@
+"""
+Latency of a FIRE scenario grid (savings rate x return x spend).
+
+    python -m benchmarks.bench_fire [--rates 20] [--returns 10] [--spends 10]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from compute.fire import evaluate_grid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rates", type=int, default=20)
+    parser.add_argument("--returns", type=int, default=10)
+    parser.add_argument("--spends", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rates = np.linspace(0.05, 0.7, args.rates)
+    returns = np.linspace(0.02, 0.10, args.returns)
+    spends = np.linspace(200_000, 2_000_000, args.spends)
+    points = rates.size * returns.size * spends.size
+    for label, growth, inflation in (("closed form", 0.0, 0.0), ("root-finder", 0.04, 0.05)):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            evaluate_grid(500_000, 1_200_000, rates, returns, spends,
+                          income_growth=growth, inflation=inflation, target_years=20)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(f"{points:,} scenarios, {label}")
+        print(f"  best {timings[0] * 1e3:.2f} ms, median {timings[len(timings) // 2] * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Login throughput: password verification at the configured scrypt cost,
+sequentially and as a concurrent burst through the bounded hashing pool.
+
+    PYTHONPATH=api DATABASE_URL=sqlite:///:memory: \\
+        python -m benchmarks.bench_login [--logins 64]
+
+Tune with PASSWORD_SCRYPT_N / _R / _P and PASSWORD_HASH_WORKERS.
+"""
+import argparse
+import asyncio
+import time
+
+from app import security
+
+
+async def _burst(hashed: str, logins: int) -> None:
+    results = await asyncio.gather(
+        *(security.verify_password_async("correct horse", hashed) for _ in range(logins))
+    )
+    assert all(results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=64)
+    args = parser.parse_args()
+
+    hashed = security.hash_password("correct horse")
+    print(f"cost: n={security.SCRYPT_N} r={security.SCRYPT_R} p={security.SCRYPT_P}, "
+          f"workers={security._hash_executor._max_workers}")
+
+    start = time.perf_counter()
+    for _ in range(args.logins):
+        assert security.verify_password("correct horse", hashed)
+    sequential = time.perf_counter() - start
+    print(f"sequential: {sequential / args.logins * 1000:.1f} ms/login, "
+          f"{args.logins / sequential:.0f} logins/s")
+
+    start = time.perf_counter()
+    asyncio.run(_burst(hashed, args.logins))
+    burst = time.perf_counter() - start
+    print(f"pooled burst: {args.logins / burst:.0f} logins/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Latency of one user's Monte Carlo milestone simulation.
+
+    python -m benchmarks.bench_monte_carlo [--paths 10000] [--years 40]
+"""
+import argparse
+import time
+
+from compute.monte_carlo import simulate_milestones
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paths", type=int, default=10_000)
+    parser.add_argument("--years", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    milestone_years = list(range(5, args.years + 1, 5))
+    targets = [50_000 * y for y in milestone_years]
+    timings = []
+    for i in range(args.repeat):
+        start = time.perf_counter()
+        simulate_milestones(0, 12_000, milestone_years, targets, 0.07, 0.14,
+                            n_paths=args.paths, seed=i)
+        timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    print(f"{args.paths:,} paths x {args.years} years, {len(targets)} milestones")
+    print(f"  best {timings[0] * 1e3:.1f} ms, median {timings[len(timings) // 2] * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
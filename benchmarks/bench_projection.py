@@ -0,0 +1,52 @@
+"""
+Latency of the net-worth projection for one user and for a batch of users.
+
+    python -m benchmarks.bench_projection [--users 10000] [--years 40]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from compute.projection import project_batch, project_net_worth
+
+
+def _best_and_median(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[0], timings[len(timings) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--years", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    best, median = _best_and_median(
+        lambda: project_net_worth(60_000, 40_000, 10_000, 2_000, years=args.years), args.repeat
+    )
+    print(f"single user x {args.years} years")
+    print(f"  best {best * 1e6:.0f} us, median {median * 1e6:.0f} us")
+
+    rng = np.random.default_rng(0)
+    income = rng.uniform(20_000, 200_000, args.users)
+    expenses = income * rng.uniform(0.5, 1.0, args.users)
+    assets = rng.uniform(0, 100_000, args.users)
+    returns = rng.choice([0.04, 0.05, 0.06, 0.07, 0.08], args.users)
+    best, median = _best_and_median(
+        lambda: project_batch(income, expenses, assets, years=args.years, expected_return=returns),
+        args.repeat,
+    )
+    print(f"{args.users:,} users x {args.years} years")
+    print(f"  best {best * 1e3:.1f} ms, median {median * 1e3:.1f} ms"
+          f" ({median / args.users * 1e6:.2f} us per user)")
+
+
+if __name__ == "__main__":
+    main()
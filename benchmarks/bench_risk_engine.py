@@ -0,0 +1,61 @@
+"""
+Throughput of the scalar vs batch risk-scoring paths.
+
+    python -m benchmarks.bench_risk_engine [--sizes 10000 100000 1000000]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from compute.risk_engine import (
+    compute_risk_level,
+    compute_risk_levels,
+    compute_risk_score,
+    compute_risk_scores,
+)
+
+
+def _columns(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.integers(18, 90, n),
+        rng.uniform(0, 400_000, n),
+        rng.integers(0, 6, n),
+        rng.integers(1, 40, n),
+        rng.integers(1, 6, (n, 8)),
+    )
+
+
+def _scalar(ages, incomes, dependents, horizons, answers):
+    rows = zip(ages.tolist(), incomes.tolist(), dependents.tolist(),
+               horizons.tolist(), answers.tolist())
+    for age, income, deps, horizon, q in rows:
+        compute_risk_level(compute_risk_score(age, income, deps, horizon, q))
+
+
+def _batch(ages, incomes, dependents, horizons, answers):
+    compute_risk_levels(compute_risk_scores(ages, incomes, dependents, horizons, answers))
+
+
+def _time(fn, cols) -> float:
+    start = time.perf_counter()
+    fn(*cols)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'profiles':>10} {'scalar/s':>14} {'batch/s':>14} {'speedup':>8}")
+    for n in args.sizes:
+        cols = _columns(n)
+        scalar = _time(_scalar, cols)
+        batch = _time(_batch, cols)
+        print(f"{n:>10,} {n / scalar:>14,.0f} {n / batch:>14,.0f} {scalar / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Cold start: app import time, lifespan startup time and first-request latency,
+each measured in a fresh interpreter, with the default blocking warm-up and
+with FAST_STARTUP=1 (warm-up in the background).
+
+    PYTHONPATH=api:. python -m benchmarks.bench_startup [--runs 3] [--database-url URL]
+
+Defaults to a throwaway SQLite file; point --database-url at Postgres for
+production-like numbers (the schema must already exist there).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROUTES = ("/transactions/", "/profile", "/api/v1/timeline/timeline/journey")
+
+
+def _seed() -> None:
+    from datetime import date
+
+    from app.database import SessionLocal, engine
+    from app.models import Base, Profile, User
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user = User(email=f"startup-{time.time()}@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    db.add(Profile(user_id=user.id, date_of_birth=date(1988, 4, 2), dependents=1, annual_income=85000,
+                   goals={"timeHorizon": 20}, questionnaire=[3] * 8))
+    db.commit()
+    print(user.id)
+
+
+def _measure(user_id: str) -> None:
+    start = time.perf_counter()
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.security import create_access_token
+    imported = time.perf_counter()
+
+    result = {"import_s": imported - start}
+    with TestClient(app) as client:
+        result["startup_s"] = time.perf_counter() - imported
+        headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+        for route in ROUTES:
+            begin = time.perf_counter()
+            client.get(route, headers=headers).raise_for_status()
+            result[route] = time.perf_counter() - begin
+    print(json.dumps(result))
+
+
+def _child(mode: str, env: dict, *args: str) -> str:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child", mode, *args],
+        env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return output.strip().splitlines()[-1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--database-url")
+    parser.add_argument("--child", choices=("seed", "measure"), help=argparse.SUPPRESS)
+    parser.add_argument("user_id", nargs="?", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child == "seed":
+        return _seed()
+    if args.child == "measure":
+        return _measure(args.user_id)
+
+    env = dict(os.environ, SECRET_KEY=os.getenv("SECRET_KEY", "startup-bench"))
+    env["DATABASE_URL"] = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/startup.db"
+    user_id = _child("seed", env)
+
+    for label, extra in (("warm-up", {}), ("FAST_STARTUP=1", {"FAST_STARTUP": "1"})):
+        runs = [json.loads(_child("measure", dict(env, **extra), user_id)) for _ in range(args.runs)]
+        print(f"{label} (median of {args.runs} cold starts)")
+        for key in ("import_s", "startup_s", *ROUTES):
+            value = statistics.median(run[key] for run in runs) * 1000
+            print(f"  {key:40s} {value:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
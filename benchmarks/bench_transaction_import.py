@@ -0,0 +1,54 @@
+"""
+Bulk transaction import: parse + batched INSERT of a synthetic CSV export.
+
+    PYTHONPATH=api DATABASE_URL=sqlite:///:memory: \\
+        python -m benchmarks.bench_transaction_import [--rows 100000]
+
+Point DATABASE_URL at Postgres for production-like numbers.
+"""
+import argparse
+import io
+import time
+from datetime import date, timedelta
+
+from app.crud import transaction as crud_transaction
+from app.database import SessionLocal, engine
+from app.models import Account, Base, User
+from app.transaction_import import RowError, parse_csv
+
+
+def _csv(rows: int) -> str:
+    start = date(2020, 1, 1)
+    lines = ["Date,Description,Amount,Category"]
+    for i in range(rows):
+        lines.append(f"{start + timedelta(days=i % 1500)},Merchant {i % 97},{(i % 500) - 250}.25,cat{i % 12}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user = User(email=f"bench-{time.time()}@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    account = Account(name="Bench", type="cash", balance=0, user_id=user.id)
+    db.add(account)
+    db.commit()
+
+    text = _csv(args.rows)
+    start = time.perf_counter()
+    valid = (r for _, r in parse_csv(io.StringIO(text)) if not isinstance(r, RowError))
+    inserted = crud_transaction.bulk_create_transactions(
+        db, valid, user_id=user.id, account_id=account.id, batch_size=args.batch_size
+    )
+    elapsed = time.perf_counter() - start
+    print(f"{inserted:,} rows in {elapsed:.2f} s ({inserted / elapsed:,.0f} rows/s, {engine.dialect.name})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# compute/fire.py
+
+"""Vectorised financial-independence (FIRE) solver."""
+
+from typing import Dict, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+DEFAULT_WITHDRAWAL_RATE = 0.04
+DEFAULT_MAX_YEARS = 100
+# Regula falsi steps refining a crossing inside its year
+_REFINE_STEPS = 12
+
+
+def required_portfolio(annual_spend: ArrayLike, withdrawal_rate: ArrayLike = DEFAULT_WITHDRAWAL_RATE) -> np.ndarray:
+    """Portfolio whose ``withdrawal_rate`` covers ``annual_spend`` (the 'FIRE number')."""
+    withdrawal_rate = np.asarray(withdrawal_rate, dtype=np.float64)
+    if np.any(withdrawal_rate <= 0):
+        raise ValueError("withdrawal_rate must be positive")
+    return np.asarray(annual_spend, dtype=np.float64) / withdrawal_rate
+
+
+def _contribution_factor(years, rate, growth):
+    """
+    Value after ``years`` of contributions starting at 1 and growing at
+    ``growth``, each made at the start of a year and earning ``rate``:
+    sum_{k<n} (1 + g)^k (1 + r)^(n - k). ``years`` may be fractional.
+    """
+    compound = (1.0 + rate) ** years
+    same = np.isclose(rate, growth)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distinct = (1.0 + rate) * (compound - (1.0 + growth) ** years) / (rate - growth)
+    return np.where(same, years * compound, distinct)
+
+
+def wealth_at(
+    years: ArrayLike,
+    current_savings: ArrayLike,
+    annual_contribution: ArrayLike,
+    expected_return: ArrayLike,
+    contribution_growth: ArrayLike = 0.0,
+) -> np.ndarray:
+    """Portfolio after ``years``, with the same conventions as compute.projection."""
+    years = np.asarray(years, dtype=np.float64)
+    return (
+        current_savings * (1.0 + np.asarray(expected_return, dtype=np.float64)) ** years
+        + annual_contribution * _contribution_factor(years, expected_return, contribution_growth)
+    )
+
+
+def years_to_fi(
+    current_savings: ArrayLike,
+    annual_contribution: ArrayLike,
+    annual_spend: ArrayLike,
+    expected_return: ArrayLike,
+    withdrawal_rate: ArrayLike = DEFAULT_WITHDRAWAL_RATE,
+    contribution_growth: ArrayLike = 0.0,
+    inflation: ArrayLike = 0.0,
+    max_years: int = DEFAULT_MAX_YEARS,
+) -> np.ndarray:
+    """
+    Years until the portfolio covers spending at ``withdrawal_rate``.
+
+    All arguments broadcast against each other and the result has their
+    broadcast shape; scenarios that do not get there within ``max_years`` are
+    ``inf``. Contributions grow at ``contribution_growth`` and the spending
+    target at ``inflation``. With neither, the crossing has a closed form:
+    ``(1 + r)^n = (F + a) / (P + a)`` with ``a = C (1 + r) / r``. Otherwise
+    every scenario's first crossing is bracketed on a yearly grid and refined
+    by regula falsi, all scenarios at once.
+    """
+    args = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (
+            current_savings, annual_contribution, annual_spend, expected_return,
+            withdrawal_rate, contribution_growth, inflation,
+        ))
+    )
+    shape = args[0].shape
+    savings, contribution, spend, rate, withdrawal, growth, inflation = (a.ravel() for a in args)
+    if np.any(rate <= -1):
+        raise ValueError("expected_return must be greater than -1")
+    target = required_portfolio(spend, withdrawal)
+
+    result = np.full(savings.shape, np.inf)
+    closed = (growth == 0) & (inflation == 0)
+    if closed.any():
+        result[closed] = _closed_form_years(
+            savings[closed], contribution[closed], target[closed], rate[closed], max_years
+        )
+    solve = ~closed
+    if solve.any():
+        result[solve] = _bracket_and_refine(
+            savings[solve], contribution[solve], target[solve], rate[solve],
+            growth[solve], inflation[solve], max_years,
+        )
+    return result.reshape(shape)
+
+
+def _closed_form_years(savings, contribution, target, rate, max_years):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = contribution * (1.0 + rate) / rate
+        years = np.log((target + a) / (savings + a)) / np.log1p(rate)
+        years = np.where(rate == 0, (target - savings) / contribution, years)
+    years = np.where(savings >= target, 0.0, years)
+    return np.where(np.isfinite(years) & (years >= 0) & (years <= max_years), years, np.inf)
+
+
+def _yearly_powers(base, max_years):
+    """(n, max_years + 1) array of base ** t for t = 0..max_years, by cumulative product."""
+    powers = np.empty((base.shape[0], max_years + 1))
+    powers[:, 0] = 1.0
+    np.cumprod(np.broadcast_to(base[:, None], (base.shape[0], max_years)), axis=1, out=powers[:, 1:])
+    return powers
+
+
+def _bracket_and_refine(savings, contribution, target, rate, growth, inflation, max_years):
+    def col(a):
+        return a[:, None]
+
+    def surplus(years):
+        wealth = wealth_at(years, col(savings), col(contribution), col(rate), col(growth))
+        return wealth - col(target) * (1.0 + col(inflation)) ** years
+
+    # Surplus at every whole year, from cumulative products rather than powers
+    # and updated in place: this grid dominates the cost.
+    compound = _yearly_powers(1.0 + rate, max_years)
+    same = np.isclose(rate, growth)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(same, 0.0, contribution * (1.0 + rate) / (rate - growth))
+    yearly = compound - _yearly_powers(1.0 + growth, max_years)
+    yearly *= col(scale)
+    if same.any():
+        yearly[same] = col(contribution[same]) * np.arange(max_years + 1) * compound[same]
+    compound *= col(savings)
+    yearly += compound
+    target_path = _yearly_powers(1.0 + inflation, max_years)
+    target_path *= col(target)
+    yearly -= target_path
+    reached = yearly >= 0
+    found = reached.any(axis=1)
+    first = reached.argmax(axis=1)
+
+    # The crossing lies in (first - 1, first]: refine it by Illinois regula falsi.
+    rows = np.arange(first.shape[0])
+    hi = first.astype(np.float64)
+    lo = np.maximum(hi - 1, 0.0)
+    f_hi, f_lo = yearly[rows, first], yearly[rows, np.maximum(first - 1, 0)]
+    refine = found & (first > 0)
+    for _ in range(_REFINE_STEPS):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mid = np.where(refine, hi - f_hi * (hi - lo) / (f_hi - f_lo), hi)
+        mid = np.clip(np.nan_to_num(mid, nan=hi), lo, hi)
+        f_mid = surplus(col(mid))[:, 0]
+        above = f_mid >= 0
+        # Halve the stale endpoint's value so the bracket shrinks from both sides
+        f_lo = np.where(above, f_lo / 2, f_mid)
+        f_hi = np.where(above, f_mid, f_hi / 2)
+        lo = np.where(above, lo, mid)
+        hi = np.where(above, mid, hi)
+    return np.where(found, hi, np.inf)
+
+
+def required_contribution(
+    current_savings: ArrayLike,
+    annual_spend: ArrayLike,
+    years: ArrayLike,
+    expected_return: ArrayLike,
+    withdrawal_rate: ArrayLike = DEFAULT_WITHDRAWAL_RATE,
+    contribution_growth: ArrayLike = 0.0,
+    inflation: ArrayLike = 0.0,
+) -> np.ndarray:
+    """
+    First-year contribution that reaches FI in exactly ``years``.
+
+    Wealth is linear in the contribution, so this is closed form for any
+    growth and inflation. Zero when current savings already get there;
+    ``inf`` when ``years`` is 0 and they do not.
+    """
+    years = np.asarray(years, dtype=np.float64)
+    target = required_portfolio(annual_spend, withdrawal_rate) * (1.0 + np.asarray(inflation)) ** years
+    shortfall = target - current_savings * (1.0 + np.asarray(expected_return, dtype=np.float64)) ** years
+    factor = _contribution_factor(years, expected_return, contribution_growth)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        needed = np.where(shortfall > 0, shortfall / factor, 0.0)
+    return np.where((shortfall > 0) & (factor <= 0), np.inf, needed)
+
+
+def evaluate_grid(
+    current_savings: float,
+    annual_income: float,
+    savings_rates: ArrayLike,
+    expected_returns: ArrayLike,
+    annual_spends: ArrayLike,
+    withdrawal_rate: float = DEFAULT_WITHDRAWAL_RATE,
+    income_growth: float = 0.0,
+    inflation: float = 0.0,
+    target_years: Optional[float] = None,
+    max_years: int = DEFAULT_MAX_YEARS,
+) -> Dict[str, np.ndarray]:
+    """
+    Solve every savings rate × return × spend combination in one pass.
+
+    Returns (n_rates, n_returns, n_spends) arrays: ``required_portfolio``,
+    ``years_to_fi`` and, with ``target_years``, the ``required_savings_rate``
+    to be FI by then (independent of the savings-rate axis).
+    """
+    rates = np.asarray(savings_rates, dtype=np.float64)[:, None, None]
+    returns = np.asarray(expected_returns, dtype=np.float64)[None, :, None]
+    spends = np.asarray(annual_spends, dtype=np.float64)[None, None, :]
+    shape = (rates.shape[0], returns.shape[1], spends.shape[2])
+
+    result = {
+        "required_portfolio": np.broadcast_to(required_portfolio(spends, withdrawal_rate), shape),
+        "years_to_fi": years_to_fi(
+            current_savings, annual_income * rates, spends, returns,
+            withdrawal_rate, income_growth, inflation, max_years,
+        ),
+    }
+    if target_years is not None:
+        contribution = required_contribution(
+            current_savings, spends, target_years, returns, withdrawal_rate, income_growth, inflation,
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rate = contribution / annual_income if annual_income > 0 else np.where(contribution > 0, np.inf, 0.0)
+        result["required_savings_rate"] = np.broadcast_to(rate, shape)
+    return result
@@ -0,0 +1,80 @@
+# compute/goals.py
+
+"""Goal feasibility: required contributions, success odds and completion times."""
+
+from typing import Dict
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# Share of simulated paths a required contribution must succeed on
+DEFAULT_CONFIDENCE = 0.8
+
+
+def required_contributions(
+    current_amounts: ArrayLike,
+    target_amounts: ArrayLike,
+    horizons: ArrayLike,
+    growth: np.ndarray,
+    deposits: np.ndarray,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> np.ndarray:
+    """
+    Annual contribution per goal that reaches its target on ``confidence`` of paths.
+
+    ``growth`` and ``deposits`` come from compute.monte_carlo.simulate_growth
+    and are shared by every goal. ``horizons`` are whole years from now. On
+    each path the contribution hitting the target exactly is
+    ``(target / growth[T] - current) / deposits[T]``; the answer is that
+    value's ``confidence`` quantile across paths (the next path up, never
+    interpolated), floored at zero. Goals already short at a zero horizon
+    need ``inf``.
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    current = np.asarray(current_amounts, dtype=np.float64)
+    target = np.asarray(target_amounts, dtype=np.float64)
+    horizons = np.asarray(horizons, dtype=np.int64)
+    g, d = growth[:, horizons], deposits[:, horizons]  # (n_paths, n_goals)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        per_path = (target / g - current) / d
+    per_path = np.where(d > 0, per_path, np.where(current * g >= target, 0.0, np.inf))
+    return np.maximum(np.quantile(per_path, confidence, axis=0, method="higher"), 0.0)
+
+
+def evaluate_goals(
+    current_amounts: ArrayLike,
+    target_amounts: ArrayLike,
+    horizons: ArrayLike,
+    annual_contributions: ArrayLike,
+    growth: np.ndarray,
+    deposits: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Success probability and projected completion for every goal at once.
+
+    Each goal starts from its current amount and receives its own annual
+    contribution; all goals share the simulated ``growth`` and ``deposits``
+    matrices. Returns per goal:
+
+    * ``success_probability`` – share of paths at or above target at the horizon
+    * ``completion_years`` – first year the median path reaches the target,
+      or -1 if not within the simulated years
+    """
+    current = np.asarray(current_amounts, dtype=np.float64)
+    target = np.asarray(target_amounts, dtype=np.float64)
+    horizons = np.asarray(horizons, dtype=np.int64)
+    contributions = np.asarray(annual_contributions, dtype=np.float64)
+
+    at_horizon = growth[:, horizons] * (current + contributions * deposits[:, horizons])
+    success = (at_horizon >= target).mean(axis=0)
+
+    # (n_goals, years + 1) median wealth, one goal at a time so only a single
+    # (n_paths, years + 1) wealth matrix is alive; growth * deposits is shared
+    grown_deposits = growth * deposits
+    median = np.empty((len(current), growth.shape[1]))
+    for i in range(len(current)):
+        median[i] = np.median(growth * current[i] + contributions[i] * grown_deposits, axis=0)
+    reached = median >= target[:, None]
+    completion = np.where(reached.any(axis=1), reached.argmax(axis=1), -1)
+    return {"success_probability": success, "completion_years": completion}
@@ -0,0 +1,135 @@
+# compute/monte_carlo.py
+
+"""Vectorised Monte Carlo simulation of portfolio wealth paths."""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_PATHS = 10_000
+DEFAULT_PERCENTILES = (10, 50, 90)
+
+# (expected annual return, annual volatility) for CFA risk levels 1–5.
+RISK_LEVEL_ASSUMPTIONS = {
+    1: (0.04, 0.04),
+    2: (0.05, 0.07),
+    3: (0.06, 0.10),
+    4: (0.07, 0.14),
+    5: (0.08, 0.18),
+}
+
+
+def assumptions_for_risk_level(risk_level: Optional[int]) -> Tuple[float, float]:
+    """Return (mean, volatility) for a 1–5 risk level, defaulting to moderate."""
+    return RISK_LEVEL_ASSUMPTIONS.get(risk_level or 3, RISK_LEVEL_ASSUMPTIONS[3])
+
+
+def simulate_growth(
+    years: int,
+    mean_return: float,
+    volatility: float,
+    n_paths: int = DEFAULT_PATHS,
+    seed: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate ``n_paths`` yearly return paths as the two factors wealth needs.
+
+    Annual gross returns are lognormal with the given arithmetic mean and
+    volatility. Returns (n_paths, years + 1) arrays ``growth`` – the product
+    of (1 + r) over years 0..t-1 – and ``deposits`` – the sum over k < t of
+    1 / growth[k] – so that wealth with contributions ``c`` made at the start
+    of each year is ``growth * (W0 + c * deposits)``. One simulation serves
+    any number of (W0, c) pairs.
+    """
+    if n_paths < 1:
+        raise ValueError("n_paths must be positive")
+    if years < 0:
+        raise ValueError("years must be non-negative")
+
+    rng = np.random.default_rng(seed)
+    # Lognormal parameters matching the requested arithmetic mean/volatility.
+    sigma2 = np.log1p((volatility / (1 + mean_return)) ** 2)
+    mu = np.log1p(mean_return) - sigma2 / 2
+    log_returns = rng.normal(mu, np.sqrt(sigma2), size=(n_paths, years))
+
+    log_growth = np.zeros((n_paths, years + 1))
+    np.cumsum(log_returns, axis=1, out=log_growth[:, 1:])
+    growth = np.exp(log_growth)
+
+    deposits = np.zeros_like(growth)
+    np.cumsum(1.0 / growth[:, :-1], axis=1, out=deposits[:, 1:])
+    return growth, deposits
+
+
+def simulate_wealth_paths(
+    initial_wealth: float,
+    annual_contribution: float,
+    years: int,
+    mean_return: float,
+    volatility: float,
+    n_paths: int = DEFAULT_PATHS,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Simulate ``n_paths`` yearly wealth paths in one pass.
+
+    Contributions are made at the start of each year, i.e.
+    ``W[t+1] = (W[t] + c) * (1 + r[t])``. The recursion is solved in closed
+    form with cumulative sums (see simulate_growth), so there is no Python
+    loop over years.
+
+    Returns an (n_paths, years + 1) array whose column 0 is ``initial_wealth``.
+    """
+    growth, deposits = simulate_growth(years, mean_return, volatility, n_paths=n_paths, seed=seed)
+    # W[t] = growth[t] * (W0 + c * sum_{k<t} 1 / growth[k])
+    return growth * (initial_wealth + annual_contribution * deposits)
+
+
+def simulate_milestones(
+    initial_wealth: float,
+    annual_contribution: float,
+    milestone_years: Sequence[int],
+    milestone_targets: Sequence[float],
+    mean_return: float,
+    volatility: float,
+    n_paths: int = DEFAULT_PATHS,
+    seed: Optional[int] = None,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> Dict[str, Any]:
+    """
+    Evaluate every milestone against one shared set of simulated paths.
+
+    ``milestone_years`` are years from today (clamped to >= 0) and
+    ``milestone_targets`` the amount needed at that point. Each milestone is
+    tested independently against the same portfolio. Returns:
+
+    * ``success_probability`` – per-milestone share of paths at or above target
+    * ``wealth_percentiles`` – {percentile: per-milestone wealth}
+    * ``funding_percentiles`` – {percentile: per-path mean funded ratio (0–1)}
+    """
+    years = np.maximum(np.asarray(milestone_years, dtype=np.int64), 0)
+    targets = np.asarray(milestone_targets, dtype=np.float64)
+    if years.shape != targets.shape:
+        raise ValueError("milestone_years and milestone_targets must align")
+
+    horizon = int(years.max()) if years.size else 0
+    paths = simulate_wealth_paths(
+        initial_wealth, annual_contribution, horizon,
+        mean_return, volatility, n_paths=n_paths, seed=seed,
+    )
+    at_milestones = paths[:, years]  # (n_paths, n_milestones)
+
+    safe_targets = np.where(targets > 0, targets, 1.0)
+    funded = np.where(targets > 0, np.minimum(at_milestones / safe_targets, 1.0), 1.0)
+    per_path = funded.mean(axis=1) if targets.size else np.ones(n_paths)
+
+    wealth_pct = np.percentile(at_milestones, percentiles, axis=0) if targets.size else None
+    funding_pct = np.percentile(per_path, percentiles)
+    return {
+        "success_probability": (at_milestones >= targets).mean(axis=0).tolist(),
+        "wealth_percentiles": {
+            p: (wealth_pct[i].tolist() if wealth_pct is not None else [])
+            for i, p in enumerate(percentiles)
+        },
+        "funding_percentiles": {p: float(funding_pct[i]) for i, p in enumerate(percentiles)},
+    }
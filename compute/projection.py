@@ -0,0 +1,134 @@
+# compute/projection.py
+
+"""Vectorised year-by-year cash-flow and net-worth projection."""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+DEFAULT_YEARS = 40
+DEFAULT_INCOME_GROWTH = 0.04
+DEFAULT_INFLATION = 0.05
+DEFAULT_RETURN = 0.06
+
+# Payments per year for IncomeSource.frequency values, after normalize_frequency.
+FREQUENCY_PER_YEAR = {
+    "daily": 365,
+    "weekly": 52,
+    "biweekly": 26,
+    "fortnightly": 26,
+    "semimonthly": 24,
+    "monthly": 12,
+    "bimonthly": 6,
+    "quarterly": 4,
+    "semiannual": 2,
+    "semiannually": 2,
+    "annual": 1,
+    "annually": 1,
+    "yearly": 1,
+    "once": 1,
+    "onetime": 1,
+}
+# Frequency assumed when an income source has none
+DEFAULT_FREQUENCY = "monthly"
+
+
+def normalize_frequency(frequency: Optional[str]) -> str:
+    """'Bi-Weekly', 'bi_weekly' and ' biweekly ' all normalise to 'biweekly'."""
+    if not frequency:
+        return DEFAULT_FREQUENCY
+    return "".join(ch for ch in frequency.lower() if ch.isalnum())
+
+
+def annualize(amounts: Iterable[float], frequencies: Iterable[Optional[str]]) -> float:
+    """Total yearly amount of payments made at the given frequencies."""
+    total = 0.0
+    for amount, frequency in zip(amounts, frequencies):
+        key = normalize_frequency(frequency)
+        if key not in FREQUENCY_PER_YEAR:
+            raise ValueError(f"Unknown income frequency: {frequency!r}")
+        total += (amount or 0.0) * FREQUENCY_PER_YEAR[key]
+    return total
+
+
+def _column(values: ArrayLike, n_users: int) -> np.ndarray:
+    """Broadcast a scalar or per-user value to an (n_users, 1) column."""
+    return np.broadcast_to(np.asarray(values, dtype=np.float64), (n_users,)).reshape(n_users, 1)
+
+
+def project_batch(
+    annual_income: ArrayLike,
+    annual_expenses: ArrayLike,
+    assets: ArrayLike,
+    liabilities: ArrayLike = 0.0,
+    years: int = DEFAULT_YEARS,
+    income_growth: ArrayLike = DEFAULT_INCOME_GROWTH,
+    inflation: ArrayLike = DEFAULT_INFLATION,
+    expected_return: ArrayLike = DEFAULT_RETURN,
+) -> Dict[str, np.ndarray]:
+    """
+    Project income, expenses, savings and net worth for many users at once.
+
+    ``annual_income``, ``annual_expenses`` and ``assets`` are per-user arrays
+    (or scalars for a single user); the assumptions may be scalars or per-user
+    arrays. Income grows at ``income_growth`` and expenses at ``inflation``.
+    Each year's savings (income minus expenses, negative when drawing down) go
+    in at the start of the year and, with existing assets, earn
+    ``expected_return``: ``A[t+1] = (A[t] + s[t]) * (1 + r)``. Liabilities are
+    held flat. The recursion is solved with cumulative sums, so there is no
+    Python loop over users or years.
+
+    Returns ``income``, ``expenses`` and ``savings`` as (n_users, years)
+    arrays for years 0..years-1, and ``assets`` and ``net_worth`` as
+    (n_users, years + 1) arrays whose column 0 is today.
+    """
+    if years < 0:
+        raise ValueError("years must be non-negative")
+    income0 = np.atleast_1d(np.asarray(annual_income, dtype=np.float64))
+    n_users = income0.shape[0]
+    income0 = income0.reshape(n_users, 1)
+    expenses0 = _column(annual_expenses, n_users)
+    assets0 = _column(assets, n_users)
+    debt = _column(liabilities, n_users)
+    growth = _column(income_growth, n_users)
+    inflation = _column(inflation, n_users)
+    rate = _column(expected_return, n_users)
+    if np.any(rate <= -1):
+        raise ValueError("expected_return must be greater than -1")
+
+    t = np.arange(years + 1, dtype=np.float64)
+    compound = (1.0 + rate) ** t  # (n_users, years + 1)
+    income = income0 * (1.0 + growth) ** t[:-1]
+    expenses = expenses0 * (1.0 + inflation) ** t[:-1]
+    savings = income - expenses
+
+    # A[t] = (1 + r)^t * (A0 + sum_{k<t} s[k] / (1 + r)^k)
+    discounted = np.zeros((n_users, years + 1))
+    np.cumsum(savings / compound[:, :-1], axis=1, out=discounted[:, 1:])
+    projected_assets = compound * (assets0 + discounted)
+    return {
+        "income": income,
+        "expenses": expenses,
+        "savings": savings,
+        "assets": projected_assets,
+        "net_worth": projected_assets - debt,
+    }
+
+
+def project_net_worth(
+    annual_income: float,
+    annual_expenses: float,
+    assets: float,
+    liabilities: float = 0.0,
+    years: int = DEFAULT_YEARS,
+    income_growth: float = DEFAULT_INCOME_GROWTH,
+    inflation: float = DEFAULT_INFLATION,
+    expected_return: float = DEFAULT_RETURN,
+) -> np.ndarray:
+    """One user's net worth for years 0..years, as a (years + 1,) array."""
+    return project_batch(
+        annual_income, annual_expenses, assets, liabilities, years,
+        income_growth, inflation, expected_return,
+    )["net_worth"][0]
+
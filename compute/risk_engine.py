@@ -2,6 +2,13 @@
 
 from typing import List
 
+import numpy as np
+from numpy.typing import ArrayLike
+
+# Lower bounds of risk levels 2–5, mirroring compute_risk_level.
+_LEVEL_THRESHOLDS = (20, 40, 60, 80)
+
+
 def compute_risk_score(
     age: int,
     income: float,
@@ -60,3 +67,55 @@ def compute_risk_level(percent_score: float) -> int:
     if percent_score < 80:
         return 4
     return 5
+
+
+def compute_risk_scores(
+    ages: ArrayLike,
+    incomes: ArrayLike,
+    dependents: ArrayLike,
+    time_horizons: ArrayLike,
+    questionnaires: ArrayLike,
+) -> np.ndarray:
+    """
+    Vectorised ``compute_risk_score`` over column arrays of N profiles.
+
+    ``questionnaires`` is an (N, Q) matrix of 1–5 answers. Every other
+    argument is a length-N array (or a scalar broadcast to N). Uses the same
+    weights and the same order of floating-point operations as the scalar
+    path, so element ``i`` is identical to ``compute_risk_score`` on row ``i``.
+    Returns an int64 array of 0–100 scores.
+    """
+    q = np.asarray(questionnaires, dtype=np.float64)
+    if q.ndim != 2:
+        raise ValueError("questionnaires must be a 2-D (profiles x answers) matrix")
+
+    # 1. Questionnaire (normalize 1–5 → 0–1)
+    q_avg = q.sum(axis=1) / q.shape[1]
+    q_score = (q_avg - 1) / 4
+
+    # 2–4. Age, income and horizon factors
+    age_score = np.clip((60 - np.asarray(ages, dtype=np.float64)) / 60, 0, 1)
+    income_score = np.clip(np.asarray(incomes, dtype=np.float64) / 200_000, 0, 1)
+    horizon_score = np.clip(np.asarray(time_horizons, dtype=np.float64) / 30, 0, 1)
+
+    # 5. Dependents adjustment
+    dep_adjust = np.maximum(-0.10, -0.01 * np.asarray(dependents, dtype=np.float64))
+
+    # 6. Weighted sum
+    total = (
+        q_score       * 0.50 +
+        age_score     * 0.20 +
+        income_score  * 0.20 +
+        horizon_score * 0.10 +
+        dep_adjust
+    )
+
+    # scale 0–100 and clamp; np.rint rounds half-to-even like round()
+    pct = np.clip(total * 100, 0, 100)
+    return np.rint(pct).astype(np.int64)
+
+
+def compute_risk_levels(percent_scores: ArrayLike) -> np.ndarray:
+    """Vectorised ``compute_risk_level``: map 0–100% scores to levels 1–5."""
+    scores = np.asarray(percent_scores, dtype=np.float64)
+    return np.digitize(scores, _LEVEL_THRESHOLDS).astype(np.int64) + 1
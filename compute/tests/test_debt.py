@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from ..debt import compare_strategies, payoff_order, simulate_payoff
+
+
+def test_single_loan_matches_annuity_payment():
+    payment = 10_000 * 0.01 / (1 - 1.01 ** -12)
+    result = simulate_payoff([10_000], [0.12], [payment], payment, [[0]], months=24)
+    assert result["payoff_month"].tolist() == [[12]]
+    assert np.isclose(result["total_interest"][0], payment * 12 - 10_000)
+    assert result["remaining"][0, 12:].max() == 0
+
+
+def test_strategy_orders():
+    balances, rates = [500, 5_000, 2_000], [0.20, 0.10, 0.25]
+    assert payoff_order("avalanche", balances, rates).tolist() == [2, 0, 1]
+    assert payoff_order("snowball", balances, rates).tolist() == [0, 2, 1]
+    assert payoff_order("custom", balances, rates, [1, 0, 2]).tolist() == [1, 0, 2]
+    with pytest.raises(ValueError):
+        payoff_order("custom", balances, rates, [0, 0, 1])
+
+
+def test_avalanche_pays_least_interest_and_snowball_clears_smallest_first():
+    plans = compare_strategies([500, 5_000, 2_000], [0.20, 0.10, 0.25], [25, 100, 50], 500,
+                               strategies=("avalanche", "snowball", "custom"), custom_order=[1, 0, 2])
+    interest = {name: plan["total_interest"] for name, plan in plans.items()}
+    assert interest["avalanche"] == min(interest.values())
+    assert plans["snowball"]["payoff_month"].argmin() == 0
+    for plan in plans.values():
+        assert np.isclose(plan["total_paid"], 7_500 + plan["total_interest"])
+        assert plan["months_to_debt_free"] == plan["payoff_month"].max()
+
+
+def test_budget_must_cover_minimums_and_unpaid_debts_are_flagged():
+    with pytest.raises(ValueError):
+        simulate_payoff([1_000, 1_000], [0.1, 0.1], [50, 60], 100, [[0, 1]])
+    # A minimum below the interest never clears the debt
+    result = simulate_payoff([10_000], [0.24], [100], 100, [[0]], months=120)
+    assert result["payoff_month"].tolist() == [[-1]] and result["months_to_debt_free"].tolist() == [-1]
+    assert result["remaining"][0, -1] > 10_000
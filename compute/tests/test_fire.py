@@ -0,0 +1,44 @@
+import numpy as np
+
+from ..fire import evaluate_grid, required_contribution, wealth_at, years_to_fi
+from ..projection import project_batch
+
+
+def test_closed_form_and_root_finder_agree():
+    closed = years_to_fi(10_000, 20_000, 40_000, 0.05)
+    solved = years_to_fi(10_000, 20_000, 40_000, 0.05, inflation=1e-12)
+    assert np.isclose(closed, solved, atol=1e-4)
+    assert np.isclose(wealth_at(closed, 10_000, 20_000, 0.05), 40_000 / 0.04)
+
+
+def test_growth_and_inflation_crossing_is_exact():
+    years = years_to_fi(10_000, 20_000, 40_000, 0.05, contribution_growth=0.03, inflation=0.02)
+    target = 1_000_000 * 1.02 ** years
+    assert np.isclose(wealth_at(years, 10_000, 20_000, 0.05, 0.03), target, rtol=1e-6)
+    # Whole years agree with the projection engine's recursion
+    assets = project_batch(20_000, 0, 10_000, years=30, income_growth=0.03, inflation=0, expected_return=0.05)["assets"][0]
+    assert np.allclose(wealth_at(np.arange(31), 10_000, 20_000, 0.05, 0.03), assets)
+
+
+def test_unreachable_and_already_independent():
+    assert years_to_fi(2_000_000, 0, 40_000, 0.05) == 0
+    assert np.isinf(years_to_fi(0, 0, 40_000, 0.05))
+    assert np.isinf(years_to_fi(0, 1_000, 40_000, 0.0, inflation=0.05))
+
+
+def test_required_contribution_inverts_years_to_fi():
+    years = years_to_fi(50_000, 12_000, 30_000, 0.06, contribution_growth=0.04, inflation=0.03)
+    contribution = required_contribution(50_000, 30_000, years, 0.06, contribution_growth=0.04, inflation=0.03)
+    assert np.isclose(contribution, 12_000, rtol=1e-5)
+
+
+def test_grid_matches_scalar_solves():
+    rates, returns, spends = [0.1, 0.3, 0.5], [0.03, 0.07], [20_000, 50_000]
+    grid = evaluate_grid(10_000, 100_000, rates, returns, spends, income_growth=0.02, target_years=25)
+    assert grid["years_to_fi"].shape == (3, 2, 2)
+    assert grid["required_savings_rate"].shape == (3, 2, 2)
+    for i, s in enumerate(rates):
+        for j, r in enumerate(returns):
+            for k, e in enumerate(spends):
+                assert np.isclose(grid["years_to_fi"][i, j, k], years_to_fi(10_000, 100_000 * s, e, r, contribution_growth=0.02))
+    assert np.allclose(grid["required_portfolio"][0, 0], [500_000, 1_250_000])
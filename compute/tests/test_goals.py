@@ -0,0 +1,44 @@
+import numpy as np
+
+from ..goals import evaluate_goals, required_contributions
+from ..monte_carlo import simulate_growth
+
+
+def test_deterministic_returns_match_annuity_math():
+    growth, deposits = simulate_growth(10, 0.05, 0.0, n_paths=4, seed=0)
+    # (1000 + c * sum_{k<5} 1.05^-k) * 1.05^5 = 20000
+    factor = sum(1.05 ** -k for k in range(5))
+    expected = (20_000 / 1.05 ** 5 - 1_000) / factor
+    required = required_contributions([1_000, 50_000], [20_000, 20_000], [5, 5], growth, deposits)
+    assert np.allclose(required, [expected, 0.0])
+
+    result = evaluate_goals([1_000], [20_000], [5], [expected * 1.0001], growth, deposits)
+    assert result["success_probability"].tolist() == [1.0]
+    assert result["completion_years"].tolist() == [5]
+
+
+def test_required_contribution_hits_the_confidence_level():
+    growth, deposits = simulate_growth(20, 0.07, 0.15, n_paths=20_000, seed=1)
+    targets, horizons = [100_000, 250_000, 50_000], [10, 20, 3]
+    required = required_contributions([5_000, 0, 40_000], targets, horizons, growth, deposits, confidence=0.8)
+    odds = evaluate_goals([5_000, 0, 40_000], targets, horizons, required, growth, deposits)["success_probability"]
+    assert np.allclose(odds, 0.8, atol=0.005)
+
+
+def test_unreachable_goals():
+    growth, deposits = simulate_growth(5, 0.05, 0.1, n_paths=100, seed=2)
+    required = required_contributions([0], [1_000], [0], growth, deposits)
+    assert np.isinf(required[0])
+    result = evaluate_goals([0], [1e12], [5], [1_000], growth, deposits)
+    assert result["success_probability"].tolist() == [0.0]
+    assert result["completion_years"].tolist() == [-1]
+
+
+def test_completion_matches_the_full_median():
+    growth, deposits = simulate_growth(15, 0.06, 0.2, n_paths=501, seed=3)
+    current, targets, contributions = np.array([0.0, 1e4, 5e4]), np.array([5e4, 1e5, 2e5]), np.array([5e3, 4e3, 1e3])
+    wealth = growth[None] * current[:, None, None] + contributions[:, None, None] * (growth * deposits)[None]
+    reached = np.median(wealth, axis=1) >= targets[:, None]
+    expected = np.where(reached.any(axis=1), reached.argmax(axis=1), -1)
+    result = evaluate_goals(current, targets, [15] * 3, contributions, growth, deposits)
+    assert result["completion_years"].tolist() == expected.tolist()
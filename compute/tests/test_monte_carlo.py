@@ -0,0 +1,58 @@
+import numpy as np
+
+from ..monte_carlo import (
+    assumptions_for_risk_level,
+    simulate_milestones,
+    simulate_wealth_paths,
+)
+
+
+def test_zero_volatility_matches_annuity_recursion():
+    paths = simulate_wealth_paths(1_000, 100, years=5, mean_return=0.05,
+                                  volatility=0.0, n_paths=3, seed=1)
+    expected = [1_000.0]
+    for _ in range(5):
+        expected.append((expected[-1] + 100) * 1.05)
+    assert paths.shape == (3, 6)
+    assert np.allclose(paths, expected)
+
+
+def test_seed_is_reproducible():
+    a = simulate_wealth_paths(0, 1_000, 40, 0.07, 0.15, n_paths=500, seed=7)
+    b = simulate_wealth_paths(0, 1_000, 40, 0.07, 0.15, n_paths=500, seed=7)
+    c = simulate_wealth_paths(0, 1_000, 40, 0.07, 0.15, n_paths=500, seed=8)
+    assert np.array_equal(a, b)
+    assert not np.array_equal(a, c)
+
+
+def test_sample_moments_match_assumptions():
+    paths = simulate_wealth_paths(1.0, 0.0, 1, 0.06, 0.10, n_paths=200_000, seed=3)
+    returns = paths[:, 1] - 1
+    assert abs(returns.mean() - 0.06) < 0.002
+    assert abs(returns.std() - 0.10) < 0.002
+
+
+def test_simulate_milestones_orders_percentiles_and_probabilities():
+    result = simulate_milestones(
+        initial_wealth=10_000,
+        annual_contribution=5_000,
+        milestone_years=[2, 10, 30],
+        milestone_targets=[1_000, 80_000, 10_000_000],
+        mean_return=0.06,
+        volatility=0.12,
+        n_paths=2_000,
+        seed=11,
+    )
+    probs = result["success_probability"]
+    assert probs[0] == 1.0
+    assert probs[2] == 0.0
+    assert 0.0 < probs[1] < 1.0
+    low, mid, high = (result["wealth_percentiles"][p] for p in (10, 50, 90))
+    assert all(a <= b <= c for a, b, c in zip(low, mid, high))
+    funding = result["funding_percentiles"]
+    assert 0 <= funding[10] <= funding[50] <= funding[90] <= 1
+
+
+def test_assumptions_default_to_moderate():
+    assert assumptions_for_risk_level(None) == assumptions_for_risk_level(3)
+    assert assumptions_for_risk_level(5)[1] > assumptions_for_risk_level(1)[1]
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from ..projection import annualize, project_batch, project_net_worth
+
+
+def test_matches_year_by_year_recursion():
+    net_worth = project_net_worth(60_000, 40_000, assets=5_000, liabilities=2_000, years=10,
+                                  income_growth=0.03, inflation=0.05, expected_return=0.06)
+    assets, expected = 5_000.0, [3_000.0]
+    for t in range(10):
+        savings = 60_000 * 1.03 ** t - 40_000 * 1.05 ** t
+        assets = (assets + savings) * 1.06
+        expected.append(assets - 2_000)
+    assert net_worth.shape == (11,)
+    assert np.allclose(net_worth, expected)
+
+
+def test_batch_rows_match_single_user_projection():
+    incomes = np.array([30_000.0, 80_000.0, 0.0])
+    returns = np.array([0.04, 0.07, 0.05])
+    batch = project_batch(incomes, 20_000, [0, 10_000, 50_000], [0, 0, 1_000], years=40,
+                          expected_return=returns)
+    assert batch["net_worth"].shape == (3, 41)
+    assert batch["savings"].shape == (3, 40)
+    for i in range(3):
+        single = project_net_worth(incomes[i], 20_000, [0, 10_000, 50_000][i], [0, 0, 1_000][i],
+                                   years=40, expected_return=returns[i])
+        assert np.allclose(batch["net_worth"][i], single)
+    assert batch["net_worth"][2, -1] < 0  # no income: savings drawn down
+
+
+def test_annualize_normalises_frequencies():
+    assert annualize([1_000, 500, 100], ["Monthly", "bi-weekly", None]) == 12_000 + 13_000 + 1_200
+    with pytest.raises(ValueError):
+        annualize([1], ["sometimes"])
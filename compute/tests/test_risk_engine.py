@@ -44,3 +44,40 @@ def test_score_level_consistency():
     assert 1 <= level <= 5
     # Ensure the level corresponds to the computed score
     assert level == compute_risk_level(score)
+
+
+def test_batch_matches_scalar_path():
+    import numpy as np
+    from ..risk_engine import (
+        compute_risk_level,
+        compute_risk_levels,
+        compute_risk_scores,
+    )
+
+    rng = np.random.default_rng(42)
+    n = 2_000
+    ages = rng.integers(18, 90, n)
+    incomes = rng.uniform(0, 400_000, n).round(2)
+    dependents = rng.integers(0, 15, n)
+    horizons = rng.integers(0, 45, n)
+    answers = rng.integers(1, 6, (n, 8))
+
+    scores = compute_risk_scores(ages, incomes, dependents, horizons, answers)
+    levels = compute_risk_levels(scores)
+
+    for i in range(n):
+        expected = compute_risk_score(
+            age=int(ages[i]),
+            income=float(incomes[i]),
+            dependents=int(dependents[i]),
+            time_horizon=int(horizons[i]),
+            questionnaire=answers[i].tolist(),
+        )
+        assert scores[i] == expected
+        assert levels[i] == compute_risk_level(expected)
+
+
+def test_batch_levels_boundaries():
+    from ..risk_engine import compute_risk_levels
+    levels = compute_risk_levels([0, 19.9, 20, 39, 40, 59, 60, 79, 80, 100])
+    assert levels.tolist() == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]